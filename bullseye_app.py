@@ -13,7 +13,8 @@ from sonar_apply import apply_segments_to_sonar_pairs  # optional: alias nicht n
 from clone_publish import (
     clone_and_publish_segments as run_clone_and_publish_segments,
     mass_clone_fixed as run_mass_clone_fixed,            # falls extern gebraucht
-    clone_across_marketplaces as backend_clone_across_mps,  # wird unten lokal importiert, optional
+    clone_across_marketplaces as backend_clone_across_mps,
+    MP_CODE_BY_ID,
 )
 from create_os_sonar import run_create_os_sonar
 from update_campaign_content import run_update_campaign_content as run_update_content
@@ -22,13 +23,39 @@ from preview_campaigns import (
     run_preview_batch_for_marketplace as preview_run_batch,
 )
 from approve_sonar import run_approve_sonar
-from create_rc_sonar import create_remote_configs
+from create_rc_sonar import create_remote_configs, CAMPAIGN_KEYS
+from utils import get_firefox_profile
 
 import time
-from datetime import timedelta
+import itertools
+import csv
+import functools
+import queue
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import threading
+from datetime import datetime, date, timedelta
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import pandas as pd
 import sqlite3
+
+# Optional: python-calamine (Rust) liest .xlsx/.xls deutlich schneller als openpyxl
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+# Optional: orjson (C) parst Sonar-JSON schneller als das json-Modul; nimmt bytes direkt
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
 import shutil
 import tempfile
 
@@ -40,6 +67,81 @@ from selenium.webdriver.firefox.options import Options as FxOptions
 
 
 MASS_CLONE_FIXED_BASE_BE = "1749101702"
+
+# 10-stellige BE-IDs irgendwo im Text
+_BE_ID_RE = re.compile(r'\b\d{10}\b')
+
+# alles außer Ziffern (BE-ID-Eingaben säubern)
+_NON_DIGIT_RE = re.compile(r'\D+')
+
+# Create RC Sonar: Pflichtspalten (Anzeigename, akzeptierte Spaltennamen lowercased)
+RC_REQUIRED_COLUMNS = (
+    ("Name", ("name", "program name", "programname")),
+    ("Marketplace", ("marketplace", "marketplaceid")),
+    ("BE ID", ("be id", "beid")),
+    ("Schedule Start Date", ("schedule start date", "schedulestartdate")),
+    ("Schedule End Date", ("schedule end date", "scheduleenddate")),
+)
+# Alle Spalten, die das Backend liest (Pflicht + Description + campaignVariables), lowercased
+RC_NEEDED_COLUMNS = frozenset(
+    [c for _label, cands in RC_REQUIRED_COLUMNS for c in cands]
+    + ["description"]
+    + [k.lower() for k in CAMPAIGN_KEYS]
+    + [k.replace("_", " ").lower() for k in CAMPAIGN_KEYS]
+)
+
+# Poll-Intervall (ms) für die UI-Queue der Worker-Threads
+UI_QUEUE_POLL_MS = 30
+# Parallele updateContent-Requests (jeder Job hat seine eigene Session)
+UPDATE_CONTENT_WORKERS = 4
+# Update Content: Detection-Debounce beim Tippen (ms)
+DETECT_DEBOUNCE_MS = 150
+# Wie viele geparste Update-Excel-Dateien im Speicher bleiben (LRU)
+XLSX_CACHE_SIZE = 4
+
+# Create OS: ab dieser Dateigröße vor dem Einlesen nachfragen
+XLSX_LARGE_FILE_BYTES = 25 * 1024 * 1024
+
+# Template-Import: Campaign-/Program-JSON aus Sonar so lange wiederverwenden (Sekunden)
+SONAR_JSON_CACHE_TTL_S = 300
+
+# Template-Import: Sonar-Channel ('mobile-push', 'Mobile Push', …) → Template-Wert; Rest → ""
+_CHANNEL_TRANS = str.maketrans({"-": "_", " ": "_"})
+_CHANNEL_CANONICAL = {"MOBILEPUSH": "MOBILE_PUSH", "MOBILE_PUSH": "MOBILE_PUSH", "EMAIL": "EMAIL"}
+
+# Sonar MP → Länderkürzel (Anzeige in Dialogen)
+MP_COUNTRY = {3: "UK", 4: "DE", 5: "FR", 35691: "IT", 44551: "ES"}
+
+# Sonar MP → Sprache (Update Content: supportedLanguages)
+MP_TO_LANG = {
+    3: "en_GB",      # UK
+    4: "de_DE",      # DE
+    5: "fr_FR",      # FR
+    35691: "it_IT",  # IT
+    44551: "es_ES",  # ES
+}
+
+# Create OS: Fortschritt beim Einlesen der Kampagnen-Excel alle N Zeilen melden
+CAMPAIGN_ROWS_PROGRESS_EVERY = 200
+
+# Datums-Erkennung für Excel-startDate: Format per Regex bestimmen statt strptime-Versuchskette
+# (optionaler Zeitteil ' 00:00:00' / 'T00:00:00' wird ignoriert)
+# Ein Match klassifiziert die Form: ISO (1–3), DD.MM.YYYY (4–6), a/b/YYYY (7–9)
+_DATE_SHAPE_RE = re.compile(
+    r"^(?:(\d{4})-(\d{1,2})-(\d{1,2})"
+    r"|(\d{1,2})\.(\d{1,2})\.(\d{4})"
+    r"|(\d{1,2})/(\d{1,2})/(\d{4}))"
+    r"(?:[ T].*)?$"
+)
+# Excel-Seriennummern zählen ab 1899-12-30
+_EXCEL_EPOCH = date(1899, 12, 30)
+
+# pandas-Engine für read_excel: calamine nur, wenn installiert und pandas >= 2.2 sie kennt
+PD_EXCEL_ENGINE = (
+    "calamine"
+    if CalamineWorkbook is not None and tuple(int(x) for x in pd.__version__.split(".")[:2]) >= (2, 2)
+    else None
+)
 """
 # --- Sonar MP → Language mapping for supportedLanguages ---
 SONAR_MP_TO_LANGUAGE = {
@@ -123,7 +225,6 @@ def run_startup_preflight(root) -> bool:
 
     # 2) Probe Firefox profile availability
     try:
-        from utils import get_firefox_profile
         profile_path = get_firefox_profile()
     except Exception:
         profile_path = None
@@ -158,6 +259,130 @@ def resource_path(rel_path: str) -> str:
 # ---- Sonar Web (GUI) — Cookies & Session ----
 SONAR_WEB_DOMAIN = "sonar-eu.amazon.com"
 
+
+def _validate_sonar_line(v: str) -> bool:
+    """Kampagnen-Eingabe gültig? Reine ID (Ziffern) oder https-URL auf SONAR_WEB_DOMAIN."""
+    if v.isdigit():
+        return True
+    if "://" not in v:
+        return False
+    u = urlparse(v)
+    return u.scheme == "https" and u.netloc == SONAR_WEB_DOMAIN
+
+# Header-Normalisierung (Update-Content-Excel): alles außer a-z0-9 entfernen
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
+_SONAR_MP_RE = re.compile(r"#/(\d+)/(?:campaigns|programs)/\d+")
+# Sonar-Link → (mp, id); Fallback: letzte längere Zahl im String als ID
+_SONAR_LINK_IDS_RE = re.compile(r"#/(\d+)/(?:campaigns|programs)/(\d+)", re.IGNORECASE)
+_TAIL_ID_RE = re.compile(r"(\d{6,})\D*$")
+
+@functools.lru_cache(maxsize=4096)
+def _mp_from_sonar_line(s: str) -> int | None:
+    """MP aus einer Sonar-URL (#/<mp>/campaigns|programs/<id>); reine IDs -> None."""
+    m = _SONAR_MP_RE.search(s)
+    return int(m.group(1)) if m else None
+
+def _digits_only(s: str) -> str:
+    """Nur die Ziffern aus s; bereits saubere Eingaben (häufigster Fall) ohne Regex-Lauf."""
+    return s if s.isdigit() else _NON_DIGIT_RE.sub('', s)
+
+@functools.lru_cache(maxsize=1024)
+def _date_from_str(v: str) -> str:
+    """'YYYY-MM-DD', 'DD.MM.YYYY', 'DD/MM/YYYY' bzw. 'MM/DD/YYYY' (falls Tag > 12) → 'YYYY-MM-DD'."""
+    s = v.strip()
+    if not s:
+        raise ValueError("empty date")
+    # Häufigster Fall (pandas/Export): bereits 'YYYY-MM-DD' → C-Parser, keine Regex
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        try:
+            return date.fromisoformat(s).isoformat()
+        except ValueError:
+            pass
+    m = _DATE_SHAPE_RE.match(s)
+    if m is None:
+        raise ValueError(f"bad date: {v!r}")
+    g = m.groups()
+    if g[0] is not None:
+        y, mo, d = g[0:3]
+    elif g[3] is not None:
+        d, mo, y = g[3:6]
+    else:
+        a, b, y = g[6:9]
+        # eu (d/m) bevorzugt, us (m/d) nur wenn die zweite Zahl kein Monat sein kann
+        d, mo = (b, a) if int(b) > 12 else (a, b)
+    return date(int(y), int(mo), int(d)).isoformat()
+
+def _date_from_excel_serial(v) -> str:
+    if v <= 0:
+        raise ValueError(f"bad date: {v!r}")
+    return (_EXCEL_EPOCH + timedelta(days=int(v))).isoformat()
+
+# Typ → Konverter für _coerce_date_yyyy_mm_dd (exakter type(), Subklassen via isinstance-Fallback)
+_DATE_COERCERS = {
+    datetime: lambda v: v.strftime("%Y-%m-%d"),
+    date: lambda v: v.strftime("%Y-%m-%d"),
+    str: _date_from_str,
+    int: _date_from_excel_serial,
+    float: _date_from_excel_serial,
+}
+
+def _cell_str(v) -> str:
+    """Excel-Zellwert → str: None/NaN → "", ganzzahlige Floats ohne '.0' (IDs, MP), sonst str(v)."""
+    if v is None:
+        return ""
+    if isinstance(v, float):
+        if v != v:  # NaN
+            return ""
+        if v.is_integer():
+            return str(int(v))
+    return str(v)
+
+def _tokenize_lines(text: str) -> list[str]:
+    """Text → gestrippte, nicht-leere Zeilen (eine Zeile pro Eintrag)."""
+    return [s for l in text.splitlines() if (s := l.strip())]
+
+def _calamine_row(row):
+    """calamine liefert Zahlen immer als float – ganzzahlige wie openpyxl als int (IDs/MP ohne '.0')."""
+    return [int(v) if isinstance(v, float) and v.is_integer() else v for v in row]
+
+def _iter_xlsx_rows(path: str):
+    """
+    Zeilen (Tupel/Listen) des ersten Sheets, Header-Zeile inklusive.
+    python-calamine wenn vorhanden, sonst openpyxl read_only/values_only (streamend);
+    beide Wege liefern dieselben Typen (ganzzahlige Zellen als int, siehe _calamine_row).
+    Leerzeilen am Ende werden nicht geliefert. Leerzeilen werden nur gezählt und erst
+    ausgegeben, wenn danach noch Daten kommen – Phantom-Zeilen einer falsch gemeldeten
+    Sheet-Dimension kosten so nur den Scan, Daten hinter langen Lücken gehen nicht verloren.
+    """
+    wb = None
+    if CalamineWorkbook is not None:
+        sheet = CalamineWorkbook.from_path(path).get_sheet_by_index(0)
+        source = map(_calamine_row, sheet.to_python())
+    else:
+        from openpyxl import load_workbook
+        wb = load_workbook(filename=path, read_only=True, data_only=True)
+        # erstes Sheet wie bei calamine – nicht das beim Speichern aktive
+        ws = wb.worksheets[0]
+        # Dimension aus der Datei ignorieren – nur tatsächlich vorhandene Zeilen lesen
+        if hasattr(ws, "reset_dimensions"):
+            ws.reset_dimensions()
+        source = ws.values
+    try:
+        empty_run = 0
+        for row in source:
+            if all(v is None or v == "" for v in row):
+                empty_run += 1
+                continue
+            # Leerzeilen mitten in den Daten bleiben erhalten (als leere Zeile)
+            for _ in range(empty_run):
+                yield ()
+            empty_run = 0
+            yield row
+    finally:
+        if wb is not None:
+            wb.close()
+
 def _copy_sqlite_readonly(src_path: str):
     if not os.path.exists(src_path):
         raise FileNotFoundError(f"cookies.sqlite not found at: {src_path}")
@@ -166,30 +391,77 @@ def _copy_sqlite_readonly(src_path: str):
     shutil.copy2(src_path, dst)
     return dst, tmpdir
 
-def _load_firefox_cookies_for_domain(profile_path: str, domain_suffix: str):
-    cookies_db = os.path.join(profile_path, "cookies.sqlite")
-    cleanup_dir = None
-    try:
-        conn = sqlite3.connect(f"file:{cookies_db}?mode=ro", uri=True)
-    except sqlite3.OperationalError:
-        copied_path, cleanup_dir = _copy_sqlite_readonly(cookies_db)
-        conn = sqlite3.connect(copied_path)
-
+def _read_cookie_jar(db: str, domain_suffix: str, uri: bool = True):
+    """Cookies für Host = domain_suffix oder Subdomain davon → RequestsCookieJar."""
+    conn = sqlite3.connect(db, uri=uri)
     jar = requests.cookies.RequestsCookieJar()
     try:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT name, value, host, path, isSecure FROM moz_cookies WHERE host LIKE ?",
-            (f"%{domain_suffix}",)
-        )
-        for name, value, host, path, isSecure in cur.fetchall():
-            jar.set(name, value, domain=host, path=path, secure=bool(isSecure))
+        conn.row_factory = None  # reine Tupel
+        # reine Lese-Verbindung, Sortier-/Temp-Daten im RAM statt Scratch-Datei
+        conn.execute("PRAGMA query_only=1")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        create_cookie, set_cookie = requests.cookies.create_cookie, jar.set_cookie
+        # exakter Host oder Subdomain ('.sonar-eu…') – kein Treffer mehr auf fremde Hosts,
+        # die nur auf domain_suffix enden. moz_cookies hat keinen Index mit host vorn,
+        # gelesen wird also weiterhin per Table-Scan (die Cookie-DB ist klein).
+        # Zeilen direkt aus dem Statement in die Jar streamen (kein fetchall-Zwischenlist)
+        for name, value, host, path, isSecure in conn.execute(
+            "SELECT name, value, host, path, isSecure FROM moz_cookies WHERE host = ? OR host LIKE ?",
+            (domain_suffix, f"%.{domain_suffix}")
+        ):
+            set_cookie(create_cookie(name, value, domain=host, path=path, secure=bool(isSecure)))
     finally:
         conn.close()
-        if cleanup_dir and os.path.isdir(cleanup_dir):
-            shutil.rmtree(cleanup_dir, ignore_errors=True)
     return jar
 
+# Geladene Cookie-Jars: (cookies_db, domain) -> (Datei-Stempel, jar); Zugriff aus UI- und Worker-Threads
+_cookie_jar_cache = {}
+_cookie_jar_lock = threading.Lock()
+
+def _cookie_db_stamp(cookies_db: str):
+    """mtime_ns von cookies.sqlite und -wal (Firefox schreibt neue Cookies zuerst ins WAL)."""
+    stamp = []
+    for p in (cookies_db, cookies_db + "-wal"):
+        try:
+            stamp.append(os.stat(p).st_mtime_ns)
+        except OSError:
+            stamp.append(None)
+    return tuple(stamp)
+
+def _load_firefox_cookies_for_domain(profile_path: str, domain_suffix: str):
+    """
+    Cookies für domain_suffix aus dem Firefox-Profil. Solange sich cookies.sqlite/-wal nicht
+    ändern, wird die zuletzt gelesene Jar wiederverwendet (Rückgabe immer als Kopie).
+    """
+    cookies_db = os.path.join(profile_path, "cookies.sqlite")
+    key = (cookies_db, domain_suffix)
+    stamp = _cookie_db_stamp(cookies_db)
+    with _cookie_jar_lock:
+        hit = _cookie_jar_cache.get(key)
+    if hit is not None and stamp[0] is not None and hit[0] == stamp:
+        return hit[1].copy()
+    jar = _read_firefox_cookies(cookies_db, domain_suffix)
+    with _cookie_jar_lock:
+        _cookie_jar_cache[key] = (stamp, jar)
+    return jar.copy()
+
+def _read_firefox_cookies(cookies_db: str, domain_suffix: str):
+    # 1) normal read-only (sieht auch Cookies, die noch im WAL liegen)
+    # 2) Firefox hält die DB gesperrt → immutable: keine Locks, kein WAL, aber auch keine Kopie
+    for uri in (f"file:{cookies_db}?mode=ro", f"file:{cookies_db}?mode=ro&immutable=1"):
+        try:
+            return _read_cookie_jar(uri, domain_suffix)
+        except sqlite3.DatabaseError:
+            # gesperrt (OperationalError) oder – bei immutable während Firefox schreibt –
+            # inkonsistent gelesen ("malformed") → nächster Weg
+            continue
+    # 3) letzter Ausweg: Kopie im Temp-Verzeichnis
+    copied_path, cleanup_dir = _copy_sqlite_readonly(cookies_db)
+    try:
+        return _read_cookie_jar(copied_path, domain_suffix, uri=False)
+    finally:
+        shutil.rmtree(cleanup_dir, ignore_errors=True)
+
 def _build_sonar_web_session(profile_path: str) -> requests.Session:
     jar = _load_firefox_cookies_for_domain(profile_path, SONAR_WEB_DOMAIN)
     s = requests.Session()
@@ -203,6 +475,15 @@ def _build_sonar_web_session(profile_path: str) -> requests.Session:
         "X-Requested-With": "XMLHttpRequest",
         "Connection": "keep-alive",
     })
+    # Keep-Alive-Pool; kurze GET-Retries bei 5xx statt Abbruch des Imports.
+    # raise_on_status=False: nach dem letzten Versuch kommt die 5xx-Antwort zurück (verständliche
+    # Fehlermeldung mit Status/Snippet in _fetch_json_from_sonar) statt einer RetryError-Exception
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=8,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                          allowed_methods=frozenset({"GET"}), raise_on_status=False),
+    )
+    s.mount("https://", adapter)
     return s
 
 
@@ -243,12 +524,15 @@ def _selenium_refresh_sonar_cookies(profile_path: str, headless: bool = True):
                 pass
 
 
-def _fetch_json_from_sonar(url: str, profile_path: str, timeout=(5, 30)) -> dict:
+def _fetch_json_from_sonar(url: str, profile_path: str, timeout=(5, 30),
+                           session: requests.Session | None = None) -> dict:
     """
     Holt JSON von Sonar-Web; wenn die Antwort kein JSON ist (z. B. Login-HTML),
     werden Cookies via Selenium aufgefrischt und ein zweiter Versuch gemacht.
+    session: optional wiederverwendete Session (gleiche TCP/TLS-Verbindung, Cookies
+    nur einmal aus Firefox lesen); aufgefrischte Cookies landen dann auch dort.
     """
-    s = _build_sonar_web_session(profile_path)
+    s = session if session is not None else _build_sonar_web_session(profile_path)
 
     def _one_try():
         r = s.get(url, timeout=timeout)
@@ -259,7 +543,7 @@ def _fetch_json_from_sonar(url: str, profile_path: str, timeout=(5, 30)) -> dict
         if r.status_code in (401, 403) or not looks_json:
             return None, r
         try:
-            return r.json(), r
+            return _json_loads(r.content), r
         except Exception:
             try:
                 return json.loads(txt), r
@@ -313,13 +597,17 @@ class BullseyeApp:
         self.datasets_dir = os.path.join(os.path.expanduser("~"), ".bullseye_automation")
         os.makedirs(self.datasets_dir, exist_ok=True)
         self.datasets_file = os.path.join(self.datasets_dir, "datasets.json")
+        self._ds_items_cache = {}  # (id(ds), key) -> list[str]; invalidiert bei jeder Dataset-Änderung
+        self._datasets_by_kind_cache = {}  # key ('BE'/'SONAR') -> list[dataset]; dito
         self.datasets = self.load_datasets()
 
         # --- Profile storage (exactly one profile) ---
         self.profile_file = os.path.join(self.datasets_dir, "profile.json")
         self.profile = self.load_profile()
         self._prepared_preview_batches = None
+        self._prepared_preview_remaining = 0  # Anzahl noch nicht gesendeter Jobs in _prepared_preview_batches
         self._preview_mps_sent = set() 
+        self._preview_plan_dlg = None  # persistenter Preview-Plan-Dialog (siehe _show_preview_plan_dialog)
         # Profile-Werte auch als Umgebungsvariablen bereitstellen (für Helper/Fallbacks)
         self._export_profile_to_env()
 
@@ -327,6 +615,39 @@ class BullseyeApp:
         # --- Sonar Templates storage ---
         self.templates_file = os.path.join(self.datasets_dir, "sonar_templates.json")
         self.templates = self.load_templates()  # list[dict]
+        self._template_index_cache = None  # (names, {name: template}); invalidiert in save_templates
+        self._sonar_json_cache = {}  # (kind, mp, id) -> (monotonic_ts, json); TTL SONAR_JSON_CACHE_TTL_S
+        self._firefox_profile = None  # get_firefox_profile() einmal pro Sitzung
+
+        # --- Busy-Modus: Zähler laufender Jobs; Cursor/Buttons schalten nur beim Wechsel 0 ↔ 1 ---
+        self._busy_count = 0
+        self._busy_widgets = []  # Aktions-Buttons, die Jobs starten (siehe _register_busy_widget)
+
+        # --- Results: Fehler beim Eintragen sammeln, ein Dialog pro Idle-Frame ---
+        self._result_add_errors = []
+
+        # --- UI-Queue: Worker-Threads posten Callables, ein Poller führt sie gebündelt aus ---
+        self._ui_queue = queue.Queue()
+        self.root.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+
+        # --- Job-Queue: ein langlebiger Worker arbeitet Backend-Jobs nacheinander ab ---
+        self._job_queue = queue.Queue()
+        self._job_thread = threading.Thread(target=self._job_pump, daemon=True)
+        self._job_thread.start()
+
+        # --- Progress-Slot: Worker überschreiben nur den letzten Wert, _drain_ui_queue zeichnet ihn ---
+        self._progress_pending = None  # (index, total) oder None
+        self._progress_lock = threading.Lock()
+
+        # --- Status-Slot: letzte Meldung gewinnt, Performance-Werte werden gesammelt (Flush in _drain_ui_queue) ---
+        self._status_pending = None
+        self._status_stats = {}
+        self._status_metrics_since = None
+        self._status_lock = threading.Lock()
+
+        self.update_concurrency = UPDATE_CONTENT_WORKERS  # Update Content: parallele Jobs
+        self._xlsx_cache = OrderedDict()  # (reader, abspath, mtime_ns, size) -> list[dict]
+        self._xlsx_cache_lock = threading.Lock()  # Zugriff aus UI- und Job-Thread
 
 
 
@@ -488,7 +809,9 @@ class BullseyeApp:
 
         actions_in_card = ttk.Frame(fn_card, style="Amazon.TFrame", padding=(0, 8, 0, 0))
         actions_in_card.pack(side="bottom", fill="x", anchor="se")
-        self.create_amazon_button(actions_in_card, "Proceed", self.proceed).pack(side="right")
+        self.btn_proceed = self.create_amazon_button(actions_in_card, "Proceed", self.proceed)
+        self.btn_proceed.pack(side="right")
+        self._register_busy_widget(self.btn_proceed)
 
         
         # Datasets card (rechts) — Treeview mit moderner Scrollbar + Buttons unten rechts
@@ -540,6 +863,9 @@ class BullseyeApp:
 
         self.btn_ds_create = self.create_amazon_button(ds_actions, "Create", self.dataset_create)
         self.btn_ds_create.pack(side="right")
+        # im Busy-Modus gesperrt (siehe _set_busy)
+        for w in (self.btn_ds_create, self.btn_ds_edit, self.btn_ds_delete):
+            self._register_busy_widget(w)
 
         # Auswahl-Handling
         self.datasets_tv.bind("<<TreeviewSelect>>", self.on_dataset_select)
@@ -898,17 +1224,126 @@ class BullseyeApp:
         btn.bind("<Leave>", on_leave)
         return btn
 
+    def _open_modal(self, title, w, h, minw=None, minh=None) -> tk.Toplevel:
+        """
+        Modales Toplevel (transient + grab) erzeugen und mittig über dem Hauptfenster platzieren.
+        Größe + Position werden in EINEM geometry()-Aufruf gesetzt; da w/h bekannt sind,
+        ist kein update_idletasks() für winfo_width()/winfo_height() des Dialogs nötig.
+        """
+        dlg = tk.Toplevel(self.root)
+        dlg.title(title)
+        dlg.configure(bg=self.AMAZON["bg"])
+        if minw is not None and minh is not None:
+            dlg.minsize(minw, minh)
+        dlg.transient(self.root)
+        dlg.grab_set()
+
+        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - w // 2)
+        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - h // 2)
+        dlg.geometry(f"{w}x{h}+{max(0, x)}+{max(0, y)}")
+        return dlg
+
     # ------------------- UI Updates -------------------
 
     def update_progress(self, index, total):
         """Update progress bar and labels"""
-        progress = ((index + 1) / total) * 100
+        done = index + 1
+        progress = done * 100 / total
         self.progress_var.set(progress)
         self.progress_label.config(
-            text=f"Processing: {index + 1}/{total} segments ({progress:.1f}%)"
+            text=f"Processing: {done}/{total} segments ({progress:.1f}%)"
         )
         self.root.update()
 
+    def _post_ui(self, fn):
+        """Callable aus einem Worker-Thread im Tk-Thread ausführen lassen (via UI-Queue)."""
+        self._ui_queue.put(fn)
+
+    def _drain_ui_queue(self):
+        """Progress-/Status-Slot und alle anstehenden UI-Callables in einem Tick abarbeiten."""
+        # zuerst neu einplanen, damit auch modale Dialoge (wait_window) weiter gedraint werden
+        self.root.after(UI_QUEUE_POLL_MS, self._drain_ui_queue)
+        # Slots vor den Callables: ein danach gepostetes on_done sieht den letzten Stand
+        self._flush_progress()
+        self._flush_status()
+        while True:
+            try:
+                fn = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                fn()
+            except Exception:
+                self.root.report_callback_exception(*sys.exc_info())
+
+    def _submit_job(self, fn):
+        """Backend-Job (Callable) an den Job-Worker übergeben; Jobs laufen strikt nacheinander."""
+        self._job_queue.put(fn)
+
+    def _job_pump(self):
+        """Job-Worker: holt Callables aus der Job-Queue und führt sie aus (läuft bis Programmende)."""
+        while True:
+            fn = self._job_queue.get()
+            try:
+                fn()
+            except Exception:
+                # Jobs melden ihre Fehler selbst; hier nur nichts Unbehandeltes verschlucken
+                self._post_ui(lambda ei=sys.exc_info(): self.root.report_callback_exception(*ei))
+            finally:
+                self._job_queue.task_done()
+
+    def _post_progress(self, index, total):
+        """Aus Worker-Threads: letzten Progress-Wert merken; gezeichnet wird höchstens einmal pro UI-Tick."""
+        with self._progress_lock:
+            self._progress_pending = (index, total)
+
+    def _flush_progress(self):
+        with self._progress_lock:
+            pending, self._progress_pending = self._progress_pending, None
+        if pending is not None:
+            self.update_progress(*pending)
+
+    def _drop_pending_progress(self):
+        """Noch nicht geflushten Progress verwerfen (vor dem Abschluss-Text setzen)."""
+        with self._progress_lock:
+            self._progress_pending = None
+
+    def _post_status(self, message, metrics_since=None):
+        """
+        Aus Worker-Threads: Statuszeile setzen (nur die letzte Meldung pro UI-Tick wird angezeigt).
+        Mit metrics_since (Startzeit) werden Performance-Werte aus *jeder* Meldung gesammelt
+        und beim Flush einmal in collected_stats/update_metrics übernommen.
+        """
+        stats = self.parse_performance_stats(message) if metrics_since is not None else None
+        with self._status_lock:
+            self._status_pending = message
+            if stats:
+                self._status_stats.update(stats)
+                self._status_metrics_since = metrics_since
+
+    def _flush_status(self):
+        with self._status_lock:
+            message, self._status_pending = self._status_pending, None
+            stats, self._status_stats = self._status_stats, {}
+            since = self._status_metrics_since
+        if message is not None:
+            self.status_var.set(message)
+        if stats:
+            self.collected_stats.update(stats)
+            self.update_metrics(total_time=time.time() - since, stats=self.collected_stats)
+
+    def _coalesced_progress(self, total, post, max_updates=200):
+        """Progress-Callback, der höchstens ~max_updates UI-Updates in die UI-Queue stellt
+        (der letzte Schritt wird immer gepostet)."""
+        step = max(1, total // max_updates)
+        last = [-step]
+
+        def cb(i):
+            if i - last[0] >= step or i + 1 >= total:
+                last[0] = i
+                self._post_ui(lambda: post(i))
+        return cb
+
     def update_metrics(self, total_time, stats):
         """Update performance metrics labels"""
         # Normalize total_time to seconds (int)
@@ -944,16 +1379,35 @@ class BullseyeApp:
         return key in self.ds_types(ds)
 
     def ds_items(self, ds, key):
-        """Hole nur die Items einer bestimmten Spalte."""
-        for c in ds.get("columns", []):
-            if c.get("key") == key:
-                return list(c.get("items", []))
-        return []
+        """
+        Hole nur die Items einer bestimmten Spalte.
+        Gecacht pro (Dataset, Spalte) bis zur nächsten Änderung – Rückgabe nicht verändern.
+        """
+        ck = (id(ds), key)
+        items = self._ds_items_cache.get(ck)
+        if items is None:
+            items = []
+            for c in ds.get("columns", []):
+                if c.get("key") == key:
+                    items = list(c.get("items", []))
+                    break
+            self._ds_items_cache[ck] = items
+        return items
+
+    def _invalidate_dataset_caches(self):
+        """Nach Create/Edit/Delete/Load: abgeleitete Dataset-Caches verwerfen."""
+        self._ds_items_cache.clear()
+        self._datasets_by_kind_cache.clear()
 
 
     def filter_datasets(self, key):
-        """Alle Datasets, die eine Spalte `key` (z. B. 'BE' oder 'SONAR') haben."""
-        return [ds for ds in (self.datasets or []) if self.ds_has(ds, key)]
+        """Alle Datasets, die eine Spalte `key` (z. B. 'BE' oder 'SONAR') haben.
+        Gecacht bis zur nächsten Dataset-Änderung – Rückgabe nicht verändern."""
+        cached = self._datasets_by_kind_cache.get(key)
+        if cached is None:
+            cached = [ds for ds in (self.datasets or []) if self.ds_has(ds, key)]
+            self._datasets_by_kind_cache[key] = cached
+        return cached
 
 
 
@@ -989,6 +1443,7 @@ class BullseyeApp:
 
     def save_datasets(self):
         """Persist datasets to JSON."""
+        self._invalidate_dataset_caches()
         try:
             with open(self.datasets_file, "w", encoding="utf-8") as f:
                 json.dump(self.datasets, f, ensure_ascii=False, indent=2)
@@ -1043,13 +1498,13 @@ class BullseyeApp:
             # very permissive URL regex around the domain
             url_re = re.compile(r'https?://sonar-eu\.amazon\.com[^\s]*', re.IGNORECASE)
             items = url_re.findall(text)
-            items = self._unique_preserve_order([it.strip() for it in items if it.strip()])
+            items = self._unique_preserve_order([s for it in items if (s := it.strip())])
             if not items:
                 raise ValueError("No SONAR URLs found.")
             return ("SONAR", items)
 
         # else: BE IDs (10 digits)
-        ids = re.findall(r'\b\d{10}\b', text)
+        ids = _BE_ID_RE.findall(text)
         ids = self._unique_preserve_order(ids)
         if not ids:
             raise ValueError("No 10-digit BE IDs found.")
@@ -1113,19 +1568,7 @@ class BullseyeApp:
         """
         assert mode in ("create", "edit")
 
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Create Dataset" if mode == "create" else "Edit Dataset")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("880x560")
-        dlg.minsize(820, 520)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        # zentrieren
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Create Dataset" if mode == "create" else "Edit Dataset", 880, 560, minw=820, minh=520)
 
         # Header
         hdr = tk.Frame(dlg, bg=self.AMAZON["bg"])
@@ -1187,8 +1630,7 @@ class BullseyeApp:
             for i, b in enumerate(col_blocks):
                 b["frame"].grid(row=0, column=i, sticky="ns",
                                 padx=(0 if i == 0 else 8, 8), pady=4)
-            inner.update_idletasks()
-            _sync_scrollregion()
+            # scrollregion folgt über inner <Configure> – kein erzwungener Geometrie-Durchlauf
 
         def used_types():
             return {b['type_var'].get() for b in col_blocks}
@@ -1309,12 +1751,12 @@ class BullseyeApp:
                 if key in cols_map:
                     messagebox.showerror("Error", f"Duplicate column type '{key}'. Each type may appear only once.")
                     return
-                raw = [l.strip() for l in b["text"].get("1.0", "end").splitlines() if l.strip()]
+                raw = _tokenize_lines(b["text"].get("1.0", "end"))
 
                 if key == "BE":
                     cleaned = []
                     for i, v in enumerate(raw, start=1):
-                        digits = "".join(ch for ch in v if ch.isdigit())
+                        digits = _digits_only(v)
                         if len(digits) != 10:
                             messagebox.showerror("Error", f"BE line {i}: must be exactly 10 digits (got '{v}').")
                             return
@@ -1373,6 +1815,21 @@ class BullseyeApp:
 
     # ------------------- Profile: Storage & UI -------------------
 
+    @property
+    def profile(self):
+        return self._profile
+
+    @profile.setter
+    def profile(self, value):
+        # abgeleitete Felder bei jeder Zuweisung neu – Jobs/Worker lesen nur noch profile_alias
+        self._profile = value
+        self._profile_alias = str((value or {}).get("alias") or "")
+
+    @property
+    def profile_alias(self) -> str:
+        """Alias aus dem Profil ("" ohne Profil) – gecacht bis zur nächsten Zuweisung von self.profile."""
+        return self._profile_alias
+
     def load_profile(self):
         """Liest das (einzige) Profil oder gibt None zurück. Akzeptiert 'customerId' und 'customer_id'."""
         try:
@@ -1461,18 +1918,7 @@ class BullseyeApp:
             return
 
         # View/Edit/Delete Dialog
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Profile")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("420x240")
-        dlg.minsize(400, 220)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Profile", 420, 240, minw=400, minh=220)
 
         wrap = tk.Frame(dlg, bg=self.AMAZON["bg"])
         wrap.pack(fill="both", expand=True, padx=16, pady=16)
@@ -1514,19 +1960,7 @@ class BullseyeApp:
         Rückgabe: {'alias': str, 'email': str, 'customerId': int|None} oder None
         """
         assert mode in ("create", "edit")
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Create profile" if mode == "create" else "Edit profile")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("460x320")  # etwas höher wegen neuem Feld
-        dlg.minsize(440, 300)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        # zentrieren
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Create profile" if mode == "create" else "Edit profile", 460, 320, minw=440, minh=300)  # etwas höher wegen neuem Feld
 
         body = ttk.Frame(dlg, style="Amazon.TFrame")
         body.pack(fill="both", expand=True, padx=16, pady=12)
@@ -1648,12 +2082,27 @@ class BullseyeApp:
         return []
 
     def save_templates(self):
+        # alle Template-Änderungen laufen über save_templates → Namens-Index verwerfen
+        self._template_index_cache = None
         try:
             with open(self.templates_file, "w", encoding="utf-8") as f:
                 json.dump(self.templates, f, ensure_ascii=False, indent=2)
         except Exception as e:
             messagebox.showerror("Templates", f"Could not save templates:\n{e}")
 
+    def _template_index(self):
+        """
+        (Anzeigenamen in Listen-Reihenfolge, {Name: Template}) – gecacht bis zum nächsten save_templates.
+        Bei doppelten Namen gewinnt das erste Template (wie zuvor list.index). Rückgabe nicht verändern.
+        """
+        if self._template_index_cache is None:
+            names = [t.get("name", f"Template {i+1}") for i, t in enumerate(self.templates)]
+            by_name = {}
+            for n, t in zip(names, self.templates):
+                by_name.setdefault(n, t)
+            self._template_index_cache = (names, by_name)
+        return self._template_index_cache
+
     def _template_name_exists(self, name: str, exclude_index: int = None) -> bool:
         n = (name or "").strip().lower()
         for i, t in enumerate(self.templates or []):
@@ -1698,12 +2147,11 @@ class BullseyeApp:
           - '21:30'                          (24h)
         Liefert Minuten seit 00:00 (0..1439) oder wirft ValueError.
         """
-        import re as _re
         if not s:
             raise ValueError("Empty time")
         txt = s.strip().upper()
         # 12h: H(:MM)?(AM|PM)
-        m = _re.match(r"^(\d{1,2})(?::(\d{1,2}))?\s*(AM|PM)?$", txt)
+        m = re.match(r"^(\d{1,2})(?::(\d{1,2}))?\s*(AM|PM)?$", txt)
         if not m:
             raise ValueError("Invalid time format. Use e.g. '9:00 AM' or '21:30'.")
         h = int(m.group(1))
@@ -1743,28 +2191,15 @@ class BullseyeApp:
         try:
             val = json.loads(s)
             if isinstance(val, list):
-                return [str(x).strip() for x in val if str(x).strip()]
+                return [t for x in val if (t := str(x).strip())]
         except Exception:
             pass
-        import re as _re
-        parts = [p.strip() for p in _re.split(r"[;,]", s) if p.strip()]
+        parts = [t for p in re.split(r"[;,]", s) if (t := p.strip())]
         return parts
 
     def open_templates_manager(self):
         """Hauptdialog: Liste + Create/Edit/Delete"""
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Templates")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("680x420")
-        dlg.minsize(640, 380)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        # center
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Templates", 680, 420, minw=640, minh=380)
 
         hdr = tk.Frame(dlg, bg=self.AMAZON["bg"])
         hdr.pack(fill="x", padx=16, pady=(14, 6))
@@ -1860,18 +2295,7 @@ class BullseyeApp:
         assert mode in ("create", "edit")
         t = initial or {}
 
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Create Template" if mode == "create" else "Edit Template")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("620x560")
-        dlg.minsize(600, 520)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Create Template" if mode == "create" else "Edit Template", 620, 560, minw=600, minh=520)
 
         # Header
         hdr = tk.Frame(dlg, bg=self.AMAZON["bg"])
@@ -2167,22 +2591,9 @@ class BullseyeApp:
         Dialog: Basis-BE-ID wählen (Default ODER Custom), Anzahl, und Namen (eine Zeile pro Clone).
         Rückgabe: {"base_id": "##########", "count": int, "names": [str, ...]} oder None bei Abbruch.
         """
-        import tkinter as tk
-        from tkinter import ttk, messagebox
 
         
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Mass Clone — Base ID, Count, Names")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("700x520")
-        dlg.minsize(660, 480)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Mass Clone — Base ID, Count, Names", 700, 520, minw=660, minh=480)
 
         # Header
         hdr = tk.Frame(dlg, bg=self.AMAZON["bg"])
@@ -2252,7 +2663,7 @@ class BullseyeApp:
             if choice_var.get() == "default":
                 base_id = MASS_CLONE_FIXED_BASE_BE
             else:
-                base_id = "".join(ch for ch in custom_var.get().strip() if ch.isdigit())
+                base_id = _digits_only(custom_var.get().strip())
                 if len(base_id) != 10:
                     messagebox.showerror("Error", "Eigene Base BE-ID muss 10-stellig sein.")
                     return
@@ -2268,7 +2679,7 @@ class BullseyeApp:
 
             # Names
             raw_lines = names_text.get("1.0", "end").splitlines()
-            names = [ln.strip() for ln in raw_lines if ln.strip()]
+            names = [s for ln in raw_lines if (s := ln.strip())]
             if len(names) != n:
                 messagebox.showerror("Error", f"Bitte genau {n} Name(n) eingeben (eine Zeile pro Clone).")
                 return
@@ -2303,19 +2714,7 @@ class BullseyeApp:
 
     def show_single_be_dialog(self):
         """Amazon-style Dialog: genau eine 10-stellige BE-ID abfragen. Enter wechselt NICHT automatisch."""
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Clone across MPs — Source BE ID")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("460x220")
-        dlg.minsize(440, 200)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        # center on parent
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Clone across MPs — Source BE ID", 460, 220, minw=440, minh=200)
 
         hdr = tk.Frame(dlg, bg=self.AMAZON["bg"])
         hdr.pack(fill="x", padx=16, pady=(14, 6))
@@ -2340,7 +2739,7 @@ class BullseyeApp:
 
         def submit():
             raw = (entry.get() or "").strip()
-            digits = "".join(ch for ch in raw if ch.isdigit())
+            digits = _digits_only(raw)
             if len(digits) != 10:
                 messagebox.showerror("Error", "BE ID must be exactly 10 digits.")
                 return
@@ -2368,19 +2767,7 @@ class BullseyeApp:
         Dialog für BE-IDs (v2): Links manuell, rechts Auswahl aus BE-Datasets (columns['BE']).
         Rückgabe: kombinierter Rohtext (manuell + ausgewählte Datasets) oder None bei Abbruch.
         """
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Enter BE IDs")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("560x380")
-        dlg.minsize(520, 320)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        # zentrieren
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0,x)}+{max(0,y)}")
+        dlg = self._open_modal("Enter BE IDs", 560, 380, minw=520, minh=320)
 
         # Header
         hdr = tk.Frame(dlg, bg=self.AMAZON["bg"])
@@ -2422,33 +2809,35 @@ class BullseyeApp:
 
         be_datasets = self.filter_datasets("BE")
 
-        ds_list = tk.Listbox(
-            list_wrap,
-            selectmode="extended",
-            activestyle="none",
-            font=("Segoe UI", 10),
-            bg=self.AMAZON["bg"],
-            fg=self.AMAZON["text"],
-            highlightthickness=0,
-            relief="flat",
-            bd=0
-        )
+        ds_list = None
         if be_datasets:
+            ds_list = tk.Listbox(
+                list_wrap,
+                selectmode="extended",
+                activestyle="none",
+                font=("Segoe UI", 10),
+                bg=self.AMAZON["bg"],
+                fg=self.AMAZON["text"],
+                highlightthickness=0,
+                relief="flat",
+                bd=0
+            )
             for ds in be_datasets:
                 ds_list.insert("end", ds.get("name", "Unnamed"))
-        else:
-            ds_list.insert("end", "No BE datasets yet")
-            ds_list.configure(state="disabled")
-        ds_list.grid(row=0, column=0, sticky="nsew")
+            ds_list.grid(row=0, column=0, sticky="nsew")
 
-        ds_scroll = ttk.Scrollbar(
-            list_wrap,
-            orient="vertical",
-            command=ds_list.yview,
-            style="Amazon.Vertical.TScrollbar"
-        )
-        ds_scroll.grid(row=0, column=1, sticky="ns")
-        ds_list.configure(yscrollcommand=ds_scroll.set)
+            ds_scroll = ttk.Scrollbar(
+                list_wrap,
+                orient="vertical",
+                command=ds_list.yview,
+                style="Amazon.Vertical.TScrollbar"
+            )
+            ds_scroll.grid(row=0, column=1, sticky="ns")
+            ds_list.configure(yscrollcommand=ds_scroll.set)
+        else:
+            # Keine Datasets -> nur Hinweis, kein Listbox/Scrollbar-Paar bauen
+            ttk.Label(list_wrap, text="No BE datasets yet", style="AmazonMuted.TLabel")\
+                .grid(row=0, column=0, sticky="nw")
 
         # Actions
         actions = ttk.Frame(dlg, style="Amazon.TFrame")
@@ -2496,13 +2885,7 @@ class BullseyeApp:
         Bei Dataset werden die Items aus den jeweiligen Spalten ('BE' / 'SONAR') zusammengeführt.
         Rückgabe: Liste von Paaren [(be_id, sonar_entry), ...] oder None.
         """
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Upload BE to Sonar — Mapping")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("780x420")
-        dlg.minsize(720, 380)
-        dlg.transient(self.root)
-        dlg.grab_set()
+        dlg = self._open_modal("Upload BE to Sonar — Mapping", 780, 420, minw=720, minh=380)
 
         # Grid-Layout
         dlg.grid_rowconfigure(0, weight=0)
@@ -2546,8 +2929,8 @@ class BullseyeApp:
 
         ttk.Label(body, text="Select BE datasets", style="AmazonMuted.TLabel").grid(row=3, column=0, sticky="w", pady=(6, 2))
         be_datasets = self.filter_datasets("BE")
-        be_names = [ds.get("name", "Unnamed") for ds in be_datasets] or ["No BE datasets yet"]
-        left_checks_frame, left_vars = self._make_scrollable_checks(body, be_names)
+        be_names = [ds.get("name", "Unnamed") for ds in be_datasets]
+        left_checks_frame, left_vars = self._make_scrollable_checks(body, be_names, empty_text="No BE datasets yet")
         left_checks_frame.grid(row=4, column=0, sticky="nsew", padx=(0, 8))
 
         # RIGHT (SONAR)
@@ -2563,8 +2946,8 @@ class BullseyeApp:
 
         ttk.Label(body, text="Select SONAR datasets", style="AmazonMuted.TLabel").grid(row=3, column=1, sticky="w", pady=(6, 2))
         sonar_datasets = self.filter_datasets("SONAR")
-        sonar_names = [ds.get("name", "Unnamed") for ds in sonar_datasets] or ["No SONAR datasets yet"]
-        right_checks_frame, right_vars = self._make_scrollable_checks(body, sonar_names)
+        sonar_names = [ds.get("name", "Unnamed") for ds in sonar_datasets]
+        right_checks_frame, right_vars = self._make_scrollable_checks(body, sonar_names, empty_text="No SONAR datasets yet")
         right_checks_frame.grid(row=4, column=1, sticky="nsew", padx=(8, 0))
 
         # Sichtbarkeit je Modus
@@ -2598,14 +2981,17 @@ class BullseyeApp:
         result = {"pairs": None}
 
         def _lines(text_widget):
-            return [l.strip() for l in text_widget.get("1.0", "end").splitlines() if l.strip()]
+            # Leeres Textfeld: nur Index abfragen, keinen Inhalt holen
+            if text_widget.index("end-1c") == "1.0":
+                return []
+            return _tokenize_lines(text_widget.get("1.0", "end-1c"))
 
         def _collect_be():
             if left_mode.get() == "manual":
                 raw = _lines(left_manual)
                 cleaned = []
                 for i, be in enumerate(raw, start=1):
-                    digits = "".join(ch for ch in be if ch.isdigit())
+                    digits = _digits_only(be)
                     if len(digits) != 10:
                         messagebox.showerror("Error", f"BE line {i}: must be 10 digits (got: '{be}').")
                         return None
@@ -2624,7 +3010,7 @@ class BullseyeApp:
                     return None
                 cleaned = []
                 for i, be in enumerate(items, start=1):
-                    digits = "".join(ch for ch in be if ch.isdigit())
+                    digits = _digits_only(be)
                     if len(digits) != 10:
                         messagebox.showerror("Error", f"BE dataset item {i}: must be 10 digits (got: '{be}').")
                         return None
@@ -2686,19 +3072,7 @@ class BullseyeApp:
 
     def show_confirm_ids_dialog(self, segment_ids):
         """Amazon-style modal confirmation with the list of IDs. Returns True if user confirms."""
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Confirm IDs")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("440x420")
-        dlg.minsize(420, 360)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        # center on parent
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0,x)}+{max(0,y)}")
+        dlg = self._open_modal("Confirm IDs", 440, 420, minw=420, minh=360)
 
         # header
         hdr = tk.Frame(dlg, bg=self.AMAZON["bg"])
@@ -2764,19 +3138,7 @@ class BullseyeApp:
         Entweder manuell (eine pro Zeile: ID oder Sonar-URL) ODER aus Datasets (nur SONAR-Spalte).
         Rückgabe: {"campaigns": [str, ...]} oder None bei Abbruch/Fehler.
         """
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Send Preview — Select Campaigns")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("780x420")
-        dlg.minsize(720, 380)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        # zentrieren
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Send Preview — Select Campaigns", 780, 420, minw=720, minh=380)
 
         # Header
         hdr = tk.Frame(dlg, bg=self.AMAZON["bg"])
@@ -2809,8 +3171,8 @@ class BullseyeApp:
         ttk.Label(right, text="From SONAR datasets", style="AmazonBody.TLabel").pack(anchor="w", pady=(0, 4))
 
         sonar_datasets = self.filter_datasets("SONAR")
-        sonar_names = [ds.get("name", "Unnamed") for ds in sonar_datasets] or ["No SONAR datasets yet"]
-        ds_frame, ds_vars = self._make_scrollable_checks(right, sonar_names)
+        sonar_names = [ds.get("name", "Unnamed") for ds in sonar_datasets]
+        ds_frame, ds_vars = self._make_scrollable_checks(right, sonar_names, empty_text="No SONAR datasets yet")
         ds_frame.pack(fill="both", expand=True)
 
         # Footer / Actions
@@ -2820,36 +3182,31 @@ class BullseyeApp:
         result = {"campaigns": None}
 
         def _collect():
-            # 1) Manuelle Zeilen
-            lines = [l.strip() for l in manual_text.get("1.0", "end").splitlines() if l.strip()]
-
-            # 2) Ausgewählte SONAR-Datasets
-            if sonar_datasets and any(v.get() for v in ds_vars):
-                for i, v in enumerate(ds_vars):
-                    if v.get():
-                        lines.extend(self.ds_items(sonar_datasets[i], "SONAR"))
-
-            # Validierung
-            if not lines:
-                messagebox.showerror("Send Preview", "Please provide at least one campaign (manual or from dataset).")
-                return
-
-            # Akzeptiert: reine Ziffern ODER echte Sonar-URL (wie im Dataset-Editor)
-            cleaned = []
-            for idx, val in enumerate(lines, start=1):
-                v = str(val).strip()
-                if v.isdigit() or v.startswith("https://sonar-eu.amazon.com"):
-                    cleaned.append(v)
-                else:
+            # Manuelle Zeilen + ausgewählte SONAR-Datasets in einem Durchlauf:
+            # strippen, validieren (Ziffern ODER echte Sonar-URL) und deduplizieren
+            sources = [manual_text.get("1.0", "end").splitlines()]
+            sources += [self.ds_items(ds, "SONAR") for ds, v in zip(sonar_datasets, ds_vars) if v.get()]
+
+            cleaned = {}
+            idx = 0
+            for raw in itertools.chain.from_iterable(sources):
+                v = str(raw).strip()
+                if not v:
+                    continue
+                idx += 1
+                if not _validate_sonar_line(v):
                     messagebox.showerror(
                         "Send Preview",
                         f"Line {idx}: must be a campaign ID (digits) or a Sonar URL starting with https://sonar-eu.amazon.com"
                     )
                     return
+                cleaned.setdefault(v, None)
+
+            if not cleaned:
+                messagebox.showerror("Send Preview", "Please provide at least one campaign (manual or from dataset).")
+                return
 
-            # Duplikate entfernen (Reihenfolge beibehalten)
-            cleaned = self._unique_preserve_order(cleaned)
-            result["campaigns"] = cleaned
+            result["campaigns"] = list(cleaned)
             dlg.destroy()
 
         def _cancel():
@@ -2868,21 +3225,42 @@ class BullseyeApp:
     def _show_preview_plan_dialog(self, batches: dict):
         """Zeigt vorbereitete Batches an, erlaubt Mehrfachauswahl der MPs
         und (falls vorhanden) die Zuordnung von 'unknown'-Jobs zu einem MP.
+        Der Dialog wird einmal gebaut und danach nur versteckt/wieder angezeigt;
+        pro Aufruf wird nur der MP-Bereich neu befüllt.
         Rückgabe:
           - (selected_mps: list[int], unknown_target_mp: int|None), wenn 'Senden' gedrückt
           - None, wenn nur geschlossen (nur vorbereitet)
         """
-        import tkinter as tk
-        from tkinter import ttk, messagebox
-
-        country = {3: "UK", 4: "DE", 5: "FR", 35691: "IT", 44551: "ES"}
-
+        plan = self._preview_plan_dlg
+        if plan is None or not plan["dlg"].winfo_exists():
+            plan = self._preview_plan_dlg = self._build_preview_plan_dialog()
+
+        dlg = plan["dlg"]
+        plan["reset_with"](batches)
+        plan["done"].set(False)
+        dlg.deiconify()
+        dlg.lift()
+        dlg.grab_set()
+        dlg.wait_variable(plan["done"])
+        if dlg.winfo_exists():
+            dlg.grab_release()
+            dlg.withdraw()
+        return plan["result"]["value"]
+
+    def _destroy_preview_plan_dialog(self):
+        """Persistenten Preview-Plan-Dialog abbauen (z. B. wenn alles gesendet ist)."""
+        plan, self._preview_plan_dlg = self._preview_plan_dlg, None
+        if plan is not None and plan["dlg"].winfo_exists():
+            plan["dlg"].destroy()
+
+    def _build_preview_plan_dialog(self) -> dict:
+        """Baut den (versteckten) Preview-Plan-Dialog einmalig; Inhalt kommt über reset_with(batches)."""
         dlg = tk.Toplevel(self.root)
+        dlg.withdraw()
         dlg.title("Preview – Batches vorbereitet")
         dlg.configure(bg=self.AMAZON["bg"])
         dlg.geometry("460x420")
         dlg.transient(self.root)
-        dlg.grab_set()
 
         ttk.Label(dlg, text="Batches vorbereitet", style="AmazonTitle.TLabel")\
             .pack(anchor="w", padx=16, pady=(14, 6))
@@ -2895,54 +3273,93 @@ class BullseyeApp:
         body = ttk.Frame(dlg, style="Amazon.TFrame")
         body.pack(fill="both", expand=True, padx=16, pady=0)
 
-        # Mehrfachauswahl (Checkboxen)
-        checks_wrap = ttk.Frame(body, style="Amazon.TFrame")
-        checks_wrap.pack(fill="x", pady=(0, 8))
-        var = tk.BooleanVar(value=False)  # Start: nichts ausgewählt
-        vars_by_mp: dict[int, tk.BooleanVar] = {}
-        available_mps = [k for k in batches.keys() if isinstance(k, int)]
-        for mp in sorted(available_mps):
-            jobs = batches.get(mp, []) or []
-            already = mp in getattr(self, "_preview_mps_sent", set())
-            suffix = "  ✓ gesendet" if already else ""
-            label = f"{country.get(mp, mp)} (MP {mp}) – {len(jobs)} Kampagne(n){suffix}"
-
-            var = tk.BooleanVar(value=False)  # NICHT vorselektiert
-            ttk.Checkbutton(checks_wrap, text=label, variable=var, style="Amazon.TCheckbutton")\
-                .pack(anchor="w", pady=2)
-            vars_by_mp[mp] = var
-
-
-        unknown_jobs = batches.get("unknown") or []
-        assign_frame = ttk.Frame(body, style="Amazon.TFrame")
-        assign_frame.pack(fill="x")
-
-        unknown_target_var = tk.StringVar(value="")
-        if unknown_jobs:
-            ttk.Label(
-                assign_frame,
-                text=f"IDs ohne MP: {len(unknown_jobs)} – bitte einem MP zuordnen:",
-                style="AmazonBody.TLabel"
-            ).pack(anchor="w", pady=(4, 2))
-
-            mp_labels = [f"{country.get(mp, mp)} (MP {mp})" for mp in sorted(vars_by_mp.keys())]
-            cb = ttk.Combobox(assign_frame, state="readonly", values=mp_labels, textvariable=unknown_target_var)
-            cb.pack(fill="x")
-            # Default: erster MP mit Haken (falls vorhanden), sonst erster Eintrag
-            preselect = ""
-            for mp in sorted(vars_by_mp.keys()):
-                if vars_by_mp[mp].get():
-                    preselect = f"{country.get(mp, mp)} (MP {mp})"
-                    break
-            unknown_target_var.set(preselect or (mp_labels[0] if mp_labels else ""))
-
         # Aktionen
         actions = ttk.Frame(dlg, style="Amazon.TFrame")
         actions.pack(fill="x", padx=16, pady=12)
+
         result = {"value": None}
+        done = tk.BooleanVar(master=dlg, value=False)
+        unknown_target_var = tk.StringVar(master=dlg, value="")
+        state = {"vars_by_mp": {}, "unknown_jobs": [], "sync_unknown_target": None}
+
+        # Aufbau des MP-Bereichs; neu gebaut wird nur, wenn sich das Layout (MPs / unknown ja-nein) ändert
+        view = {"layout": None, "checks_by_mp": {}, "unknown_label": None}
+
+        def _mp_label(mp) -> str:
+            return f"{MP_COUNTRY.get(mp, mp)} (MP {mp})"
+
+        def _build_body(sorted_mps: tuple, has_unknown: bool):
+            for w in body.winfo_children():
+                w.destroy()
+
+            # Mehrfachauswahl (Checkboxen); Texte setzt reset_with
+            checks_wrap = ttk.Frame(body, style="Amazon.TFrame")
+            checks_wrap.pack(fill="x", pady=(0, 8))
+            checks_wrap.columnconfigure(0, weight=1)
+            vars_by_mp: dict[int, tk.BooleanVar] = {}
+            checks_by_mp = {}
+            for row, mp in enumerate(sorted_mps):
+                var = tk.BooleanVar(master=checks_wrap, value=False)
+                chk = ttk.Checkbutton(checks_wrap, variable=var, style="Amazon.TCheckbutton")
+                chk.grid(row=row, column=0, sticky="w", pady=2)
+                vars_by_mp[mp] = var
+                checks_by_mp[mp] = chk
+
+            state["vars_by_mp"] = vars_by_mp
+            state["sync_unknown_target"] = None
+            view["checks_by_mp"] = checks_by_mp
+            view["unknown_label"] = None
+
+            if has_unknown:
+                assign_frame = ttk.Frame(body, style="Amazon.TFrame")
+                assign_frame.pack(fill="x")
+                unknown_label = ttk.Label(assign_frame, style="AmazonBody.TLabel")
+                unknown_label.pack(anchor="w", pady=(4, 2))
+
+                cb = ttk.Combobox(assign_frame, state="readonly", textvariable=unknown_target_var)
+                cb.pack(fill="x")
+
+                def _populate_mp_labels():
+                    # Erst beim Aufklappen: nur angehakte MPs anbieten (sonst alle)
+                    mps = [mp for mp in sorted_mps if vars_by_mp[mp].get()] or list(sorted_mps)
+                    labels = [_mp_label(mp) for mp in mps]
+                    cb["values"] = labels
+                    # Auswahl nicht mehr im Angebot (MP abgehakt) → auf den ersten angebotenen MP
+                    if labels and unknown_target_var.get() not in labels:
+                        unknown_target_var.set(labels[0])
+
+                cb.configure(postcommand=_populate_mp_labels)
+                state["sync_unknown_target"] = _populate_mp_labels
+                view["unknown_label"] = unknown_label
+
+            view["layout"] = (sorted_mps, has_unknown)
+
+        def reset_with(batches: dict):
+            result["value"] = None
+            sorted_mps = tuple(sorted(k for k in batches.keys() if isinstance(k, int)))
+            unknown_jobs = batches.get("unknown") or []
+            if view["layout"] != (sorted_mps, bool(unknown_jobs)):
+                _build_body(sorted_mps, bool(unknown_jobs))
+
+            sent = getattr(self, "_preview_mps_sent", set())
+            for mp in sorted_mps:
+                jobs = batches.get(mp, []) or []
+                suffix = "  ✓ gesendet" if mp in sent else ""
+                view["checks_by_mp"][mp].configure(text=f"{_mp_label(mp)} – {len(jobs)} Kampagne(n){suffix}")
+                state["vars_by_mp"][mp].set(False)  # NICHT vorselektiert
+            state["unknown_jobs"] = unknown_jobs
+
+            unknown_target_var.set("")
+            if unknown_jobs:
+                view["unknown_label"].configure(
+                    text=f"IDs ohne MP: {len(unknown_jobs)} – bitte einem MP zuordnen:"
+                )
+                # Default: erster Eintrag (beim Öffnen ist noch nichts angehakt)
+                if sorted_mps:
+                    unknown_target_var.set(_mp_label(sorted_mps[0]))
 
         def parse_unknown_target() -> int | None:
-            if not unknown_jobs:
+            if not state["unknown_jobs"]:
                 return None
             txt = (unknown_target_var.get() or "").strip()
             if not txt:
@@ -2952,29 +3369,42 @@ class BullseyeApp:
             return int(m.group(1)) if m else None
 
         def send_now():
-            selected_mps = [mp for mp, v in vars_by_mp.items() if v.get()]
+            selected_mps = [mp for mp, v in state["vars_by_mp"].items() if v.get()]
             if not selected_mps:
-                messagebox.showerror("Send Preview", "Bitte mindestens einen Marketplace auswählen.")
+                messagebox.showerror("Send Preview", "Bitte mindestens einen Marketplace auswählen.", parent=dlg)
                 return
+            if state["unknown_jobs"] and state["sync_unknown_target"]:
+                # gleiche Prüfung wie beim Aufklappen: Ziel muss unter den angehakten MPs sein
+                before = unknown_target_var.get()
+                state["sync_unknown_target"]()
+                if unknown_target_var.get() != before:
+                    messagebox.showerror(
+                        "Send Preview",
+                        f"Der MP für die 'unknown'-IDs ist nicht ausgewählt und wurde auf "
+                        f"{unknown_target_var.get()} gesetzt – bitte prüfen und erneut senden.",
+                        parent=dlg,
+                    )
+                    return
             ut = parse_unknown_target()
-            if unknown_jobs and (ut is None):
-                messagebox.showerror("Send Preview", "Bitte einen Marketplace für die 'unknown'-IDs auswählen.")
+            if state["unknown_jobs"] and (ut is None):
+                messagebox.showerror("Send Preview", "Bitte einen Marketplace für die 'unknown'-IDs auswählen.", parent=dlg)
                 return
             result["value"] = (selected_mps, ut)
-            dlg.destroy()
+            done.set(True)
 
         def close_only():
             result["value"] = None
-            dlg.destroy()
+            done.set(True)
 
         self.create_secondary_button(actions, "Schließen (nur vorbereiten)", close_only)\
             .pack(side="right", padx=(0, 8))
-        self.create_amazon_button(actions, "Ausgewählte senden", send_now).pack(side="right")
+        send_btn = self.create_amazon_button(actions, "Ausgewählte senden", send_now)
+        send_btn.pack(side="right")
+        self._register_busy_widget(send_btn)
 
-        import re  # lokal für parse_unknown_target
         dlg.bind("<Escape>", lambda e: close_only())
-        dlg.wait_window()
-        return result["value"]
+        dlg.protocol("WM_DELETE_WINDOW", close_only)  # nur verstecken, nicht zerstören
+        return {"dlg": dlg, "reset_with": reset_with, "done": done, "result": result}
 
 
 
@@ -2985,19 +3415,7 @@ class BullseyeApp:
         Modus B: Aus gespeicherten Datasets (nur SONAR-Spalten).
         Rückgabe: {"campaigns": [str, ...]} oder None.
         """
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Approve Sonar — Select Campaigns")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("780x420")
-        dlg.minsize(720, 380)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        # zentrieren
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Approve Sonar — Select Campaigns", 780, 420, minw=720, minh=380)
 
         # Header
         hdr = tk.Frame(dlg, bg=self.AMAZON["bg"])
@@ -3030,8 +3448,8 @@ class BullseyeApp:
         ttk.Label(right, text="From SONAR datasets", style="AmazonBody.TLabel").pack(anchor="w", pady=(0, 4))
 
         sonar_datasets = self.filter_datasets("SONAR")
-        sonar_names = [ds.get("name", "Unnamed") for ds in sonar_datasets] or ["No SONAR datasets yet"]
-        ds_frame, ds_vars = self._make_scrollable_checks(right, sonar_names)
+        sonar_names = [ds.get("name", "Unnamed") for ds in sonar_datasets]
+        ds_frame, ds_vars = self._make_scrollable_checks(right, sonar_names, empty_text="No SONAR datasets yet")
         ds_frame.pack(fill="both", expand=True)
 
         # Footer / Actions
@@ -3041,30 +3459,35 @@ class BullseyeApp:
         result = {"campaigns": None}
 
         def _collect():
-            lines = [l.strip() for l in manual_text.get("1.0", "end").splitlines() if l.strip()]
-            if sonar_datasets and any(v.get() for v in ds_vars):
-                for i, v in enumerate(ds_vars):
-                    if v.get():
-                        lines.extend(self.ds_items(sonar_datasets[i], "SONAR"))
+            sources = [manual_text.get("1.0", "end").splitlines()]
+            sources += [self.ds_items(ds, "SONAR") for ds, v in zip(sonar_datasets, ds_vars) if v.get()]
+
+            # Ein Durchlauf: strippen, validieren, deduplizieren (Reihenfolge bleibt)
+            validate = _validate_sonar_line
+            cleaned, bad = {}, []
+            idx = 0
+            for raw in itertools.chain.from_iterable(sources):
+                v = str(raw).strip()
+                if not v:
+                    continue
+                idx += 1
+                if validate(v):
+                    cleaned.setdefault(v, None)
+                else:
+                    bad.append(idx)
 
-            if not lines:
+            if not cleaned and not bad:
                 messagebox.showerror("Approve Sonar", "Please provide at least one campaign (manual or from dataset).")
                 return
+            if bad:
+                shown = ", ".join(map(str, bad[:20])) + (" …" if len(bad) > 20 else "")
+                messagebox.showerror(
+                    "Approve Sonar",
+                    f"Line(s) {shown}: must be a campaign ID (digits) or a Sonar URL starting with https://sonar-eu.amazon.com"
+                )
+                return
 
-            cleaned = []
-            for idx, val in enumerate(lines, start=1):
-                v = str(val).strip()
-                if v.isdigit() or v.startswith("https://sonar-eu.amazon.com"):
-                    cleaned.append(v)
-                else:
-                    messagebox.showerror(
-                        "Approve Sonar",
-                        f"Line {idx}: must be a campaign ID (digits) or a Sonar URL starting with https://sonar-eu.amazon.com"
-                    )
-                    return
-
-            cleaned = self._unique_preserve_order(cleaned)
-            result["campaigns"] = cleaned
+            result["campaigns"] = list(cleaned)
             dlg.destroy()
 
         def _cancel():
@@ -3082,20 +3505,12 @@ class BullseyeApp:
 
 
     def _choose_marketplace_dialog(self, title="Select marketplace"):
-        import tkinter as tk
-        from tkinter import ttk, messagebox
 
         # bekannte MPs
         known_mps = [3, 4, 5, 35691, 44551]
-        country = {3: "UK", 4: "DE", 5: "FR", 35691: "IT", 44551: "ES"}
+        label_to_mp = {f"{MP_COUNTRY.get(mp, mp)} (MP {mp})": mp for mp in known_mps}
 
-        dlg = tk.Toplevel(self.root)
-        dlg.title(title)
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("360x180")
-        dlg.minsize(340, 160)
-        dlg.transient(self.root)
-        dlg.grab_set()
+        dlg = self._open_modal(title, 360, 180, minw=340, minh=160)
 
         ttk.Label(dlg, text="Choose marketplace for previews", style="AmazonTitle.TLabel")\
             .pack(anchor="w", padx=16, pady=(14, 6))
@@ -3104,7 +3519,7 @@ class BullseyeApp:
         wrap.pack(fill="x", padx=16, pady=(0, 8))
         ttk.Label(wrap, text="Marketplace", style="AmazonBody.TLabel").pack(anchor="w")
 
-        values = [f"{country.get(mp, mp)} (MP {mp})" for mp in known_mps]
+        values = list(label_to_mp)
         var = tk.StringVar(value=values[1])  # Default DE(4)
         cb = ttk.Combobox(wrap, state="readonly", values=values, textvariable=var)
         cb.pack(fill="x", pady=(2, 0))
@@ -3113,11 +3528,7 @@ class BullseyeApp:
         result = {"mp": None}
 
         def ok():
-            sel = var.get()
-            for mp in known_mps:
-                if sel.endswith(f"(MP {mp})"):
-                    result["mp"] = mp
-                    break
+            result["mp"] = label_to_mp.get(var.get())
             dlg.destroy()
 
         def cancel():
@@ -3167,9 +3578,8 @@ class BullseyeApp:
                 jobs = [{"campaign": c} for c in campaigns]
 
                 def detect_mp(job):
-                    if isinstance(job.get("marketplaceId"), int):
-                        return job["marketplaceId"]
-                    return self._extract_mp_from_line(job.get("campaign", ""))
+                    mp = job.get("marketplaceId")
+                    return mp if isinstance(mp, int) else self._extract_mp_from_line(job.get("campaign", ""))
 
                 by_mp, unknown_jobs = {}, []
                 for j in jobs:
@@ -3180,47 +3590,53 @@ class BullseyeApp:
                         by_mp.setdefault(int(mp), []).append(j)
 
                 self._prepared_preview_batches = {**by_mp, "unknown": unknown_jobs}
+                self._prepared_preview_remaining = len(jobs)
                 self._preview_mps_sent = set()
 
-            def remaining(batches):
-                return sum(len(v) for k, v in batches.items() if isinstance(k, int)) + len(batches.get("unknown") or [])
-
             def ask_and_send():
                 batches = self._prepared_preview_batches or {}
-                if remaining(batches) == 0:
+                if self._prepared_preview_remaining <= 0:
+                    self._destroy_preview_plan_dialog()
                     self.status_var.set("All prepared previews have been sent.")
                     return
 
                 selection = self._show_preview_plan_dialog(batches)
                 if selection is None:
-                    self.status_var.set(f"Prepared {remaining(batches)} preview(s).")
+                    self.status_var.set(f"Prepared {self._prepared_preview_remaining} preview(s).")
                     return
 
                 selected_mps, unknown_target_mp = selection
 
                 def jobs_for_mp(mp: int) -> list:
-                    base = list(batches.get(mp, []))
+                    # Normalfall: vorhandene Batch-Liste direkt, nur beim Zusammenführen neu bauen
                     if unknown_target_mp == mp and batches.get("unknown"):
-                        base += list(batches["unknown"])
-                    return base
-
-                per_mp = {mp: jobs_for_mp(mp) for mp in selected_mps}
-                total_jobs = sum(len(v) for v in per_mp.values())
+                        return list(itertools.chain(batches.get(mp, ()), batches["unknown"]))
+                    return batches.get(mp, [])
+
+                if len(selected_mps) == 1:
+                    # häufigster Fall: nur ein MP gewählt
+                    mp = next(iter(selected_mps))
+                    batch_jobs = jobs_for_mp(mp)
+                    per_mp = {mp: batch_jobs}
+                    total_jobs = len(batch_jobs)
+                else:
+                    per_mp = {mp: jobs_for_mp(mp) for mp in selected_mps}
+                    total_jobs = sum(len(v) for v in per_mp.values())
                 if total_jobs == 0:
-                    
                     messagebox.showerror("Send Preview", "Keine Jobs für die ausgewählten Marketplaces.")
                     return
 
-                self._set_busy(True)
                 self.progress_var.set(0)
                 self.progress_label.config(text="Starting previews…")
                 self.status_var.set(f"Sending {total_jobs} preview(s) across {len(selected_mps)} MP(s)…")
 
-                import threading, time as _time
                 def worker():
                     out_paths = []
                     processed = 0
-                    start_ts = _time.time()
+                    start_ts = time.time()
+                    post_progress = self._coalesced_progress(
+                        total_jobs, lambda k: self.update_progress(k, total_jobs)
+                    )
                     try:
                         for mp in selected_mps:
                             batch_jobs = per_mp.get(mp, [])
@@ -3228,10 +3644,10 @@ class BullseyeApp:
                                 continue
 
                             def progress_cb(i, _processed=processed):
-                                self.root.after(0, lambda: self.update_progress(_processed + i, total_jobs))
+                                post_progress(_processed + i)
 
                             def status_cb(msg):
-                                self.root.after(0, lambda m=msg: (self.status_var.set(m), self.root.update_idletasks()))
+                                self._post_ui(lambda m=msg: self.status_var.set(m))
 
                             results, out_path = preview_run_batch(
                                 batch_jobs,
@@ -3246,41 +3662,45 @@ class BullseyeApp:
 
                             # Verbrauchte Jobs entfernen + MP markieren
                             self._preview_mps_sent.add(mp)
-                            if mp in self._prepared_preview_batches:
-                                self._prepared_preview_batches.pop(mp, None)
+                            consumed = self._prepared_preview_batches.pop(mp, None)
+                            if consumed:
+                                self._prepared_preview_remaining -= len(consumed)
                             if unknown_target_mp == mp and self._prepared_preview_batches.get("unknown"):
+                                self._prepared_preview_remaining -= len(self._prepared_preview_batches["unknown"])
                                 self._prepared_preview_batches["unknown"].clear()
 
                         def done():
                             self._set_busy(False)
-                            for p in out_paths:
-                                self._add_result_file(p)
-                            elapsed = _time.time() - start_ts
+                            self._add_result_files(out_paths)
+                            elapsed = time.time() - start_ts
                             self.progress_label.config(
                                 text=f"Sent {total_jobs} preview(s) across {len(selected_mps)} MP(s) in {elapsed:.1f}s"
                             )
                             # solange noch was übrig ist -> erneut öffnen
-                            if remaining(self._prepared_preview_batches or {}) > 0:
+                            if self._prepared_preview_remaining > 0:
                                 ask_and_send()
                             else:
+                                self._destroy_preview_plan_dialog()
                                 self.status_var.set("All prepared previews have been sent.")
-                        self.root.after(0, done)
+                        self._post_ui(done)
 
                     except Exception as ex:
-                        def fail():
+                        def fail(ex=ex):
                             self._set_busy(False)
-                            from tkinter import messagebox
                             messagebox.showerror("Send Preview", str(ex))
                             self.status_var.set(f"Error: {ex}")
-                        self.root.after(0, fail)
+                        self._post_ui(fail)
 
-                threading.Thread(target=worker, daemon=True).start()
+                self._set_busy(True)
+                try:
+                    threading.Thread(target=worker, daemon=True).start()
+                except Exception:
+                    self._set_busy(False)
+                    raise
 
             ask_and_send()
 
         except Exception as outer_ex:
-            self._set_busy(False)
-            from tkinter import messagebox
             self.status_var.set(f"Error: {outer_ex}")
             messagebox.showerror("Send Preview", str(outer_ex))
 
@@ -3295,7 +3715,7 @@ class BullseyeApp:
         Läuft im Hintergrund-Thread, UI bleibt responsiv.
         """
         try:
-            alias = ((self.profile or {}).get("alias") or "").strip()
+            alias = self.profile_alias.strip()
             if not alias:
                 
                 messagebox.showerror("Approve Sonar", "Bitte zuerst im Profile deinen Alias hinterlegen.")
@@ -3314,10 +3734,10 @@ class BullseyeApp:
 
             def ui_progress(i):
                 # i = 0-based Index
-                self.root.after(0, lambda: self.update_progress(i, total))
+                self._post_ui(lambda: self.update_progress(i, total))
 
             def ui_status(message):
-                self.root.after(0, lambda: (self.status_var.set(message), self.root.update_idletasks()))
+                self._post_ui(lambda: self.status_var.set(message))
 
             def on_done(out_path):
                 # Ergebnisdatei aufnehmen (falls vorhanden, sonst heuristisch raten)
@@ -3338,22 +3758,14 @@ class BullseyeApp:
                 messagebox.showerror("Approve Sonar", str(err))
                 self._set_busy(False)
 
-            import threading
             def worker():
-                try:
-                    # Backend-Signatur siehe Abschnitt 5 unten
-                    from approve_sonar import run_approve_sonar
-                except Exception as e:
-                    self.root.after(0, lambda: on_error(f"Import failed: {e}"))
-                    return
-
                 try:
                     # Erwartete Rückgabe: (results_list, out_path_str) ODER nur out_path_str
                     ret = run_approve_sonar(
                         campaigns=campaigns,
                         requester_alias=alias,
                         status_callback=ui_status,
-                        progress_callback=lambda i: self.root.after(0, lambda: self.update_progress(i, total)),
+                        progress_callback=ui_progress,
                         headless=self.headless_var.get(),
                         parallel=True,              # Backend darf parallelisieren
                     )
@@ -3366,15 +3778,18 @@ class BullseyeApp:
                                 break
                     elif isinstance(ret, (str, bytes, os.PathLike)):
                         out_path = ret
-                    self.root.after(0, lambda: on_done(out_path))
+                    self._post_ui(lambda: on_done(out_path))
                 except Exception as e:
-                    self.root.after(0, lambda err=e: on_error(err))
+                    self._post_ui(lambda err=e: on_error(err))
 
             self._set_busy(True)
-            threading.Thread(target=worker, daemon=True).start()
+            try:
+                threading.Thread(target=worker, daemon=True).start()
+            except Exception:
+                self._set_busy(False)
+                raise
 
         except Exception as e:
-            self._set_busy(False)
             self.status_var.set(f"Error: {str(e)}")
             
             messagebox.showerror("Approve Sonar", str(e))
@@ -3389,13 +3804,10 @@ class BullseyeApp:
         """
         GUI-Wrapper für 'Create RC Sonar':
         - wählt Template, Template-Path, Excel/CSV
-        - liest die Datei in ein DataFrame
-        - ruft das Backend (create_remote_configs) auf
+        - liest die Datei als Zeilen-Dicts und ruft das Backend
+          (create_remote_configs) in einem Worker-Thread auf
         - zeigt Ergebnisse an und hängt die Datei im UI an
         """
-        import os
-        from tkinter import messagebox
-        import pandas as pd
 
         # 0) Templates vorhanden?
         if not self.templates:
@@ -3414,104 +3826,137 @@ class BullseyeApp:
         file_path = dlg["xlsx_path"]
 
         # 2) Alias prüfen (wird im Backend in requestContext.userName genutzt)
-        alias = ((self.profile or {}).get("alias") or "").strip()
+        alias = self.profile_alias.strip()
         if not alias:
             messagebox.showerror("Create RC Sonar", "Bitte zuerst im Profile deinen Alias hinterlegen.")
             return
 
-        # 3) Datei lesen → DataFrame (Excel oder CSV)
-        try:
-            ext = os.path.splitext(file_path)[1].lower()
-            if ext in (".xlsx", ".xls"):
-                df = pd.read_excel(file_path)
-            elif ext == ".csv":
-                df = pd.read_csv(file_path)
-            else:
-                raise ValueError(f"Unsupported file type: {ext}")
-            df.columns = [str(c).strip() for c in df.columns]
-        except Exception as e:
-            messagebox.showerror("Create RC Sonar", f"Could not read file:\n{file_path}\n\n{e}")
-            return
+        # 3) Status-/Progress-Callbacks fürs UI (aus dem Worker → Tk-Thread)
+        def status_cb(msg: str):
+            self.root.after(0, lambda m=str(msg): self.status_var.set(m))
 
-        # 4) Schnelle Pflichtfeld-Validierung
-        def _has(candidates):
-            lc = [c.lower() for c in df.columns]
-            return any(c.lower() in lc for c in candidates)
-
-        missing = []
-        if not _has(["Name", "Program Name", "ProgramName"]):
-            missing.append("Name")
-        if not _has(["Marketplace", "marketplaceId"]):
-            missing.append("Marketplace")
-        if not _has(["BE ID", "BEID", "be id", "beid"]):
-            missing.append("BE ID")
-        if not _has(["Schedule Start Date", "ScheduleStartDate"]):
-            missing.append("Schedule Start Date")
-        if not _has(["Schedule End Date", "ScheduleEndDate"]):
-            missing.append("Schedule End Date")
-
-        if missing:
-            messagebox.showerror("Create RC Sonar", "Missing required columns:\n - " + "\n - ".join(missing))
-            return
+        def fail(title_msg: str):
+            self._set_busy(False)
+            messagebox.showerror("Create RC Sonar", title_msg)
+
+        def finish(result_df, saved_path):
+            self._set_busy(False)
+
+            # 7) Ergebnisdatei im UI registrieren + kurze Zusammenfassung
+            if saved_path and os.path.exists(saved_path):
+                try:
+                    self._add_result_file(saved_path)
+                except Exception:
+                    pass
 
-        # 5) Status-/Progress-Callbacks fürs UI
-        def status_cb(msg: str):
             try:
-                self.status_var.set(str(msg))
-                self.root.update_idletasks()
+                def _count_true(col):
+                    # direkt auf dem Array zählen statt Series == True
+                    if col not in result_df.columns:
+                        return 0
+                    return int(result_df[col].to_numpy(dtype=bool, copy=False).sum())
+
+                ok_program = _count_true("Program Success")
+                ok_campaign = _count_true("Campaign Success")
+                ok_pairs = min(ok_program, ok_campaign)
+                fail_cnt = len(result_df) - ok_pairs
+                msg = f"Create RC Sonar: {ok_pairs} success, {fail_cnt} failed."
             except Exception:
-                pass
+                msg = "Create RC Sonar finished."
 
-        total_rows = len(df)
+            self.status_var.set(msg)
 
-        def progress_cb(done: int):
+        def worker():
+            # 4) Datei lesen → Zeilen-Dicts (Excel oder CSV)
             try:
-                self.status_var.set(f"[{done}/{total_rows}] processed …")
-                self.root.update_idletasks()
-            except Exception:
-                pass
+                columns, rows = self._read_rc_rows(file_path)
+            except Exception as e:
+                self.root.after(0, lambda e=e: fail(f"Could not read file:\n{file_path}\n\n{e}"))
+                return
 
-        # 6) Backend-Funktion aufrufen
-        self._set_busy(True)
-        try:
-            from create_rc_sonar import create_remote_configs  # Backend
-
-            headless = True  # oder aus Settings übernehmen
-            result_df, saved_path = create_remote_configs(
-                df=df,
-                template=template,
-                template_path=template_path,
-                alias=alias,
-                out_dir=self.datasets_dir,
-                status_callback=status_cb,
-                progress_callback=progress_cb,
-                headless=headless
+            # 5) Schnelle Pflichtfeld-Validierung (Spaltennamen einmal lowercasen)
+            lc = {c.lower() for c in columns}
+            missing = [label for label, cands in RC_REQUIRED_COLUMNS if lc.isdisjoint(cands)]
+            if missing:
+                self.root.after(0, lambda: fail("Missing required columns:\n - " + "\n - ".join(missing)))
+                return
+            if not rows:
+                self.root.after(0, lambda: fail(f"No data rows found in:\n{file_path}"))
+                return
+
+            total_rows = len(rows)
+            progress_cb = self._coalesced_progress(
+                total_rows, lambda done: self.status_var.set(f"[{done}/{total_rows}] processed …")
             )
-        except Exception as e:
-            self._set_busy(False)
-            messagebox.showerror("Create RC Sonar", f"Backend error:\n{e}")
-            return
-        finally:
-            self._set_busy(False)
 
-        # 7) Ergebnisdatei im UI registrieren + kurze Zusammenfassung
-        if saved_path and os.path.exists(saved_path):
+            # 6) Backend-Funktion aufrufen
             try:
-                self._add_result_file(saved_path)
-            except Exception:
-                pass
+                headless = True  # oder aus Settings übernehmen
+                result_df, saved_path = create_remote_configs(
+                    rows=rows,
+                    template=template,
+                    template_path=template_path,
+                    alias=alias,
+                    out_dir=self.datasets_dir,
+                    status_callback=status_cb,
+                    progress_callback=progress_cb,
+                    headless=headless
+                )
+            except Exception as e:
+                self.root.after(0, lambda e=e: fail(f"Backend error:\n{e}"))
+                return
 
-        try:
-            ok_program = (result_df["Program Success"] == True).sum() if "Program Success" in result_df.columns else 0
-            ok_campaign = (result_df["Campaign Success"] == True).sum() if "Campaign Success" in result_df.columns else 0
-            ok_pairs = min(ok_program, ok_campaign)
-            fail_cnt = len(result_df) - ok_pairs
-            msg = f"Create RC Sonar: {ok_pairs} success, {fail_cnt} failed."
-        except Exception:
-            msg = "Create RC Sonar finished."
+            self.root.after(0, lambda: finish(result_df, saved_path))
+
+        self._set_busy(True)
+        self.status_var.set("Reading file …")
+        threading.Thread(target=worker, daemon=True).start()
 
-        self.status_var.set(msg)
 
+    def _read_rc_rows(self, file_path):
+        """
+        Liest die Create-RC-Datei direkt als Zeilen-Dicts (ohne DataFrame).
+        Nur Spalten aus RC_NEEDED_COLUMNS, Header gestrippt, komplett leere Zeilen übersprungen.
+        Rückgabe: (spalten, rows)
+        """
+        ext = os.path.splitext(file_path)[1].lower()
+        if ext == ".csv":
+            with open(file_path, newline="", encoding="utf-8-sig") as f:
+                reader = csv.reader(f)
+                header = next(reader, [])
+                records = list(reader)
+        elif ext == ".xlsx":
+            from openpyxl import load_workbook
+            wb = load_workbook(file_path, read_only=True, data_only=True)
+            try:
+                # erstes Sheet wie zuvor bei pd.read_excel – nicht das beim Speichern aktive
+                it = wb.worksheets[0].iter_rows(values_only=True)
+                header = next(it, ())
+                records = list(it)
+            finally:
+                wb.close()
+        elif ext == ".xls":
+            # openpyxl kann kein .xls – hier bleibt pandas
+            df = pd.read_excel(file_path, dtype=str, engine=PD_EXCEL_ENGINE)
+            header = list(df.columns)
+            records = df.itertuples(index=False, name=None)
+        else:
+            raise ValueError(f"Unsupported file type: {ext}")
+
+        # Spaltenindex einmal bestimmen; alles außerhalb RC_NEEDED_COLUMNS verwerfen
+        keep = [(i, str(h).strip()) for i, h in enumerate(header)
+                if h is not None and str(h).strip().lower() in RC_NEEDED_COLUMNS]
+        rows = []
+        for rec in records:
+            row = {}
+            for i, name in keep:
+                v = rec[i] if i < len(rec) else None
+                if v is None or v == "" or (isinstance(v, float) and v != v):
+                    continue
+                row[name] = v
+            if row:
+                rows.append(row)
+        return [name for _, name in keep], rows
 
     def _show_create_rc_dialog(self):
         """
@@ -3521,22 +3966,8 @@ class BullseyeApp:
           - Excel/CSV wählen
         Rückgabe: {"template": dict, "template_path": str, "xlsx_path": str} oder None
         """
-        import tkinter as tk
-        from tkinter import ttk, filedialog, messagebox
 
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Create RC Sonar (Program + Version)")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("620x420")
-        dlg.minsize(600, 380)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        # center
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Create RC Sonar (Program + Version)", 620, 420, minw=600, minh=380)
 
         body = ttk.Frame(dlg, style="Amazon.TFrame")
         body.pack(fill="both", expand=True, padx=16, pady=12)
@@ -3545,7 +3976,7 @@ class BullseyeApp:
 
         # Template Auswahl
         ttk.Label(body, text="Template", style="AmazonBody.TLabel").grid(row=0, column=0, sticky="w")
-        tpl_names = [t.get("name", f"Template {i+1}") for i, t in enumerate(self.templates)]
+        tpl_names, tpl_by_name = self._template_index()
         tpl_var = tk.StringVar(value=(tpl_names[0] if tpl_names else ""))
         cb = ttk.Combobox(body, state="readonly", values=tpl_names, textvariable=tpl_var)
         cb.grid(row=1, column=0, columnspan=2, sticky="ew", pady=(0, 10))
@@ -3595,10 +4026,8 @@ class BullseyeApp:
             if not tpl_names:
                 messagebox.showerror("Create RC Sonar", "No templates.")
                 return
-            name = tpl_var.get().strip()
-            try:
-                idx = tpl_names.index(name)
-            except ValueError:
+            tpl = tpl_by_name.get(tpl_var.get().strip())
+            if tpl is None:
                 messagebox.showerror("Create RC Sonar", "Please select a template.")
                 return
             tpath = (tpl_path_var.get() or "").strip()
@@ -3613,7 +4042,7 @@ class BullseyeApp:
                 messagebox.showerror("Create RC Sonar", f"File not found:\n{p}")
                 return
 
-            result["template"] = self.templates[idx]
+            result["template"] = tpl
             result["template_path"] = tpath
             result["xlsx_path"] = p
             dlg.destroy()
@@ -3640,13 +4069,7 @@ class BullseyeApp:
             return None
 
         # 10-stellige IDs extrahieren, Reihenfolge beibehalten, Duplikate entfernen
-        ids = re.findall(r'\b\d{10}\b', raw_input)
-        seen = set()
-        segment_ids = []
-        for i in ids:
-            if i not in seen:
-                seen.add(i)
-                segment_ids.append(i)
+        segment_ids = list(dict.fromkeys(_BE_ID_RE.findall(raw_input)))
 
         if not segment_ids:
             messagebox.showerror("Error", "No valid segment IDs found!\nIDs must be 10 digits.")
@@ -3659,38 +4082,83 @@ class BullseyeApp:
 
 
 
-    def _make_scrollable_checks(self, parent, labels):
+    def _make_scrollable_checks(self, parent, labels, empty_text=None):
         """
-        Erzeugt eine scrollbare Liste von Checkbuttons.
+        Erzeugt eine scrollbare Checkliste – ein einziges Canvas statt einem
+        Checkbutton-Widget pro Label (Glyph ☐/☑ + Text je Zeile, Klick toggelt).
+        Tastatur wie bei Checkbuttons: Tab fokussiert, ↑/↓ wählt die Zeile, Leertaste toggelt.
         Rückgabe: (frame, vars) – frame in Grid/Pack einsetzen, vars ist Liste[tk.BooleanVar].
+        Ohne Labels wird nur ein Hinweis-Label (empty_text) erzeugt, vars ist dann leer.
         """
+        if not labels:
+            return ttk.Label(parent, text=empty_text or "", style="AmazonMuted.TLabel", anchor="nw"), []
+
+        row_h = 22
+
         # Canvas + Scrollbar
         wrap = ttk.Frame(parent, style="Amazon.TFrame")
-        canvas = tk.Canvas(wrap, bg=self.AMAZON["bg"], highlightthickness=0, bd=0)
+        # Fokusrahmen nur bei Tastaturfokus sichtbar (highlightbackground = Hintergrund)
+        canvas = tk.Canvas(wrap, bg=self.AMAZON["bg"], bd=0, takefocus=1, highlightthickness=1,
+                           highlightbackground=self.AMAZON["bg"], highlightcolor=self.AMAZON["link"])
         vsb = ttk.Scrollbar(wrap, orient="vertical", style="Amazon.Vertical.TScrollbar", command=canvas.yview)
-        canvas.configure(yscrollcommand=vsb.set)
-
-        inner = ttk.Frame(canvas, style="Amazon.TFrame")
-        inner_id = canvas.create_window((0, 0), window=inner, anchor="nw")
-
-        def _on_configure(_=None):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            # Breite anpassen, damit keine abgeschnittenen Checkbuttons
-            canvas.itemconfigure(inner_id, width=canvas.winfo_width())
-
-        inner.bind("<Configure>", _on_configure)
-        wrap.bind("<Configure>", _on_configure)
+        canvas.configure(yscrollcommand=vsb.set, scrollregion=(0, 0, 0, len(labels) * row_h))
 
         canvas.pack(side="left", fill="both", expand=True)
         vsb.pack(side="right", fill="y")
 
-        vars_ = []
-        for text in labels:
+        fg = self.AMAZON["text"]
+        # Markierung der Tastatur-Zeile (liegt unter dem Text, erst bei Fokus sichtbar)
+        cursor = {"row": 0}
+        marker = canvas.create_rectangle(0, 0, 0, row_h, outline="", fill=self.AMAZON["border"], state="hidden")
+        vars_, glyphs = [], []
+        for row, text in enumerate(labels):
+            y = row * row_h + row_h // 2
+            glyphs.append(canvas.create_text(8, y, text="☐", anchor="w", fill=fg))
+            canvas.create_text(28, y, text=text, anchor="w", fill=fg)
             v = tk.BooleanVar(value=False)
-            cb = ttk.Checkbutton(inner, text=text, variable=v, style="Amazon.TCheckbutton")
-            cb.pack(anchor="w", pady=2)
+            # nur das Glyph dieser Zeile neu setzen (auch bei v.set() von außen)
+            v.trace_add("write", lambda *_, r=row: canvas.itemconfigure(
+                glyphs[r], text="☑" if vars_[r].get() else "☐"))
             vars_.append(v)
 
+        def _show_cursor(_=None):
+            r = cursor["row"]
+            canvas.coords(marker, 0, r * row_h, canvas.winfo_width(), (r + 1) * row_h)
+            canvas.itemconfigure(marker, state="normal")
+            # Zeile in den sichtbaren Bereich scrollen
+            top, bottom = canvas.canvasy(0), canvas.canvasy(canvas.winfo_height())
+            total = len(vars_) * row_h
+            if r * row_h < top:
+                canvas.yview_moveto(r * row_h / total)
+            elif (r + 1) * row_h > bottom:
+                canvas.yview_moveto(((r + 1) * row_h - (bottom - top)) / total)
+
+        def _move(delta):
+            cursor["row"] = max(0, min(len(vars_) - 1, cursor["row"] + delta))
+            _show_cursor()
+            return "break"
+
+        def _toggle_current(_=None):
+            v = vars_[cursor["row"]]
+            v.set(not v.get())
+            return "break"
+
+        def _on_click(event):
+            row = int(canvas.canvasy(event.y) // row_h)
+            if 0 <= row < len(vars_):
+                vars_[row].set(not vars_[row].get())
+                cursor["row"] = row
+            canvas.focus_set()
+
+        canvas.bind("<Button-1>", _on_click)
+        canvas.bind("<FocusIn>", _show_cursor)
+        canvas.bind("<FocusOut>", lambda e: canvas.itemconfigure(marker, state="hidden"))
+        canvas.bind("<Up>", lambda e: _move(-1))
+        canvas.bind("<Down>", lambda e: _move(1))
+        canvas.bind("<Home>", lambda e: _move(-len(vars_)))
+        canvas.bind("<End>", lambda e: _move(len(vars_)))
+        canvas.bind("<space>", _toggle_current)
+
         return wrap, vars_
 
 
@@ -3714,8 +4182,7 @@ class BullseyeApp:
 
             total = len(segment_ids)
 
-            def ui_progress(i):
-                self.root.after(0, lambda: self.update_progress(i, total))
+            ui_progress = self._coalesced_progress(total, lambda i: self.update_progress(i, total))
 
             def ui_status(message):
                 def _update():
@@ -3724,7 +4191,7 @@ class BullseyeApp:
                     if stats:
                         self.collected_stats.update(stats)
                         self.update_metrics(total_time=time.time() - start_time, stats=self.collected_stats)
-                self.root.after(0, _update)
+                self._post_ui(_update)
 
             def on_done(result):
                 self._set_busy(False)
@@ -3744,7 +4211,6 @@ class BullseyeApp:
                 self.status_var.set(f"Error: {err}")
                 messagebox.showerror("Error", str(err))
 
-            import threading
             def run():
                 try:
                     result = get_segment_sizes(
@@ -3753,9 +4219,9 @@ class BullseyeApp:
                         progress_callback=ui_progress,
                         headless=self.headless_var.get()
                     )
-                    self.root.after(0, lambda: on_done(result))
+                    self._post_ui(lambda: on_done(result))
                 except Exception as e:
-                    self.root.after(0, lambda err=e: on_error(err))
+                    self._post_ui(lambda err=e: on_error(err))
 
             threading.Thread(target=run, daemon=True).start()
 
@@ -3770,7 +4236,7 @@ class BullseyeApp:
 
 
     def extract_rules(self, segment_ids):
-        """Run extract_rules in a worker thread; UI stays responsive."""
+        """Run extract_rules on the job worker; UI stays responsive."""
         try:
             self._set_busy(True)
             start_time = time.time()
@@ -3787,18 +4253,14 @@ class BullseyeApp:
             total = len(segment_ids)
 
             def ui_progress(i):
-                self.root.after(0, lambda: self.update_progress(i, total))
+                self._post_progress(i, total)
 
             def ui_status(message):
-                def _update():
-                    self.status_var.set(message)
-                    stats = self.parse_performance_stats(message)
-                    if stats:
-                        self.collected_stats.update(stats)
-                        self.update_metrics(total_time=time.time() - start_time, stats=self.collected_stats)
-                self.root.after(0, _update)
+                self._post_status(message, metrics_since=start_time)
 
             def on_done(results):
+                self._drop_pending_progress()
+                self._flush_status()  # ausstehende Meldung/Metrics vor dem Abschlusstext
                 self._set_busy(False)
                 if results is not None:
                     dfs, filename = results
@@ -3812,11 +4274,12 @@ class BullseyeApp:
                     messagebox.showerror("Error", "Operation failed.")
 
             def on_error(err):
+                self._drop_pending_progress()
+                self._flush_status()  # ausstehende Meldung/Metrics vor dem Abschlusstext
                 self._set_busy(False)
                 self.status_var.set(f"Error: {err}")
                 messagebox.showerror("Error", str(err))
 
-            import threading
             def run():
                 try:
                     results = run_extract_rules(
@@ -3829,7 +4292,7 @@ class BullseyeApp:
                 except Exception as e:
                     self.root.after(0, lambda err=e: on_error(err))
 
-            threading.Thread(target=run, daemon=True).start()
+            self._submit_job(run)
 
         except Exception as e:
             self._set_busy(False)
@@ -3840,7 +4303,7 @@ class BullseyeApp:
 
 
     def queue_segments(self, segment_ids):
-        """Run queue_segments in a worker thread; UI stays responsive."""
+        """Run queue_segments on the job worker; UI stays responsive."""
         try:
             self._set_busy(True)
             start_time = time.time()
@@ -3857,18 +4320,14 @@ class BullseyeApp:
             total = len(segment_ids)
 
             def ui_progress(i):
-                self.root.after(0, lambda: self.update_progress(i, total))
+                self._post_progress(i, total)
 
             def ui_status(message):
-                def _update():
-                    self.status_var.set(message)
-                    stats = self.parse_performance_stats(message)
-                    if stats:
-                        self.collected_stats.update(stats)
-                        self.update_metrics(total_time=time.time() - start_time, stats=self.collected_stats)
-                self.root.after(0, _update)
+                self._post_status(message, metrics_since=start_time)
 
             def on_done(results):
+                self._drop_pending_progress()
+                self._flush_status()  # ausstehende Meldung/Metrics vor dem Abschlusstext
                 self._set_busy(False)
                 if results is not None:
                     df, filename = results
@@ -3882,11 +4341,12 @@ class BullseyeApp:
                     messagebox.showerror("Error", "Operation failed.")
 
             def on_error(err):
+                self._drop_pending_progress()
+                self._flush_status()  # ausstehende Meldung/Metrics vor dem Abschlusstext
                 self._set_busy(False)
                 self.status_var.set(f"Error: {err}")
                 messagebox.showerror("Error", str(err))
 
-            import threading
             def run():
                 try:
                     results = run_queue_segments(
@@ -3899,7 +4359,7 @@ class BullseyeApp:
                 except Exception as e:
                     self.root.after(0, lambda err=e: on_error(err))
 
-            threading.Thread(target=run, daemon=True).start()
+            self._submit_job(run)
 
         except Exception as e:
             self._set_busy(False)
@@ -3917,7 +4377,6 @@ class BullseyeApp:
         try:
             self._show_update_content_dialog()
         except Exception as e:
-            self._set_busy(False)
             self.status_var.set(f"Error: {e}")
             messagebox.showerror("Update Content", str(e))
 
@@ -3933,23 +4392,8 @@ class BullseyeApp:
           Reihenfolge egal. Pro Zeile wird ein Job gebaut.
         - Falls KEINE Excel ausgewählt ist, bleibt der manuelle Modus (Kampagnen-Textbox + Datasets).
         """
-        import tkinter as tk
-        from tkinter import ttk, messagebox, filedialog
-        import json as _json
 
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Update Content (Sonar)")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("860x620")
-        dlg.minsize(820, 560)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        # center
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Update Content (Sonar)", 860, 620, minw=820, minh=560)
 
         # Top-Level auf Grid umstellen – Row 1 (Body) wächst, Row 2 (Buttons) bleibt fix
         dlg.grid_rowconfigure(1, weight=1)
@@ -4041,8 +4485,10 @@ class BullseyeApp:
         camp_text.grid(row=1, column=0, sticky="nsew", padx=(0, 8))
 
         sonar_sets = self.filter_datasets("SONAR")
-        sonar_names = [ds.get("name", "Unnamed") for ds in sonar_sets] or ["No SONAR datasets yet"]
-        ds_frame, ds_vars = self._make_scrollable_checks(two_col, sonar_names)
+        sonar_names = [ds.get("name", "Unnamed") for ds in sonar_sets]
+        # Datasets ändern sich nicht, solange der Dialog offen ist → Items einmal holen
+        ds_items_cache = [self.ds_items(ds, "SONAR") for ds in sonar_sets]
+        ds_frame, ds_vars = self._make_scrollable_checks(two_col, sonar_names, empty_text="No SONAR datasets yet")
         ds_frame.grid(row=1, column=1, sticky="nsew", padx=(8, 0))
 
         # --- Advanced: supportedLanguages + Detected
@@ -4058,11 +4504,10 @@ class BullseyeApp:
 
         # Helpers für Detection
         def _collect_campaign_lines() -> list[str]:
-            lines = [l.strip() for l in camp_text.get("1.0", "end").splitlines() if l.strip()]
-            if sonar_sets and any(v.get() for v in ds_vars):
-                for i, v in enumerate(ds_vars):
-                    if v.get():
-                        lines.extend(self.ds_items(sonar_sets[i], "SONAR"))
+            lines = _tokenize_lines(camp_text.get("1.0", "end"))
+            for i, v in enumerate(ds_vars):
+                if v.get():
+                    lines.extend(ds_items_cache[i])
             return lines
 
         def _refresh_detection(*_):
@@ -4083,26 +4528,36 @@ class BullseyeApp:
                 if mp is None:
                     chips.append(f"Unknown × {n}")
                 else:
-                    lang = data["lang"] or "?"
-                    country = {3: "UK", 4: "DE", 5: "FR", 35691: "IT", 44551: "ES"}.get(mp, str(mp))
-                    chips.append(f"{country} ({lang}) × {n}")
+                    chips.append(f"{MP_COUNTRY.get(mp, mp)} ({data['lang'] or '?'}) × {n}")
 
             detected_var.set("Detected: " + (", ".join(chips) if chips else "–"))
 
             known_mps = [mp for mp in groups.keys() if mp is not None]
             has_unknown = any(mp is None for mp in groups.keys())
             if len(known_mps) == 1 and not has_unknown:
-                only_mp = known_mps[0]
-                lang = self._language_for_mp(only_mp)
+                lang = groups[known_mps[0]]["lang"]  # schon beim Gruppieren ermittelt
                 langs_entry.configure(state="normal")
-                langs_var.set(_json.dumps([lang] if lang else []))
+                langs_var.set(json.dumps([lang] if lang else []))
                 langs_entry.configure(state="readonly")
             else:
                 langs_entry.configure(state="normal")
                 langs_var.set("[]")
                 langs_entry.configure(state="readonly")
 
-        camp_text.bind("<KeyRelease>", _refresh_detection)
+        # Tippen: Detection erst nach ~150 ms Ruhe (statt bei jedem Tastendruck)
+        detect_job = {"id": None}
+
+        def _run_scheduled_refresh():
+            detect_job["id"] = None
+            if dlg.winfo_exists():
+                _refresh_detection()
+
+        def _schedule_refresh(_=None):
+            if detect_job["id"] is not None:
+                dlg.after_cancel(detect_job["id"])
+            detect_job["id"] = dlg.after(DETECT_DEBOUNCE_MS, _run_scheduled_refresh)
+
+        camp_text.bind("<KeyRelease>", _schedule_refresh)
         for v in ds_vars:
             v.trace_add("write", lambda *_: _refresh_detection())
         _refresh_detection()
@@ -4146,7 +4601,7 @@ class BullseyeApp:
 
                 groups = self._group_campaigns_by_mp(lines)
                 try:
-                    fallback_langs = _json.loads((langs_var.get() or "[]").strip() or "[]")
+                    fallback_langs = json.loads((langs_var.get() or "[]").strip() or "[]")
                     if not isinstance(fallback_langs, list):
                         raise ValueError
                 except Exception:
@@ -4191,43 +4646,48 @@ class BullseyeApp:
             self._set_busy(True)
             self.status_var.set("Updating campaign content…")
 
-            import threading, time as _time
-            start_ts = _time.time()
+            start_ts = time.time()
             total_items = len(jobs)
 
             def status_cb(msg):
-                self.root.after(0, lambda: self.status_var.set(msg))
+                self._post_status(msg)
 
             def worker():
-                try:
-                    from update_campaign_content import run_update_campaign_content
-                except Exception as e:
-                    err = str(e)
-                    self.root.after(0, lambda: (
-                        self._set_busy(False),
-                        messagebox.showerror("Update Content", f"Import failed:\n{err}")
-                    ))
-                    return
-
                 out_paths = []
+                headless = self.headless_var.get()
+
+                def run_one(idx, j):
+                    status_cb(f"Updating {idx+1}/{total_items} … {j['supported_languages']}")
+                    return run_update_content(
+                        job=j,
+                        status_callback=status_cb,
+                        progress_callback=lambda _i: None,
+                        headless=headless
+                    )
+
                 try:
-                    for idx, j in enumerate(jobs):
-                        status_cb(f"Updating {idx+1}/{total_items} … {j['supported_languages']}")
-                        out_path_tuple = run_update_campaign_content(
-                            job=j,
-                            status_callback=status_cb,
-                            progress_callback=lambda _i: None,
-                            headless=self.headless_var.get()
-                        )
-                        out_paths.append(out_path_tuple[1] if isinstance(out_path_tuple, (list, tuple)) else out_path_tuple)
-                        self.root.after(0, lambda k=idx: self.update_progress(k, total_items))
+                    # Jobs sind unabhängige POSTs → gebündelt parallel, Ergebnisse in Abschluss-Reihenfolge
+                    status_cb(f"Updating {total_items} campaign(s) ({self.update_concurrency} parallel) …")
+                    with ThreadPoolExecutor(max_workers=self.update_concurrency) as ex:
+                        futs = [ex.submit(run_one, idx, j) for idx, j in enumerate(jobs)]
+                        done_count = 0
+                        try:
+                            for fut in as_completed(futs):
+                                out_path_tuple = fut.result()
+                                out_paths.append(out_path_tuple[1] if isinstance(out_path_tuple, (list, tuple)) else out_path_tuple)
+                                done_count += 1
+                                self._post_progress(done_count - 1, total_items)
+                        except Exception:
+                            # wie bisher beim ersten Fehler abbrechen: noch nicht gestartete Jobs verwerfen
+                            for f in futs:
+                                f.cancel()
+                            raise
 
                     def done():
+                        self._drop_pending_progress()
                         self._set_busy(False)
-                        for p in out_paths:
-                            if p:
-                                self._add_result_file(p)
-                        elapsed = _time.time() - start_ts
+                        self._add_result_files([p for p in out_paths if p])
+                        elapsed = time.time() - start_ts
                         self.progress_label.config(text=f"Updated {total_items} campaign(s) in {elapsed:.1f}s")
                         messagebox.showinfo("Update Content", "Finished. Results saved.")
                         try:
@@ -4244,7 +4704,7 @@ class BullseyeApp:
                         messagebox.showerror("Update Content", m)
                     ))
 
-            threading.Thread(target=worker, daemon=True).start()
+            self._submit_job(worker)
 
             # Dialog sofort schließen – Fortschritt im Hauptfenster
             try:
@@ -4263,232 +4723,58 @@ class BullseyeApp:
 
 
 
-    def _parse_extra_variables(self, raw_text: str):
+    def _cached_excel_rows(self, path: str, reader, st=None) -> list[dict]:
         """
-        Akzeptiert:
-          - JSON-Objekt: {"key":"val","obj":{"a":1},"arr":[1,2]}
-          - ODER Zeilen im Format: name=value
-            (value bleibt als String; JSON-erkennbare Werte wie {…} oder […] werden geparst)
-        Liefert dict[str, (str|dict|list)] zurück.
+        Zeilen einer Excel/CSV über reader(path) lesen – gecacht pro (Pfad, mtime, Größe),
+        d. h. dieselbe unveränderte Datei wird nur einmal geparst. Rückgabe ist eine Kopie.
+        st: bereits vorhandenes os.stat-Ergebnis (spart den zweiten stat-Aufruf).
         """
-        text = (raw_text or "").strip()
-        if not text:
-            return {}
-
-        try:
-            val = json.loads(text)
-            if isinstance(val, dict):
-                return val
-        except Exception:
-            pass
-
-        out = {}
-        for ln in text.splitlines():
-            if not ln.strip():
-                continue
-            if "=" not in ln:
-                raise ValueError(f"Zeile ohne '=' gefunden: {ln!r}")
-            name, value = ln.split("=", 1)
-            name = name.strip()
-            value = value.strip()
-            if not name:
-                raise ValueError(f"Leerer Variablenname in Zeile: {ln!r}")
-            if (value.startswith("{") and value.endswith("}")) or (value.startswith("[") and value.endswith("]")):
-                try:
-                    out[name] = json.loads(value)
-                    continue
-                except Exception:
-                    pass
-            out[name] = value
-        return out
-
-
-
-    def _read_update_excel(self, path: str) -> list[dict]:
+        if st is None:
+            st = os.stat(path)
+        key = (reader.__name__, os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        with self._xlsx_cache_lock:
+            rows = self._xlsx_cache.get(key)
+            if rows is not None:
+                self._xlsx_cache.move_to_end(key)
+        if rows is None:
+            rows = reader(path)
+            with self._xlsx_cache_lock:
+                self._xlsx_cache[key] = rows
+                while len(self._xlsx_cache) > XLSX_CACHE_SIZE:
+                    self._xlsx_cache.popitem(last=False)
+        return [dict(r) for r in rows]
+
+    def _xlsx_records(self, path: str, convert) -> list[dict]:
         """
-        Liest .xlsx → list[dict] mit ORIGINALEN Spaltennamen (Case bleibt erhalten).
-        Pandas bevorzugt, openpyxl als Fallback.
+        .xlsx (calamine bzw. openpyxl, siehe _iter_xlsx_rows) → list[dict] mit Original-Headern (gestrippt).
+        Spalten ohne Header und komplett leere Zeilen werden übersprungen; convert(v) je Zelle.
         """
+        it = _iter_xlsx_rows(path)
+        header = next(it, ())
+        # Spalten-Allowlist einmal vor der Zeilenschleife
+        cols = [(j, str(h).strip()) for j, h in enumerate(header) if h is not None and str(h).strip()]
         rows = []
-        # 1) pandas
-        try:
-            import pandas as pd
-            df = pd.read_excel(path)
-            for _, row in df.iterrows():
-                d = {}
-                rd = row.to_dict()
-                for k, v in rd.items():
-                    key = (str(k) if k is not None else "").strip()  # KEIN .lower()
-                    if not key:
-                        continue
-                    if hasattr(pd, "isna") and pd.isna(v):
-                        v = ""
-                    d[key] = v
-                rows.append(d)
-            return rows
-        except Exception:
-            pass
-
-        # 2) openpyxl
-        try:
-            from openpyxl import load_workbook
-            wb = load_workbook(filename=path, read_only=True, data_only=True)
-            ws = wb.active
-            headers = []
-            for i, row in enumerate(ws.iter_rows(values_only=True)):
-                if i == 0:
-                    headers = [(str(c).strip() if c is not None else "") for c in row]
-                    continue
-                d = {}
-                for j, val in enumerate(row):
-                    key = headers[j] if j < len(headers) else f"col{j+1}"
-                    if key:
-                        d[key] = "" if val is None else val
-                rows.append(d)
-            wb.close()
-            return rows
-        except Exception as e:
-            raise RuntimeError(f"Could not read Excel:\n{path}\n\n{e}")
-
-    def _get_ci(self, row: dict, *names):
-        """
-        Case-insensitive Feldzugriff: gibt den ersten Treffer zurück (Wert),
-        wenn einer der 'names' als Key (egal in welchem Case) existiert.
-        """
-        lowmap = {str(k).strip().lower(): k for k in row.keys()}
-        for n in names:
-            k = lowmap.get(str(n).strip().lower())
-            if k is not None:
-                return row.get(k)
-        return None
-
-    def _pick_campaign_cell(self, row: dict) -> str:
-        """
-        Akzeptierte Spaltennamen (case-insensitiv) für die Kampagne:
-        'Sonar Link', 'campaign', 'campaignId', 'url', 'sonarlink', 'link'
-        """
-        val = self._get_ci(row, "Sonar Link", "campaign", "campaignId", "url", "sonarlink", "link")
-        return "" if val in (None, "") else str(val).strip()
-
-    def _derive_langs_from_row(self, row: dict, ui_fallback_langs: list[str]) -> list[str]:
-        """
-        Ermittelt supportedLanguages für einen Excel-Datensatz:
-        1) Spalte 'supportedLanguages' (JSON-Array) – falls vorhanden
-        2) 'marketplaceId' → Mapping zu Sprache
-        3) MP aus Sonar-Link '#/<mp>/...' → Sprache
-        4) UI-Fallback (langs_var aus Dialog)
-        """
-        # 1) explicit supportedLanguages
-        sl = self._get_ci(row, "supportedLanguages")
-        if sl not in (None, ""):
-            try:
-                if isinstance(sl, list):
-                    return [str(x) for x in sl]
-                if isinstance(sl, str):
-                    val = json.loads(sl)
-                    if isinstance(val, list):
-                        return [str(x) for x in val]
-            except Exception:
-                pass
-
-        # 2) marketplaceId
-        mp_raw = self._get_ci(row, "marketplaceId")
-        try:
-            if mp_raw not in (None, ""):
-                mp = int(str(mp_raw).strip())
-                lang = self._language_for_mp(mp)
-                if lang:
-                    return [lang]
-        except Exception:
-            pass
+        for rec in it:
+            n = len(rec)
+            cells = [rec[j] if j < n else None for j, _ in cols]
+            if all(v is None or v == "" for v in cells):
+                continue
+            rows.append({name: convert(v) for (_, name), v in zip(cols, cells)})
+        return rows
 
-        # 3) extract from Sonar link
-        camp = self._pick_campaign_cell(row)
-        mp = self._extract_mp_from_line(camp)
-        if mp:
-            lang = self._language_for_mp(mp)
-            if lang:
-                return [lang]
-
-        # 4) UI fallback
-        return list(ui_fallback_langs or [])
-
-    def _build_jobs_from_update_excel(
-        self,
-        rows: list[dict],
-        template_path: str,
-        ui_fallback_langs: list[str],
-        use_json_vars: bool
-    ) -> list[dict]:
+    @staticmethod
+    def _frame_records(df, key) -> list[dict]:
         """
-        Baut pro Excel-Zeile genau EINEN Job.
-        Reservierte Spalten (case-insensitiv) werden NICHT als Variable an die API geschickt:
-          - 'Sonar Link', 'campaign', 'campaignId', 'url', 'sonarlink', 'link'
-          - 'supportedLanguages', 'marketplaceId', 'useJsonVariables'
-        Alle anderen Spalten werden 1:1 als Variables übernommen (Key = Original-Spaltenname).
-        JSON in Zellen (beginnend mit '{' oder '[') wird gepaart; Zahlen/Booleans bleiben Zahlen/Booleans.
+        DataFrame → list[dict] in einem spaltenweisen Durchlauf (NaN → "").
+        key(str(col)) normalisiert die Header; leere Header werden verworfen.
+        Kein iterrows()/Series pro Zeile.
         """
-        reserved_lower = {
-            "sonar link", "campaign", "campaignid", "url", "sonarlink", "link",
-            "supportedlanguages", "marketplaceid", "usejsonvariables"
-        }
-
-        def _should_skip(col_name: str) -> bool:
-            return str(col_name).strip().lower() in reserved_lower
-
-        def _coerce_value(v):
-            # schon richtige Typen durchlassen
-            if isinstance(v, (dict, list, bool, int, float)):
-                return v
-            s = str(v).strip()
-            if not s:
-                return ""
-            # JSON?
-            if (s.startswith("{") and s.endswith("}")) or (s.startswith("[") and s.endswith("]")):
-                try:
-                    return json.loads(s)
-                except Exception:
-                    pass
-            # Zahlen?
-            try:
-                if s.isdigit() or (s.startswith("-") and s[1:].isdigit()):
-                    return int(s)
-                # float?
-                if any(ch in s for ch in (".", ",")):
-                    s2 = s.replace(",", ".")
-                    return float(s2)
-            except Exception:
-                pass
-            # true/false?
-            if s.lower() in ("true", "false"):
-                return s.lower() == "true"
-            return s  # als String
-
-        jobs: list[dict] = []
-        for i, r in enumerate(rows, start=1):
-            campaign_entry = self._pick_campaign_cell(r)
-            if not campaign_entry:
-                raise ValueError(f"Row {i}: missing 'Sonar Link' (or campaign/url/campaignId).")
-
-            langs = self._derive_langs_from_row(r, ui_fallback_langs)
-
-            extra: dict = {}
-            for col, val in r.items():
-                if not str(col).strip():
-                    continue
-                if _should_skip(col):
-                    continue
-                extra[str(col)] = _coerce_value(val)
-
-            job = {
-                "campaigns": [campaign_entry],     # genau 1 Kampagne pro Zeile
-                "template_path": template_path,
-                "supported_languages": langs,
-                "use_json_variables": bool(use_json_vars),
-                "extra_variables": extra,
-            }
-            jobs.append(job)
-        return jobs
+        names = [key(str(c)) for c in df.columns]
+        keep = [j for j, n in enumerate(names) if n]
+        sub = df.iloc[:, keep]
+        headers = [names[j] for j in keep]
+        arr = sub.where(sub.notna(), "").to_numpy(dtype=object)
+        return [dict(zip(headers, r)) for r in arr.tolist()]
 
 
 
@@ -4519,23 +4805,45 @@ class BullseyeApp:
         template = dlg_data["template"]
         xlsx_path = dlg_data["xlsx_path"]
 
-        try:
-            rows = self._read_campaign_excel(xlsx_path)
-        except Exception as e:
-            messagebox.showerror("Create OS Sonar", f"Could not read Excel:\n{xlsx_path}\n\n{e}")
-            return
+        # Excel lesen/validieren/Jobs bauen im Worker – große Sheets blockieren sonst den Tk-Mainloop
+        self._set_busy(True)
+        self.progress_var.set(0)
+        self.progress_label.config(text="Reading Excel…")
+        self.status_var.set(f"Reading {os.path.basename(xlsx_path)}…")
 
-        try:
-            rows_ok = self._validate_campaign_rows(rows)
-        except Exception as e:
-            messagebox.showerror("Create OS Sonar", str(e))
-            return
+        def fail(msg):
+            self._set_busy(False)
+            self.progress_label.config(text="")
+            messagebox.showerror("Create OS Sonar", msg)
 
-        # Jobs bauen
-        jobs = self._build_jobs_from_rows(rows_ok, template)
+        def rows_read(n):
+            self.progress_label.config(text=f"Reading Excel… {n} row(s)")
 
-        # Ausführen (Stub; ersetzt wir im nächsten Schritt durch echte API)
-        self._run_create_os_sonar(jobs)
+        def read_campaign_rows(path):
+            # Lesen + Validieren; Ergebnis gecacht pro (Pfad, mtime, Größe) → erneutes Submit ohne Parse
+            return self._validate_campaign_rows(
+                self._iter_campaign_rows(path),
+                progress_callback=lambda n: self._post_ui(lambda: rows_read(n)),
+            )
+
+        def worker():
+            try:
+                rows_ok = self._cached_excel_rows(xlsx_path, read_campaign_rows, st=dlg_data.get("xlsx_stat"))
+                # Jobs bauen
+                jobs = self._build_jobs_from_rows(rows_ok, template)
+            except RuntimeError as e:
+                # Lesefehler aus _iter_campaign_rows
+                self._post_ui(lambda m=f"Could not read Excel:\n{xlsx_path}\n\n{e}": fail(m))
+                return
+            except Exception as e:
+                self._post_ui(lambda m=str(e): fail(m))
+                return
+
+            # Ausführen (_run_create_os_sonar übernimmt Busy-State/Progress);
+            # das Busy des Einlesens erst nach der Übergabe freigeben
+            self._post_ui(lambda: (self._run_create_os_sonar(jobs), self._set_busy(False)))
+
+        self._submit_job(worker)
 
     def _show_create_os_dialog(self):
         """
@@ -4545,19 +4853,7 @@ class BullseyeApp:
          - Kurze Spaltenanforderung anzeigen
         Rückgabe: {"template": dict, "xlsx_path": str} oder None
         """
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Create OS Sonar")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("560x360")
-        dlg.minsize(520, 320)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        # center
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Create OS Sonar", 560, 360, minw=520, minh=320)
 
         body = ttk.Frame(dlg, style="Amazon.TFrame")
         body.pack(fill="both", expand=True, padx=16, pady=12)
@@ -4566,7 +4862,7 @@ class BullseyeApp:
 
         # Template
         ttk.Label(body, text="Template", style="AmazonBody.TLabel").grid(row=0, column=0, sticky="w")
-        tpl_names = [t.get("name", f"Template {i+1}") for i, t in enumerate(self.templates)]
+        tpl_names, tpl_by_name = self._template_index()
         tpl_var = tk.StringVar(value=(tpl_names[0] if tpl_names else ""))
         tpl_cb = ttk.Combobox(body, state="readonly", values=tpl_names, textvariable=tpl_var)
         tpl_cb.grid(row=1, column=0, sticky="ew", pady=(0, 10))
@@ -4604,26 +4900,33 @@ class BullseyeApp:
         actions = ttk.Frame(dlg, style="Amazon.TFrame")
         actions.pack(fill="x", padx=16, pady=(8, 12))
 
-        result = {"template": None, "xlsx_path": None}
+        result = {"template": None, "xlsx_path": None, "xlsx_stat": None}
         def submit():
             if not tpl_names:
                 messagebox.showerror("Create OS Sonar", "No templates.")
                 return
-            name = tpl_var.get().strip()
-            try:
-                idx = tpl_names.index(name)
-            except ValueError:
+            tpl = tpl_by_name.get(tpl_var.get().strip())
+            if tpl is None:
                 messagebox.showerror("Create OS Sonar", "Please select a template.")
                 return
             p = (path_var.get() or "").strip()
             if not p:
                 messagebox.showerror("Create OS Sonar", "Please choose an Excel (.xlsx) file.")
                 return
-            if not os.path.exists(p):
+            # ein stat() für Existenz, Größe und Cache-Key (statt exists() + erneutem stat beim Lesen)
+            try:
+                st = os.stat(p)
+            except OSError:
                 messagebox.showerror("Create OS Sonar", f"File not found:\n{p}")
                 return
-            result["template"] = self.templates[idx]
+            if st.st_size > XLSX_LARGE_FILE_BYTES and not messagebox.askyesno(
+                "Create OS Sonar",
+                f"The file is large ({st.st_size / 1_048_576:.1f} MB) and may take a while to read.\nContinue?"
+            ):
+                return
+            result["template"] = tpl
             result["xlsx_path"] = p
+            result["xlsx_stat"] = st
             dlg.destroy()
 
         def cancel():
@@ -4638,47 +4941,32 @@ class BullseyeApp:
             return result
         return None
 
-    def _read_campaign_excel(self, path):
+    def _iter_campaign_rows(self, path):
         """
-        Liest .xlsx → list[dict] mit Spaltennamen (lowercased keys).
-        Versucht zuerst pandas, danach openpyxl (manual).
+        Öffnet .xlsx und liefert einen Iterator über Zeilen-Dicts (keys bereits strip/lower).
+        Header werden sofort gelesen (Lesefehler fallen hier, nicht erst beim Iterieren);
+        die Zeilen selbst werden gestreamt (calamine bzw. openpyxl read_only/values_only).
         """
-        rows = []
-        # 1) pandas
         try:
-            import pandas as pd
-            df = pd.read_excel(path)
-            for _, row in df.iterrows():
-                d = {str(k).strip().lower(): ("" if pd.isna(v) else v) for k, v in row.to_dict().items()}
-                rows.append(d)
-            return rows
-        except Exception:
-            pass
-
-        # 2) openpyxl
-        try:
-            from openpyxl import load_workbook
-            wb = load_workbook(filename=path, read_only=True, data_only=True)
-            ws = wb.active
-            headers = []
-            for i, row in enumerate(ws.iter_rows(values_only=True)):
-                if i == 0:
-                    headers = [str(c).strip().lower() if c is not None else "" for c in row]
-                    continue
-                d = {}
-                for j, val in enumerate(row):
-                    key = headers[j] if j < len(headers) else f"col{j+1}"
-                    d[key] = "" if val is None else val
-                rows.append(d)
-            wb.close()
-            return rows
+            it = _iter_xlsx_rows(path)
+            # nur die Header werden normalisiert – einmal, vor der Zeilenschleife
+            headers = [str(c).strip().lower() if c is not None else "" for c in next(it, ())]
         except Exception as e:
             raise RuntimeError(
-                f"Could not read Excel. Please install 'pandas' or 'openpyxl'.\n\n{e}"
+                f"Could not read Excel. Please install 'openpyxl' (or 'python-calamine').\n\n{e}"
             )
 
+        def gen():
+            for row in it:
+                # Header nur bei breiteren Zeilen mit colK auffüllen – keine Index-Prüfung pro Zelle
+                if len(row) > len(headers):
+                    headers.extend(f"col{j+1}" for j in range(len(headers), len(row)))
+                yield dict(zip(headers, ["" if v is None else v for v in row]))
+
+        return gen()
 
-    def _validate_campaign_rows(self, rows):
+
+    def _validate_campaign_rows(self, rows, progress_callback=None):
         """
         Prüft Pflichtfelder & normalisiert:
           - programName: str (non-empty)
@@ -4687,21 +4975,19 @@ class BullseyeApp:
         Optional:
           - programDescription: str (default = programName)
           - marketplaceId: int (default 4)
-        Gibt normalisierte list[dict] zurück.
+        rows: Iterable von Dicts mit bereits lowercased Keys (siehe _iter_campaign_rows);
+        wird genau einmal durchlaufen. Gibt normalisierte list[dict] zurück.
+        progress_callback(n): optional, alle CAMPAIGN_ROWS_PROGRESS_EVERY Zeilen.
         """
-        if not rows:
-            raise ValueError("Excel is empty.")
-
         out = []
         for i, r in enumerate(rows, start=1):
-            # Keys vereinheitlichen
-            r = {str(k).strip().lower(): r[k] for k in r.keys()}
-
+            if progress_callback is not None and i % CAMPAIGN_ROWS_PROGRESS_EVERY == 0:
+                progress_callback(i)
             # programName
-            pname = str(r.get("programname", "")).strip()
+            pname = _cell_str(r.get("programname", "")).strip()
             if not pname:
                 raise ValueError(f"Row {i}: 'programName' is required.")
-            pdesc = str(r.get("programdescription", "")).strip() or pname
+            pdesc = _cell_str(r.get("programdescription", "")).strip() or pname
 
             # startDate robust in 'YYYY-MM-DD' bringen
             sdate_raw = r.get("startdate", "")
@@ -4711,9 +4997,9 @@ class BullseyeApp:
                 raise ValueError(f"Row {i}: 'startDate' must be a valid date (got {sdate_raw!r}).")
 
             # marketplaceId (optional, Default 4)
-            mp_raw = r.get("marketplaceid", "")
+            mp_raw = _cell_str(r.get("marketplaceid", "")).strip()
             try:
-                mp = int(str(mp_raw).strip()) if str(mp_raw).strip() else 4
+                mp = int(mp_raw) if mp_raw else 4
             except Exception:
                 raise ValueError(f"Row {i}: 'marketplaceId' must be an integer.")
 
@@ -4729,6 +5015,8 @@ class BullseyeApp:
                 "endDate": sdate,  # OneShot
             })
 
+        if not out:
+            raise ValueError("Excel is empty.")
         return out
 
 
@@ -4738,18 +5026,19 @@ class BullseyeApp:
         """
         Kombiniert Zeilen + Template + Fixwerte zu übergabefertigen Jobs.
         Gibt list[dict] zurück, jede Zeile ein Job.
+        template/fixed sind für alle Jobs dasselbe, schreibgeschützte Mapping-Objekt (geteilt per Referenz).
         """
         # fixe Werte laut Vorgabe
-        fixed = {
+        fixed = MappingProxyType({
             "duration": 1,
             "reason": "OneShot",
             "topic": "CAFEP",
             "optOuts": [],
             "communicationContentType": {"optOutList": []},
-        }
+        })
 
         # Template-Felder (nur die, die wir definiert hatten)
-        tpl = {
+        tpl = MappingProxyType({
             "channel": (template_dict.get("channel") or "").strip(),
             "teamBindle": template_dict.get("teamBindle"),
             "lobExpression": template_dict.get("lobExpression"),
@@ -4759,14 +5048,14 @@ class BullseyeApp:
             "optOuts": template_dict.get("optOuts") or [],
             "startTimeMinutesOffset": template_dict.get("startTimeMinutesOffset"),
             "endTimeMinutesOffset": template_dict.get("endTimeMinutesOffset"),
-        }
+        })
 
         # ggf. Profil-Infos (BusinessOwner etc.)
-        owner = (self.profile or {}).get("alias") or ""
+        owner = self.profile_alias
 
-        jobs = []
-        for r in rows:
-            job = {
+        # Jobs bleiben dicts (create_os_sonar greift per job["..."] / job.get(...) zu)
+        return [
+            {
                 "program": {
                     "name": r["programName"],
                     "description": r["programDescription"],
@@ -4784,8 +5073,8 @@ class BullseyeApp:
                 "template": tpl,
                 "fixed": fixed,
             }
-            jobs.append(job)
-        return jobs
+            for r in rows
+        ]
 
 
 
@@ -4808,37 +5097,18 @@ class BullseyeApp:
             start_ts = time.time()
             total = max(1, len(jobs))
 
-            def ui_status(msg: str):
-                try:
-                    self.status_var.set(msg)
-                    self.root.update_idletasks()
-                except Exception:
-                    pass
-
-            def ui_progress(i: int):
-                try:
-                    self.update_progress(i, total)
-                except Exception:
-                    pass
-
             def worker():
-                try:
-                    from create_os_sonar import run_create_os_sonar
-                except Exception as e:
-                    self.root.after(0, lambda: (
-                        self._set_busy(False),
-                        messagebox.showerror("Create OS Sonar", f"Import failed:\n{e}")
-                    ))
-                    return
                 try:
                     results, out_path = run_create_os_sonar(
                         jobs=jobs,
-                        status_callback=lambda m: self.root.after(0, lambda: ui_status(m)),
-                        progress_callback=lambda i: self.root.after(0, lambda: ui_progress(i)),
+                        status_callback=self._post_status,
+                        progress_callback=lambda i: self._post_progress(i, total),
                         headless=self.headless_var.get(),
-                        requester_alias=(self.profile or {}).get("alias")
+                        requester_alias=self.profile_alias
                     )
                     def on_done():
+                        self._drop_pending_progress()
+                        self._flush_status()
                         if out_path:
                             self._add_result_file(out_path)
                         elapsed = time.time() - start_ts
@@ -4848,13 +5118,14 @@ class BullseyeApp:
                         messagebox.showinfo("Create OS Sonar", "Finished. Results saved.")
                     self.root.after(0, on_done)
                 except Exception as e:
-                    self.root.after(0, lambda: (
+                    self.root.after(0, lambda e=e: (
+                        self._drop_pending_progress(),
+                        self._flush_status(),
                         self._set_busy(False),
                         messagebox.showerror("Create OS Sonar", str(e))
                     ))
 
-            import threading
-            threading.Thread(target=worker, daemon=True).start()
+            self._submit_job(worker)
 
         except Exception as e:
             self._set_busy(False)
@@ -4884,13 +5155,14 @@ class BullseyeApp:
             # Thread-sichere Callback-Wrapper
             def ui_progress(i):
                 # i = 0-based index
-                self.root.after(0, lambda: self.update_progress(i, total))
+                self._post_progress(i, total)  # gebündelt: max. ein Redraw pro UI-Tick
 
             def ui_status(message):
-                self.root.after(0, lambda: (self.status_var.set(message), self.root.update_idletasks()))
+                self._post_status(message)
 
             # Abschluss-/Fehler-Handler im Tk-Thread
             def on_done(_df):
+                self._drop_pending_progress()
                 # Versuche den Dateinamen zu ermitteln (Fallback: neueste .xlsx seit Start)
                 out = self._guess_new_xlsx(start_time)
                 if out:
@@ -4901,15 +5173,15 @@ class BullseyeApp:
                 messagebox.showinfo("Success", "Finished applying BE → Sonar (results saved).")
 
             def on_error(err):
+                self._drop_pending_progress()
+                self._flush_status()  # ausstehende Meldung vor dem Fehlertext
                 self.status_var.set(f"Error: {err}")
                 messagebox.showerror("Error", str(err))
                 self._set_busy(False)
 
             # Worker-Thread starten
-            import threading
             def run():
                 try:
-                    from sonar_apply import apply_segments_to_sonar_pairs
                     df = apply_segments_to_sonar_pairs(
                         pairs=pairs,
                         status_callback=ui_status,
@@ -4921,7 +5193,7 @@ class BullseyeApp:
                     self.root.after(0, lambda err=e: on_error(err))
 
             self._set_busy(True)
-            threading.Thread(target=run, daemon=True).start()
+            self._submit_job(run)
 
         except Exception as e:
             self.status_var.set(f"Error: {str(e)}")
@@ -4947,15 +5219,19 @@ class BullseyeApp:
             start_time = time.time()
             total = len(pairs)
 
-            from clone_publish import clone_and_publish_segments
+            def ui_total(n):
+                # Backend sortiert ungültige/doppelte Paare aus → effektive Anzahl als Progress-Gesamtwert
+                nonlocal total
+                total = n
 
             def ui_progress(i):
-                self.root.after(0, lambda: self.update_progress(i, total))
+                self._post_progress(i, total)  # gebündelt: max. ein Redraw pro UI-Tick
 
             def ui_status(message):
-                self.root.after(0, lambda: (self.status_var.set(message), self.root.update_idletasks()))
+                self._post_status(message)
 
             def on_done(_df):
+                self._drop_pending_progress()
                 # Vermutete Ausgabedatei bestimmen
                 out = self._guess_new_xlsx(start_time)
                 if out:
@@ -4966,11 +5242,12 @@ class BullseyeApp:
                 messagebox.showinfo("Success", "Finished. Results saved.")
 
             def on_error(err):
+                self._drop_pending_progress()
+                self._flush_status()  # ausstehende Meldung vor dem Fehlertext
                 self.status_var.set(f"Error: {err}")
                 messagebox.showerror("Error", str(err))
                 self._set_busy(False)
 
-            import threading
             def run():
                 try:
                     df = run_clone_and_publish_segments(
@@ -4978,14 +5255,15 @@ class BullseyeApp:
                         status_callback=ui_status,
                         progress_callback=ui_progress,
                         headless=self.headless_var.get(),
-                        owner_alias=(self.profile or {}).get("alias")
+                        owner_alias=self.profile_alias,
+                        total_callback=ui_total,
                     )
                     self.root.after(0, lambda: (self._set_busy(False), on_done(df)))
                 except Exception as e:
                     self.root.after(0, lambda err=e: on_error(err))
 
             self._set_busy(True)
-            threading.Thread(target=run, daemon=True).start()
+            self._submit_job(run)
 
         except Exception as e:
             self.status_var.set(f"Error: {str(e)}")
@@ -5005,20 +5283,17 @@ class BullseyeApp:
             self.progress_label.config(text="Starting clone across marketplaces...")
             start_time = time.time()
 
-            from clone_publish import (
-                clone_across_marketplaces as backend_clone_across_mps,
-                MP_CODE_BY_ID as _MP_MAP,
-            )
-
-            total_targets = max(0, len(_MP_MAP) - 1)
+            total_targets = max(0, len(MP_CODE_BY_ID) - 1)
 
             def progress_callback(i):
-                self.root.after(0, lambda: self.update_progress(i, total_targets))
+                self._post_progress(i, total_targets)  # gebündelt: max. ein Redraw pro UI-Tick
 
             def status_callback(message):
-                self.root.after(0, lambda: (self.status_var.set(message), self.root.update_idletasks()))
+                self._post_status(message)
 
             def on_done(result):
+                self._drop_pending_progress()
+                self._flush_status()  # ausstehende Meldung vor dem Abschlusstext
                 if result is not None:
                     _results, out_main = result
                     # --> Datei in Results aufnehmen
@@ -5040,11 +5315,12 @@ class BullseyeApp:
                 self._set_busy(False)
 
             def on_error(err):
+                self._drop_pending_progress()
+                self._flush_status()  # ausstehende Meldung vor dem Fehlertext
                 self.status_var.set(f"Error: {err}")
                 messagebox.showerror("Error", str(err))
                 self._set_busy(False)
 
-            import threading
             def run():
                 try:
                     result = backend_clone_across_mps(
@@ -5059,7 +5335,7 @@ class BullseyeApp:
                     self.root.after(0, lambda err=e: on_error(err))
 
             self._set_busy(True)
-            threading.Thread(target=run, daemon=True).start()
+            self._submit_job(run)
 
         except Exception as e:
             self.status_var.set(f"Error: {str(e)}")
@@ -5088,15 +5364,14 @@ class BullseyeApp:
             start_time = time.time()
             total = len(pairs)
 
-            from clone_publish import clone_and_publish_segments
-
             def ui_progress(i):
-                self.root.after(0, lambda: self.update_progress(i, total))
+                self._post_progress(i, total)  # gebündelt: max. ein Redraw pro UI-Tick
 
             def ui_status(message):
-                self.root.after(0, lambda: (self.status_var.set(message), self.root.update_idletasks()))
+                self._post_status(message)
 
             def on_done(_df):
+                self._drop_pending_progress()
                 out = self._guess_new_xlsx(start_time)
                 if out:
                     self._add_result_file(out)
@@ -5106,11 +5381,12 @@ class BullseyeApp:
                 messagebox.showinfo("Success", "Finished. Results saved.")
 
             def on_error(err):
+                self._drop_pending_progress()
+                self._flush_status()  # ausstehende Meldung vor dem Fehlertext
                 self.status_var.set(f"Error: {err}")
                 messagebox.showerror("Error", str(err))
                 self._set_busy(False)
 
-            import threading
             def run():
                 try:
                     df = run_clone_and_publish_segments(
@@ -5118,14 +5394,15 @@ class BullseyeApp:
                         status_callback=ui_status,
                         progress_callback=ui_progress,
                         headless=self.headless_var.get(),
-                        owner_alias=(self.profile or {}).get("alias")
+                        owner_alias=self.profile_alias,
+                        dedupe=False,  # gleiche Namen = gewollte Mehrfach-Clones der Base-ID
                     )
                     self.root.after(0, lambda: (self._set_busy(False), on_done(df)))
                 except Exception as e:
                     self.root.after(0, lambda err=e: on_error(err))
 
             self._set_busy(True)
-            threading.Thread(target=run, daemon=True).start()
+            self._submit_job(run)
 
         except Exception as e:
             self.status_var.set(f"Error: {str(e)}")
@@ -5137,92 +5414,152 @@ class BullseyeApp:
 
     def show_be_name_mapping_dialog(self):
         """
-        Amazon-style modal dialog to input BE IDs (left) and matching Segment Names (right).
+        Amazon-style modal dialog to input BE ID / Segment Name pairs in a two-column grid.
         Returns list of tuples [(be_id_10digits, segment_name), ...] or None on cancel/validation error.
         """
-        dlg = tk.Toplevel(self.root)
-        dlg.title("Clone & Publish — BE → Segment Name")
-        dlg.configure(bg=self.AMAZON["bg"])
-        dlg.geometry("780x420")
-        dlg.minsize(720, 380)
-        dlg.transient(self.root)
-        dlg.grab_set()
-
-        # center on parent
-        dlg.update_idletasks()
-        x = self.root.winfo_rootx() + (self.root.winfo_width() // 2 - dlg.winfo_width() // 2)
-        y = self.root.winfo_rooty() + (self.root.winfo_height() // 2 - dlg.winfo_height() // 2)
-        dlg.geometry(f"+{max(0, x)}+{max(0, y)}")
+        dlg = self._open_modal("Clone & Publish — BE → Segment Name", 780, 420, minw=720, minh=380)
 
         # Header
         hdr = tk.Frame(dlg, bg=self.AMAZON["bg"])
         hdr.pack(fill="x", padx=16, pady=(14, 6))
         ttk.Label(hdr, text="Paste BE IDs and matching Segment Names", style="AmazonTitle.TLabel").pack(anchor="w")
+        paste_key = "⌘V" if sys.platform == "darwin" else "Ctrl+V"
         ttk.Label(
             hdr,
-            text="Enter one pair per line. Left box: BE IDs (10 digits). Right box: desired Segment Names. Lines are matched by order.",
+            text=f"Paste two columns from Excel (BE ID <Tab> Segment Name) with {paste_key} or the Paste button. "
+                 "Double-click a cell to edit.",
             style="AmazonSubtitle.TLabel"
         ).pack(anchor="w", pady=(2, 0))
 
-        # Body with two text areas
+        # Body: ein Grid (Treeview) statt zwei Textfeldern – Paste fügt Zeilen direkt ein
         body = tk.Frame(dlg, bg=self.AMAZON["bg"])
         body.pack(fill="both", expand=True, padx=16, pady=(8, 0))
+        body.rowconfigure(0, weight=1)
         body.columnconfigure(0, weight=1)
-        body.columnconfigure(1, weight=1)
-
-        # Left (BE IDs)
-        left_wrap = tk.Frame(body, bg=self.AMAZON["bg"])
-        left_wrap.grid(row=0, column=0, sticky="nsew", padx=(0, 8))
-        ttk.Label(left_wrap, text="Bullseye IDs (one per line)", style="AmazonBody.TLabel").pack(anchor="w", pady=(0, 4))
-        be_text = tk.Text(left_wrap, wrap="none", height=12, font=("Segoe UI", 10))
-        be_text.pack(fill="both", expand=True)
-
-        # Right (Segment Names)
-        right_wrap = tk.Frame(body, bg=self.AMAZON["bg"])
-        right_wrap.grid(row=0, column=1, sticky="nsew", padx=(8, 0))
-        ttk.Label(right_wrap, text="Segment Names (one per line)", style="AmazonBody.TLabel").pack(anchor="w", pady=(0, 4))
-        name_text = tk.Text(right_wrap, wrap="none", height=12, font=("Segoe UI", 10))
-        name_text.pack(fill="both", expand=True)
+
+        tree = ttk.Treeview(body, columns=("be", "name"), show="headings", style="Amazon.Treeview")
+        tree.heading("be", text="Bullseye ID")
+        tree.heading("name", text="Segment Name")
+        tree.column("be", width=160, anchor="w", stretch=False)
+        tree.column("name", width=520, anchor="w")
+        tree.grid(row=0, column=0, sticky="nsew")
+        tree_scroll = ttk.Scrollbar(body, orient="vertical", command=tree.yview, style="Amazon.Vertical.TScrollbar")
+        tree_scroll.grid(row=0, column=1, sticky="ns")
+        tree.configure(yscrollcommand=tree_scroll.set)
+
+        def _split_pair(line):
+            # Excel kopiert mit Tab; sonst ';' oder ',' (nur erstes Vorkommen – Namen dürfen Kommas enthalten)
+            for sep in ("\t", ";", ","):
+                if sep in line:
+                    be, _, name = line.partition(sep)
+                    return be.strip(), name.strip()
+            return line.strip(), ""
+
+        def paste(_=None):
+            try:
+                text = dlg.clipboard_get()
+            except tk.TclError:
+                return "break"
+            for line in _tokenize_lines(text):
+                tree.insert("", "end", values=_split_pair(line))
+            return "break"
+
+        # Inline-Edit: Entry über der Zelle
+        editor = {"entry": None}
+
+        def _end_edit(commit):
+            ent = editor["entry"]
+            if ent is None:
+                return
+            editor["entry"] = None
+            if commit:
+                iid, col = ent.cell
+                vals = list(tree.item(iid, "values"))
+                vals[col] = ent.get().strip()
+                tree.item(iid, values=vals)
+            ent.destroy()
+
+        def _begin_edit(iid, col):
+            _end_edit(True)
+            bbox = tree.bbox(iid, f"#{col + 1}")
+            if not bbox:
+                return
+            x, y, w, h = bbox
+            ent = ttk.Entry(tree)
+            ent.cell = (iid, col)
+            ent.insert(0, tree.item(iid, "values")[col])
+            ent.place(x=x, y=y, width=w, height=h)
+            ent.focus_set()
+            ent.bind("<Return>", lambda e: (_end_edit(True), "break")[1])
+            ent.bind("<Escape>", lambda e: (_end_edit(False), "break")[1])
+            ent.bind("<FocusOut>", lambda e: _end_edit(True))
+            editor["entry"] = ent
+
+        def on_double_click(event):
+            iid = tree.identify_row(event.y)
+            col = tree.identify_column(event.x)
+            if iid and col:
+                _begin_edit(iid, int(col[1:]) - 1)
+
+        def add_row():
+            iid = tree.insert("", "end", values=("", ""))
+            tree.see(iid)
+            _begin_edit(iid, 0)
+
+        def remove_selected():
+            _end_edit(False)
+            sel = tree.selection()
+            if sel:
+                tree.delete(*sel)
+
+        def clear_all():
+            _end_edit(False)
+            tree.delete(*tree.get_children())
+
+        tree.bind("<Double-1>", on_double_click)
+        # <<Paste>> = plattformübliches Kürzel (macOS: Cmd+V); Ctrl+V zusätzlich auch auf dem Mac
+        tree.bind("<<Paste>>", paste)
+        tree.bind("<Control-v>", paste)
+        if sys.platform == "darwin":
+            tree.bind("<Command-v>", paste)
+        tree.bind("<Delete>", lambda e: remove_selected())
+        tree.focus_set()
 
         # Actions
         actions = tk.Frame(dlg, bg=self.AMAZON["bg"])
         actions.pack(fill="x", padx=16, pady=12)
 
+        self.create_secondary_button(actions, "Paste", paste).pack(side="left")
+        self.create_secondary_button(actions, "Add row", add_row).pack(side="left", padx=(8, 0))
+        self.create_secondary_button(actions, "Remove", remove_selected).pack(side="left", padx=(8, 0))
+        self.create_secondary_button(actions, "Clear", clear_all).pack(side="left", padx=(8, 0))
+
         result = {"pairs": None}
 
         def parse_pairs():
-            # collect & clean lines
-            be_lines_raw = be_text.get("1.0", "end").splitlines()
-            name_lines_raw = name_text.get("1.0", "end").splitlines()
-
-            be_lines = [l.strip() for l in be_lines_raw if l.strip()]
-            name_lines = [l.strip() for l in name_lines_raw if l.strip()]
-
-            if not be_lines or not name_lines:
-                messagebox.showerror("Error", "Both columns must contain at least one line.")
-                return
+            _end_edit(True)
+            # komplett leere Zeilen ignorieren
+            rows = [vals for iid in tree.get_children()
+                    if any(vals := [str(v).strip() for v in tree.item(iid, "values")])]
 
-            if len(be_lines) != len(name_lines):
-                messagebox.showerror("Error", "Line counts do not match. Each BE must have a matching Segment Name.")
+            if not rows:
+                messagebox.showerror("Error", "Please add at least one BE / Segment Name pair.")
                 return
 
-            # validate BE IDs → only 10 digits each
-            cleaned_be = []
-            for i, be in enumerate(be_lines, start=1):
-                digits = "".join(ch for ch in be if ch.isdigit())
+            cleaned = []
+            for i, (be, nm) in enumerate(rows, start=1):
+                # validate BE IDs → only 10 digits each
+                digits = _digits_only(be)
                 if len(digits) != 10:
-                    messagebox.showerror("Error", f"Line {i}: BE must be 10 digits (got: '{be}').")
+                    messagebox.showerror("Error", f"Row {i}: BE must be 10 digits (got: '{be}').")
                     return
-                cleaned_be.append(digits)
-
-            # validate names → non-empty
-            for i, nm in enumerate(name_lines, start=1):
+                # validate names → non-empty
                 if not nm:
-                    messagebox.showerror("Error", f"Line {i}: Segment Name cannot be empty.")
+                    messagebox.showerror("Error", f"Row {i}: Segment Name cannot be empty.")
                     return
+                cleaned.append((digits, nm))
 
-            pairs = list(zip(cleaned_be, name_lines))
-            result["pairs"] = pairs
+            result["pairs"] = cleaned
             dlg.destroy()
 
         def cancel():
@@ -5243,33 +5580,30 @@ class BullseyeApp:
         """
         Liest XLSX/CSV und liefert eine Liste von Zeilen-Dicts mit
         *originalen* Spaltennamen (nicht lowercased). Leere Zellen -> "".
+        Gecacht über _cached_excel_rows (erneutes Proceed mit derselben Datei parst nicht neu).
+        Rückgabe: (rows, headers) – headers = [(Original-Header, _norm_hdr(Header)), …] in
+        Spalten-Reihenfolge, einmal pro Sheet gebaut (alle Zeilen haben dieselben Spalten).
         """
-        import os
-        ext = os.path.splitext(path)[1].lower()
-        try:
-            import pandas as pd
-        except Exception as e:
-            raise RuntimeError("pandas wird zum Einlesen der Excel benötigt.") from e
+        rows = self._cached_excel_rows(path, self._parse_update_excel_rows)
+        headers = [(h, self._norm_hdr(h)) for h in (rows[0] if rows else ())]
+        return rows, headers
 
-        if ext in (".xlsx", ".xls"):
-            df = pd.read_excel(path, dtype=str)
+    def _parse_update_excel_rows(self, path: str):
+        ext = os.path.splitext(path)[1].lower()
+        if ext == ".xlsx":
+            return self._xlsx_records(path, _cell_str)
+        if ext == ".xls":
+            # native dtypes lesen (kein dtype=str-Cast im Parser), Strings erst beim Zeilenaufbau
+            df = pd.read_excel(path, engine=PD_EXCEL_ENGINE)
         else:
             # Fallback: CSV (Delimiter auto-erkennen)
             df = pd.read_csv(path, dtype=str, sep=None, engine="python")
 
-        df = df.fillna("")
-        records = df.to_dict(orient="records")
-
         # Spaltennamen trimmen, Werte zu Strings
-        cleaned = []
-        for rec in records:
-            row = {}
-            for k, v in rec.items():
-                key = str(k).strip()
-                val = "" if v is None else str(v)
-                row[key] = val
-            cleaned.append(row)
-        return cleaned
+        return [
+            {k: _cell_str(v) for k, v in rec.items()}
+            for rec in self._frame_records(df, str.strip)
+        ]
 
 
     def _jobs_from_update_excel_any_vars(self, xlsx_path: str, template_path: str, use_json_vars: bool):
@@ -5279,36 +5613,28 @@ class BullseyeApp:
           - Alle übrigen Spalten werden als Variablen übernommen
             (Variablen-Name = exakter Spaltenname in der Excel).
         """
-        rows = self._read_update_excel_rows(xlsx_path)
+        rows, headers = self._read_update_excel_rows(xlsx_path)
         if not rows:
             raise ValueError("Excel ist leer.")
 
+        # Spaltenplan einmal pro Sheet: Kampagnen-Spalten (Kandidaten, in Spalten-Reihenfolge)
+        # und Variablen-Spalten (Kampagnenfeld nicht als Variable senden)
+        camp_cols = [h for h, n in headers if n in self.UPDATE_CAMPAIGN_HEADERS]
+        var_cols = [(h, h.strip()) for h, n in headers if n not in self.UPDATE_CAMPAIGN_HEADERS]
+
         jobs = []
         for idx, row in enumerate(rows, start=1):
-            # Mapping: normalisierte Header -> Original-Header
-            norm_to_orig = {self._norm_hdr(h): h for h in row.keys()}
-
-            # Kampagne finden
-            camp_val = None
-            for key_norm in self.UPDATE_CAMPAIGN_HEADERS:
-                if key_norm in norm_to_orig:
-                    orig = norm_to_orig[key_norm]
-                    val = str(row.get(orig, "")).strip()
-                    if val:
-                        camp_val = val
-                        break
+            # Kampagne: erste nicht-leere Kandidaten-Spalte (k ≤ 6 Dict-Zugriffe)
+            camp_val = next((v for h in camp_cols if (v := str(row.get(h, "")).strip())), None)
             if not camp_val:
                 raise ValueError(f"Row {idx}: missing 'Sonar Link' (or campaign/url/campaignId).")
 
-            # Variablen: alle Spalten außer den Kampagnen-Spalten
+            # Variablen: alle Spalten außer den Kampagnen-Spalten (exakter Spaltenname = Variablenname)
             extra_vars = {}
-            for orig_hdr, value in row.items():
-                if not str(value).strip():
-                    continue
-                if self._norm_hdr(orig_hdr) in self.UPDATE_CAMPAIGN_HEADERS:
-                    continue  # Kampagnenfeld nicht als Variable senden
-                # exakter Spaltenname = Variablenname
-                extra_vars[orig_hdr.strip()] = value
+            for orig_hdr, var_name in var_cols:
+                value = row.get(orig_hdr, "")
+                if str(value).strip():
+                    extra_vars[var_name] = value
 
             # Sprache aus Link ableiten (falls MP im Link)
             mp = self._extract_mp_from_line(camp_val)
@@ -5331,8 +5657,7 @@ class BullseyeApp:
 
     # ---- Update-Content (Excel) – dynamische Variablen ----
     def _norm_hdr(self, s: str) -> str:
-        import re as _re
-        return _re.sub(r'[^a-z0-9]+', '', (s or '').strip().lower())
+        return _NON_ALNUM_RE.sub('', (s or '').strip().lower())
 
     # Welche Spalten dürfen die Kampagne enthalten? (WICHTIG: KEIN nacktes 'url'!)
     UPDATE_CAMPAIGN_HEADERS = {
@@ -5340,35 +5665,23 @@ class BullseyeApp:
     }
 
 
-    MP_TO_LANG = {
-        3: "en_GB",      # UK
-        4: "de_DE",      # DE
-        5: "fr_FR",      # FR
-        35691: "it_IT",  # IT
-        44551: "es_ES",  # ES
-    }
-
-    def _language_for_mp(self, mp: int | None) -> str | None:
-        try:
-            return self.MP_TO_LANG.get(int(mp)) if mp is not None else None
-        except Exception:
-            return None
+    @staticmethod
+    def _language_for_mp(mp: int | None) -> str | None:
+        # Normalfall int (aus _extract_mp_from_line): direkt nachschlagen, kein try/int()
+        if isinstance(mp, int):
+            return MP_TO_LANG.get(mp)
+        s = _cell_str(mp).strip()  # None/NaN → "", 4.0 → "4"
+        return MP_TO_LANG.get(int(s)) if s.isdigit() else None
 
-    def _extract_mp_from_line(self, s: str) -> int | None:
+    @staticmethod
+    def _extract_mp_from_line(s: str) -> int | None:
         """
         Erwartet z. B. https://sonar-eu.amazon.com/#/3/campaigns/1416358261
         oder ...#/4/programs/123; liefert MP als int. Reine IDs -> None.
         """
-        import re
         if not s:
             return None
-        m = re.search(r"#/(\d+)/(?:campaigns|programs)/\d+", s)
-        if m:
-            try:
-                return int(m.group(1))
-            except Exception:
-                return None
-        return None
+        return _mp_from_sonar_line(s)
 
 
 
@@ -5380,33 +5693,48 @@ class BullseyeApp:
         groups: dict[int | None, dict] = {}
         for line in lines:
             mp = self._extract_mp_from_line(line)
-            if mp not in groups:
-                groups[mp] = {"items": [], "lang": self._language_for_mp(mp)}
-            groups[mp]["items"].append(line)
+            # ein Dict-Zugriff pro Zeile; Gruppe (inkl. Sprache) nur beim ersten Treffer anlegen
+            g = groups.get(mp)
+            if g is None:
+                g = groups[mp] = {"items": [], "lang": self._language_for_mp(mp)}
+            g["items"].append(line)
         return groups
 
 
 
+    def _register_busy_widget(self, widget):
+        """Button, der Jobs startet: wird gesperrt, solange irgendein Job läuft (auch sofort, falls schon busy)."""
+        self._busy_widgets.append(widget)
+        if self._busy_count:
+            widget.configure(state="disabled")
+
     def _set_busy(self, busy: bool):
         """
-        Schaltet einen einfachen Busy-Modus:
-        - Wartencursor an/aus
-        - (falls vorhanden) Dataset-Buttons kurz deaktivieren
+        Busy-Modus mit Zähler: jedes _set_busy(True) eines Jobs braucht sein _set_busy(False).
+        Erst wenn kein Job mehr läuft:
+        - Wartencursor aus
+        - Job-Buttons (_busy_widgets) wieder aktiv
+        Überzählige False-Aufrufe (Fehlerpfade vor dem Start) bleiben bei 0 wirkungslos.
         """
+        if busy:
+            self._busy_count += 1
+            if self._busy_count > 1:
+                return
+        else:
+            if not self._busy_count:
+                return
+            self._busy_count -= 1
+            if self._busy_count:
+                return
+        busy = self._busy_count > 0
         try:
-            # Cursor
+            # Cursor – wird im nächsten Idle-Frame gezeichnet, kein erzwungenes update_idletasks()
             self.root.config(cursor="watch" if busy else "")
-            self.root.update_idletasks()
 
-            # Optional ein paar Buttons sperren/entsperren
-            widgets = [
-                getattr(self, "btn_ds_create", None),
-                getattr(self, "btn_ds_edit", None),
-                getattr(self, "btn_ds_delete", None),
-            ]
-            for w in widgets:
-                if w and w.winfo_exists():
-                    w.configure(state="disabled" if busy else "normal")
+            # Job-Buttons sperren/entsperren; geschlossene Dialoge fallen aus der Liste
+            self._busy_widgets = [w for w in self._busy_widgets if w.winfo_exists()]
+            for w in self._busy_widgets:
+                w.configure(state="disabled" if busy else "normal")
         except Exception:
             # Busy-Modus ist rein kosmetisch – im Zweifel stillschweigend weiter
             pass
@@ -5440,36 +5768,55 @@ class BullseyeApp:
         Akzeptiert zusätzlich versehentlich übergebene Rückgaben im Format (results, out_path)
         und entpackt automatisch den Pfadanteil.
         """
-        import os
-        from tkinter import messagebox
+        self._add_result_files((path,))
 
-        try:
-            # --- robustes Unwrapping ---
-            # Falls ein Tuple wie (results, out_path) reinkommt, den Pfad extrahieren.
-            if isinstance(path, tuple):
-                for itm in path:
-                    if isinstance(itm, (str, bytes, os.PathLike)):
-                        path = itm
-                        break
-
-            # Falls eine 1-Element-Liste mit Pfad kommt, nimm das Element
-            if isinstance(path, list) and len(path) == 1 and isinstance(path[0], (str, bytes, os.PathLike)):
-                path = path[0]
-
-            # Ab hier muss es ein Pfad sein
-            if not isinstance(path, (str, bytes, os.PathLike)):
-                raise TypeError(f"expected a file path, got {type(path).__name__}")
-
-            # In String wandeln, falls bytes/PathLike
-            path = os.fspath(path)
-
-            abs_path = os.path.abspath(path)
+    def _add_result_files(self, paths):
+        """
+        Mehrere Ergebnisdateien auf einmal: ein Listbox-insert() für alle Einträge
+        statt einem pro Datei. Ungültige Einträge werden gesammelt und erst im nächsten
+        Idle-Frame gemeinsam gemeldet (kein modaler Dialog mitten in einer Abschluss-Schleife).
+        """
+        abs_paths, errors = [], []
+        for path in paths:
+            try:
+                abs_paths.append(self._result_abs_path(path))
+            except Exception as e:
+                errors.append(str(e))
+        if abs_paths:
             # Datei kann evtl. noch nicht existieren (asynchron) – wir tragen sie trotzdem ein.
-            self.result_files.append(abs_path)
-            self.results_listbox.insert("end", os.path.basename(abs_path))
+            self.result_files.extend(abs_paths)
+            self.results_listbox.insert("end", *[os.path.basename(p) for p in abs_paths])
+        if errors:
+            if not self._result_add_errors:
+                self.root.after_idle(self._flush_result_errors)
+            self._result_add_errors.extend(errors)
+
+    def _flush_result_errors(self):
+        """Alle seit dem letzten Flush gesammelten Results-Fehler in einem Dialog."""
+        errors, self._result_add_errors = self._result_add_errors, []
+        if errors:
+            messagebox.showerror("Results", "Could not add result file:\n" + "\n".join(errors))
 
-        except Exception as e:
-            messagebox.showerror("Results", f"Could not add result file:\n{e}")
+    @staticmethod
+    def _result_abs_path(path) -> str:
+        """Rückgabe eines Backends → absoluter Pfad (entpackt (results, out_path) und [path])."""
+        # Falls ein Tuple wie (results, out_path) reinkommt, den Pfad extrahieren.
+        if isinstance(path, tuple):
+            for itm in path:
+                if isinstance(itm, (str, bytes, os.PathLike)):
+                    path = itm
+                    break
+
+        # Falls eine 1-Element-Liste mit Pfad kommt, nimm das Element
+        if isinstance(path, list) and len(path) == 1 and isinstance(path[0], (str, bytes, os.PathLike)):
+            path = path[0]
+
+        # Ab hier muss es ein Pfad sein
+        if not isinstance(path, (str, bytes, os.PathLike)):
+            raise TypeError(f"expected a file path, got {type(path).__name__}")
+
+        # In String wandeln, falls bytes/PathLike
+        return os.path.abspath(os.fspath(path))
 
 
 
@@ -5488,16 +5835,20 @@ class BullseyeApp:
     def _open_file(self, path):
         """Plattform-agnostisch Datei öffnen (Windows: os.startfile, macOS: open, Linux: xdg-open)."""
         try:
+            if os.name == "nt":
+                # startfile meldet fehlende Dateien selbst – kein vorheriger stat (Netzlaufwerke)
+                os.startfile(path)  # type: ignore[attr-defined]
+                return
+            # open/xdg-open laufen asynchron und melden Fehler nicht zurück → hier vorher prüfen
             if not os.path.exists(path):
                 messagebox.showerror("Open file", f"File not found:\n{path}")
                 return
-            import sys, subprocess
-            if os.name == "nt":
-                os.startfile(path)  # type: ignore[attr-defined]
-            elif sys.platform == "darwin":
+            if sys.platform == "darwin":
                 subprocess.Popen(["open", path])
             else:
                 subprocess.Popen(["xdg-open", path])
+        except FileNotFoundError:
+            messagebox.showerror("Open file", f"File not found:\n{path}")
         except Exception as e:
             messagebox.showerror("Open file", f"Could not open:\n{path}\n\n{e}")
 
@@ -5507,62 +5858,40 @@ class BullseyeApp:
         Nutzt als Fallback, wenn das Backend keinen Dateinamen zurückgibt.
         """
         try:
-            folder = os.getcwd()
-            candidates = []
-            for name in os.listdir(folder):
-                if name.lower().endswith(".xlsx"):
-                    p = os.path.join(folder, name)
+            # 2s Toleranz; Vergleich in ganzzahligen Nanosekunden (st_mtime_ns, kein Float-Runden)
+            cutoff_ns = int((since_ts - 2) * 1_000_000_000)
+            best = None  # (mtime_ns, path) – ein Durchlauf, kein Sortieren
+            # scandir: DirEntry.stat() nutzt die Verzeichnisdaten (Windows: ohne extra stat-Syscall)
+            with os.scandir(os.getcwd()) as it:
+                for e in it:
+                    if not e.name.lower().endswith(".xlsx"):
+                        continue
                     try:
-                        if os.path.getmtime(p) >= (since_ts - 2):  # 2s Toleranz
-                            candidates.append(p)
-                    except Exception:
-                        pass
-            if candidates:
-                candidates.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-                return candidates[0]
+                        if not e.is_file():
+                            continue
+                        mtime_ns = e.stat().st_mtime_ns
+                    except OSError:
+                        continue
+                    if mtime_ns >= cutoff_ns and (best is None or mtime_ns > best[0]):
+                        best = (mtime_ns, e.path)
+            if best:
+                return best[1]
         except Exception:
             pass
         return None
 
     def _coerce_date_yyyy_mm_dd(self, val):
         """
-        Nimmt Strings, pandas.Timestamp, datetime/date etc. und gibt 'YYYY-MM-DD' zurück.
-        Akzeptiert z.B. '2025-10-01 00:00:00', '01.10.2025', '01/10/2025', '10/01/2025'.
+        Nimmt Strings, pandas.Timestamp, datetime/date, Excel-Seriennummern und gibt 'YYYY-MM-DD' zurück.
+        Akzeptiert z.B. '2025-10-01 00:00:00', '01.10.2025', '01/10/2025', '10/25/2025'.
         """
-        from datetime import datetime, date
-        # pandas.Timestamp?
-        try:
-            if hasattr(val, "to_pydatetime"):
-                return val.to_pydatetime().strftime("%Y-%m-%d")
-        except Exception:
-            pass
-        # datetime / date?
+        conv = _DATE_COERCERS.get(type(val))
+        if conv is not None:
+            return conv(val)
+        # pandas.Timestamp u. ä. (Subklassen von datetime/date)
         if isinstance(val, (datetime, date)):
             return val.strftime("%Y-%m-%d")
-
-        s = str(val or "").strip()
-        if not s:
-            raise ValueError("empty date")
-
-        # Zeitteil abtrennen: 'YYYY-MM-DD 00:00:00' oder ISO 'YYYY-MM-DDTHH:MM:SS'
-        s = s.replace("T", " ")
-        if " " in s:
-            s = s.split(" ", 1)[0].strip()
-
-        # direktes ISO
-        try:
-            return datetime.strptime(s, "%Y-%m-%d").strftime("%Y-%m-%d")
-        except Exception:
-            pass
-
-        # alternative Formate (eu/us)
-        for fmt in ("%d.%m.%Y", "%d/%m/%Y", "%m/%d/%Y"):
-            try:
-                return datetime.strptime(s, fmt).strftime("%Y-%m-%d")
-            except Exception:
-                continue
-
-        raise ValueError(f"bad date: {val!r}")
+        return _date_from_str(str(val or ""))
 
 
 
@@ -5584,11 +5913,11 @@ class BullseyeApp:
         if s.isdigit():
             return s, int(default_mp)
 
-        m = re.search(r"#/(\d+)/(?:campaigns|programs)/(\d+)", s, re.IGNORECASE)
+        m = _SONAR_LINK_IDS_RE.search(s)
         if m:
             return m.group(2), int(m.group(1))
 
-        m2 = re.search(r"(\d{6,})\D*$", s)
+        m2 = _TAIL_ID_RE.search(s)
         if m2:
             return m2.group(1), int(default_mp)
 
@@ -5598,39 +5927,12 @@ class BullseyeApp:
 
 
 
-    def _templates_copy_sqlite_readonly(self, src_path):
-        tmpdir = tempfile.mkdtemp(prefix="ff_cookies_")
-        dst = os.path.join(tmpdir, "cookies.sqlite")
-        shutil.copy2(src_path, dst)
-        return dst, tmpdir
-
     def _templates_load_firefox_cookies_for_domain(self, profile_path, domain_suffix):
         """
         Lädt Cookies aus Firefox (cookies.sqlite) für die gegebene Domain.
-        Gibt eine RequestsCookieJar zurück.
+        Gibt eine RequestsCookieJar zurück (gleiche Abfrage wie _load_firefox_cookies_for_domain).
         """
-        cookies_db = os.path.join(profile_path, "cookies.sqlite")
-        cleanup_dir = None
-        try:
-            conn = sqlite3.connect(f"file:{cookies_db}?mode=ro", uri=True)
-        except sqlite3.OperationalError:
-            copied_path, cleanup_dir = self._templates_copy_sqlite_readonly(cookies_db)
-            conn = sqlite3.connect(copied_path)
-
-        jar = requests.cookies.RequestsCookieJar()
-        try:
-            cur = conn.cursor()
-            cur.execute(
-                "SELECT name, value, host, path, isSecure FROM moz_cookies WHERE host LIKE ?",
-                (f"%{domain_suffix}",)
-            )
-            for name, value, host, path, isSecure in cur.fetchall():
-                jar.set(name, value, domain=host, path=path, secure=bool(isSecure))
-        finally:
-            conn.close()
-            if cleanup_dir and os.path.isdir(cleanup_dir):
-                shutil.rmtree(cleanup_dir, ignore_errors=True)
-        return jar
+        return _load_firefox_cookies_for_domain(profile_path, domain_suffix)
 
     def _templates_build_sonar_session(self, profile_path):
         """
@@ -5664,13 +5966,6 @@ class BullseyeApp:
         """
         Startet (headless) Firefox mit dem Profil, öffnet Sonar und liefert frische Cookies.
         """
-        try:
-            from selenium import webdriver
-            from selenium.webdriver.firefox.service import Service as FxService
-            from selenium.webdriver.firefox.options import Options as FxOptions
-        except Exception:
-            return None  # Selenium nicht verfügbar
-
         options = FxOptions()
         options.add_argument("-profile")
         options.add_argument(profile_path)
@@ -5697,7 +5992,7 @@ class BullseyeApp:
         r = session.get(url, timeout=timeout)
         r.raise_for_status()
         try:
-            return r.json()
+            return _json_loads(r.content)
         except Exception:
             return json.loads(r.text)
 
@@ -5715,20 +6010,38 @@ class BullseyeApp:
             raise ValueError("Konnte keine ID im Link erkennen (Campaign oder Program).")
         mp = int(mp or default_marketplace_id)
 
-        # 2) Firefox-Profil besorgen (für Cookies)
-        try:
-            from utils import get_firefox_profile
-            profile_path = get_firefox_profile()
-        except Exception:
-            profile_path = None
+        # 2) Firefox-Profil besorgen (für Cookies) – einmal gefunden, für die Sitzung gemerkt
+        profile_path = self._firefox_profile
         if not profile_path:
-            raise RuntimeError("Kein Firefox-Profil gefunden. Bitte Firefox einmal öffnen/einloggen.")
+            try:
+                profile_path = get_firefox_profile()
+            except Exception:
+                profile_path = None
+            if not profile_path:
+                raise RuntimeError("Kein Firefox-Profil gefunden. Bitte Firefox einmal öffnen/einloggen.")
+            self._firefox_profile = profile_path
+
+        # Eine Session für Campaign + Program (Cookies einmal lesen, Verbindung wiederverwenden);
+        # erst beim ersten Cache-Miss angelegt
+        session = None
+
+        def fetch_cached(kind: str, obj_id: str, url: str):
+            nonlocal session
+            key = (kind, mp, str(obj_id))
+            hit = self._sonar_json_cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < SONAR_JSON_CACHE_TTL_S:
+                return hit[1]
+            if session is None:
+                session = _build_sonar_web_session(profile_path)
+            data = _fetch_json_from_sonar(url, profile_path, session=session)
+            self._sonar_json_cache[key] = (time.monotonic(), data)
+            return data
 
         # Hilfsfunktion: Campaign laden (bevorzugt)
         def load_campaign(campaign_id: str):
-            requester = (self.profile or {}).get("alias") or "me"
+            requester = self.profile_alias or "me"
             camp_url = f"https://{SONAR_WEB_DOMAIN}/ajax/campaign/{campaign_id}?marketplaceId={mp}&requester={requester}"
-            camp_raw = _fetch_json_from_sonar(camp_url, profile_path)
+            camp_raw = fetch_cached("campaign", campaign_id, camp_url)
             return camp_raw.get("campaign") if isinstance(camp_raw, dict) and "campaign" in camp_raw else camp_raw
 
         # Hilfsfunktion: Program laden
@@ -5737,7 +6050,7 @@ class BullseyeApp:
                 f"https://{SONAR_WEB_DOMAIN}/ajax/program/{program_id}"
                 f"?includeBindleInfo=true&marketplaceId={mp}"
             )
-            return _fetch_json_from_sonar(prog_url, profile_path)
+            return fetch_cached("program", program_id, prog_url)
 
         # 3) Versuch: erst Campaign laden
         campaign = None
@@ -5781,12 +6094,8 @@ class BullseyeApp:
                 or campaign.get("type")
                 or ""
             )
-            ch = str(channel_raw or "").upper().replace("-", "_").replace(" ", "_")
-            if ch == "MOBILEPUSH":
-                ch = "MOBILE_PUSH"
-            elif ch not in ("MOBILE_PUSH", "EMAIL"):
-                ch = ""  # unbekannt -> leer lassen
-            channel = ch
+            # unbekannt -> leer lassen
+            channel = _CHANNEL_CANONICAL.get(str(channel_raw or "").upper().translate(_CHANNEL_TRANS), "")
 
             team_bindle = prog_json.get("teamBindle") or ""
 
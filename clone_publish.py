@@ -18,10 +18,23 @@ import tempfile
 from datetime import datetime, timezone, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import re
+import threading
+import weakref
 
 import requests
+from requests.adapters import HTTPAdapter
 import pandas as pd
 
+# Optional: orjson (C) für die großen Segment-Payloads (basic/queryString) – sonst json
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 # Optionaler Selenium-Fallback zum Auffrischen der Cookies
 from selenium import webdriver
 from selenium.webdriver.firefox.service import Service as FxService
@@ -108,6 +121,9 @@ LOAD_QUERY_URL = f"https://{BULLSEYE_DOMAIN}/request/loadQuery"
 CREATE_SEGMENT_URL = f"https://{BULLSEYE_DOMAIN}/request/createSegment"
 LOAD_SEGMENT_URL = f"https://{BULLSEYE_DOMAIN}/request/loadSegment"
 
+# Parallele Clone-Worker (I/O-gebunden; Session pro Thread, 429 fängt _post_json ab)
+CLONE_MAX_WORKERS = 8
+
 
 def _copy_sqlite_readonly(src_path):
     if not os.path.exists(src_path):
@@ -118,31 +134,84 @@ def _copy_sqlite_readonly(src_path):
     return dst, tmpdir
 
 
-def _load_firefox_cookies_for_domain(profile_path, domain_suffix):
-    cookies_db = os.path.join(profile_path, "cookies.sqlite")
-    cleanup_dir = None
+def _query_cookie_rows(db, domain_suffix, uri=True):
+    conn = sqlite3.connect(db, uri=uri)
     try:
-        conn = sqlite3.connect(f"file:{cookies_db}?mode=ro", uri=True)
-    except sqlite3.OperationalError:
-        copied_path, cleanup_dir = _copy_sqlite_readonly(cookies_db)
-        conn = sqlite3.connect(copied_path)
+        # exakter Host oder Subdomain
+        return [
+            (name, value, host, path, bool(isSecure))
+            for name, value, host, path, isSecure in conn.execute(
+                "SELECT name, value, host, path, isSecure FROM moz_cookies WHERE host = ? OR host LIKE ?",
+                (domain_suffix, f"%.{domain_suffix}")
+            )
+        ]
+    finally:
+        conn.close()
 
-    jar = requests.cookies.RequestsCookieJar()
+
+def _load_firefox_cookie_rows(profile_path, domain_suffix):
+    """
+    Cookies als Snapshot [(name, value, host, path, secure), ...] – einmal lesen,
+    daraus beliebig viele Jars bauen (kein SQLite/Temp-Kopie pro Worker).
+    """
+    cookies_db = os.path.join(profile_path, "cookies.sqlite")
+    # normal ro (inkl. WAL); gesperrt → immutable (ohne Locks, ohne Kopie); zuletzt Temp-Kopie
+    for uri in (f"file:{cookies_db}?mode=ro", f"file:{cookies_db}?mode=ro&immutable=1"):
+        try:
+            return _query_cookie_rows(uri, domain_suffix)
+        except sqlite3.DatabaseError:
+            # gesperrt (OperationalError) oder – bei immutable während Firefox schreibt –
+            # inkonsistent gelesen ("malformed") → nächster Weg
+            continue
+    copied_path, cleanup_dir = _copy_sqlite_readonly(cookies_db)
     try:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT name, value, host, path, isSecure FROM moz_cookies WHERE host LIKE ?",
-            (f"%{domain_suffix}",)
-        )
-        for name, value, host, path, isSecure in cur.fetchall():
-            jar.set(name, value, domain=host, path=path, secure=bool(isSecure))
+        return _query_cookie_rows(copied_path, domain_suffix, uri=False)
     finally:
-        conn.close()
-        if cleanup_dir and os.path.isdir(cleanup_dir):
-            shutil.rmtree(cleanup_dir, ignore_errors=True)
+        shutil.rmtree(cleanup_dir, ignore_errors=True)
+
+
+def _jar_from_cookie_rows(rows):
+    jar = requests.cookies.RequestsCookieJar()
+    for name, value, host, path, secure in rows:
+        jar.set(name, value, domain=host, path=path, secure=secure)
     return jar
 
 
+def _cookie_rows_from_jar(jar):
+    return [(c.name, c.value, c.domain, c.path, bool(c.secure)) for c in jar]
+
+
+def _load_firefox_cookies_for_domain(profile_path, domain_suffix):
+    return _jar_from_cookie_rows(_load_firefox_cookie_rows(profile_path, domain_suffix))
+
+
+def _thread_sessions(base_session, cookie_rows, max_workers):
+    """
+    Eine Session pro Pool-Thread (threading.local) statt einer pro Task:
+    Keep-Alive-Verbindungen zu Bullseye bleiben über alle Segmente eines Threads erhalten.
+    Rückgabe: (get_session, sessions) – sessions zum Schließen nach dem Pool.
+    """
+    tls = threading.local()
+    sessions = []
+    lock = threading.Lock()
+
+    def get_session() -> requests.Session:
+        s = getattr(tls, "sess", None)
+        if s is None:
+            s = requests.Session()
+            s.headers.update(base_session.headers)
+            s.cookies = _jar_from_cookie_rows(cookie_rows)
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers * 2)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            tls.sess = s
+            with lock:
+                sessions.append(s)
+        return s
+
+    return get_session, sessions
+
+
 def _build_http_session(profile_path):
     jar = _load_firefox_cookies_for_domain(profile_path, BULLSEYE_DOMAIN)
     s = requests.Session()
@@ -201,34 +270,107 @@ def _selenium_refresh_session_cookies(profile_path, headless=True, segment_id_fo
 
 # -------------------- Robust HTTP POST helper --------------------
 
+# Bullseye-Drossel: Start-/Höchstrate (Requests/s über alle Worker), Untergrenze nach 429-Halbierungen,
+# additive Erholung pro erfolgreichem Request
+BULLSEYE_MAX_RPS = 20.0
+BULLSEYE_MIN_RPS = 0.5
+BULLSEYE_RPS_RECOVER_STEP = 0.25
+# Mindestabstand zwischen zwei Halbierungen: die 429-Welle eines Bursts zählt nur einmal
+BULLSEYE_THROTTLE_COOLDOWN_S = 1.0
+
+
+class _AdaptiveThrottle:
+    """
+    Prozessweite, von allen Worker-Threads geteilte Drossel (AIMD):
+    - acquire(): vergibt Sende-Slots im Abstand 1/rate
+    - throttled(): 429 → Rate halbieren (höchstens einmal pro Cooldown-Fenster),
+                   nächster Slot frühestens nach 'delay' (Retry-After als Untergrenze)
+    - succeeded(): Rate langsam wieder bis BULLSEYE_MAX_RPS anheben
+    So laufen nicht alle Worker unabhängig voneinander gleichzeitig wieder ins Limit.
+    """
+
+    def __init__(self, max_rate: float, min_rate: float, recover_step: float):
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.recover_step = recover_step
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Neuer Lauf: volle Rate, keine Pause/Cooldown aus einem vorherigen Batch."""
+        with self._lock:
+            self.rate = self.max_rate
+            self._next_slot = 0.0
+            self._cooldown_until = 0.0
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + 1.0 / self.rate
+        if slot > now:
+            time.sleep(slot - now)
+
+    def throttled(self, delay: float):
+        with self._lock:
+            now = time.monotonic()
+            if now >= self._cooldown_until:
+                self.rate = max(self.min_rate, self.rate * 0.5)
+                self._cooldown_until = now + max(delay, BULLSEYE_THROTTLE_COOLDOWN_S)
+            self._next_slot = max(self._next_slot, now + delay)
+
+    def succeeded(self):
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.recover_step)
+
+
+_bullseye_throttle = _AdaptiveThrottle(BULLSEYE_MAX_RPS, BULLSEYE_MIN_RPS, BULLSEYE_RPS_RECOVER_STEP)
+
+# Obergrenze einer einzelnen Retry-Pause (Sekunden)
+BULLSEYE_BACKOFF_CAP_S = 30.0
+
+
+def _full_jitter(attempt: int, base: float) -> float:
+    """Full-Jitter-Backoff: gleichverteilt in [0, min(cap, base·2^attempt)] – Worker-Retries entkoppeln sich."""
+    return random.uniform(0, min(BULLSEYE_BACKOFF_CAP_S, base * (2 ** attempt)))
+
+
 def _post_json(session: requests.Session, url: str, payload: dict, extra_headers: dict,
-               timeout=(5, 30), max_attempts=4, base_backoff=1.6):
+               timeout=(5, 30), max_attempts=4, base_backoff=1.0):
     last_error = None
     for attempt in range(1, max_attempts + 1):
         try:
-            resp = session.post(url, headers=extra_headers, data=json.dumps(payload), timeout=timeout)
+            _bullseye_throttle.acquire()
+            # Content-Type: application/json kommt aus den Session-Headern
+            resp = session.post(url, headers=extra_headers, data=_json_dumps(payload), timeout=timeout)
             if resp.status_code in (401, 403):
                 return resp
             if resp.status_code == 429:
-                ra = _parse_retry_after(resp.headers.get("Retry-After"))
-                sleep_s = ra if ra is not None else (base_backoff ** attempt) + (random.random() * 0.2)
-                time.sleep(sleep_s)
+                # Retry-After ist Untergrenze, nicht Obergrenze; die Pause gilt für alle Worker –
+                # aber nur, wenn wirklich noch ein Versuch folgt
+                if attempt < max_attempts:
+                    ra = _parse_retry_after(resp.headers.get("Retry-After"))
+                    backoff = _full_jitter(attempt, base_backoff)
+                    _bullseye_throttle.throttled(max(ra or 0, backoff))
                 continue
             if 500 <= resp.status_code < 600:
-                time.sleep((base_backoff ** attempt) + (random.random() * 0.2))
+                time.sleep(_full_jitter(attempt, base_backoff))
                 continue
             resp.raise_for_status()
+            _bullseye_throttle.succeeded()
             return resp
         except requests.Timeout as e:
             last_error = e
             if attempt < max_attempts:
-                time.sleep((base_backoff ** attempt) + (random.random() * 0.2))
+                time.sleep(_full_jitter(attempt, base_backoff))
                 continue
             raise
         except requests.RequestException as e:
             last_error = e
             if attempt < max_attempts:
-                time.sleep((base_backoff ** attempt) + (random.random() * 0.2))
+                time.sleep(_full_jitter(attempt, base_backoff))
                 continue
             raise
         except Exception as e:
@@ -237,6 +379,14 @@ def _post_json(session: requests.Session, url: str, payload: dict, extra_headers
     raise last_error if last_error else RuntimeError("Unknown HTTP error")
 
 
+def _resp_json(resp: requests.Response):
+    """Antwort-Body als JSON (bytes direkt, ohne Text-Dekodierung); Fallback über resp.text."""
+    try:
+        return _json_loads(resp.content)
+    except Exception:
+        return json.loads(resp.text)
+
+
 # -------------------- Bullseye-specific fetches --------------------
 
 def _warm_up(session: requests.Session, seg_id: str | int):
@@ -248,6 +398,20 @@ def _warm_up(session: requests.Session, seg_id: str | int):
         pass
 
 
+# Sessions, die schon einmal aufgewärmt wurden (Worker-Sessions leben pro Thread über viele Segmente)
+_warmed_sessions = weakref.WeakSet()
+_warmed_lock = threading.Lock()
+
+
+def _warm_up_once(session: requests.Session, seg_id: str | int):
+    """Warm-up nur beim ersten Segment einer Session; bei 401/403 wird weiterhin gezielt _warm_up genutzt."""
+    with _warmed_lock:
+        if session in _warmed_sessions:
+            return
+        _warmed_sessions.add(session)
+    _warm_up(session, seg_id)
+
+
 def _fetch_latest_version(session: requests.Session, seg_id: str | int, tz_offset_hours: int,
                           timeout=(5, 30), max_attempts=4):
     payload = {"id": int(seg_id), "timeZoneOffset": int(tz_offset_hours)}
@@ -336,13 +500,13 @@ def _build_create_payload_from_source(qj: dict,
         "listeners": {"change": [None]},  # wie im cURL-Beispiel
         "notFound": False,
         "queryString": query_string,
-        "realtime": bool(realtime),
-        "asap": bool(asap),
-        "website": bool(website),
-        "email": bool(email_flag),
+        "realtime": realtime,
+        "asap": asap,
+        "website": website,
+        "email": email_flag,
         "name": new_name,
 
-        "secured": bool(secured),
+        "secured": secured,
         "notifyLevel": notify_level,
         "ccemails": [],
         "basic": basic,  # komplette Include/Exclude-Struktur übernehmen
@@ -353,7 +517,7 @@ def _build_create_payload_from_source(qj: dict,
         "usageCategory": usage_category,
         "alarms": qj.get("alarms", []),
         "asapUnsafe": bool(qj.get("asapUnsafe", False)),
-        "confidential": bool(confidential),
+        "confidential": confidential,
         "source": "QUERY",
         "publish": publish,
         "destination": destination,         # "e"
@@ -387,13 +551,16 @@ def _clone_one_segment(session: requests.Session,
                        override_name: str | None = None,
                        timeout=(5, 30),
                        max_attempts=4,
-                       owner_alias: str | None = None):
+                       owner_alias: str | None = None,
+                       side_pool: ThreadPoolExecutor | None = None):
 
 
     """
     Gibt (row_dict, meta_dict) zurück.
     row_dict: pro erfolgreichem Clone ein Datensatz (u.a. new_be_id, name, market, owner...)
     meta_dict: HTTP/Versuchs-Infos zur Fehlersuche
+    side_pool: optionaler Pool für Neben-Requests (loadSegment der Quelle parallel zu loadQuery);
+               ohne Pool wird loadSegment synchron geholt
     """
     meta = {
         "source_be_id": str(seg_id),
@@ -428,8 +595,8 @@ def _clone_one_segment(session: requests.Session,
         "created_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
     }
 
-    # Warm up
-    _warm_up(session, seg_id)
+    # Warm up (einmal pro Session – Verbindung/Cookies bleiben über die Segmente des Threads bestehen)
+    _warm_up_once(session, seg_id)
 
     # 1) Latest-Version holen
     try:
@@ -447,10 +614,7 @@ def _clone_one_segment(session: requests.Session,
     latest_version = None
     latest_published = None
     if resp_latest.ok:
-        try:
-            lj = resp_latest.json()
-        except Exception:
-            lj = json.loads(resp_latest.text)
+        lj = _resp_json(resp_latest)
         latest_version = lj.get("version")
         latest_published = lj.get("published")
 
@@ -464,10 +628,7 @@ def _clone_one_segment(session: requests.Session,
                 resp_v = _fetch_versions(session, seg_id, tz_offset_hours, timeout=timeout, max_attempts=max_attempts)
                 meta["http_versions"] = resp_v.status_code
             if resp_v.ok:
-                try:
-                    jv = resp_v.json()
-                except Exception:
-                    jv = json.loads(resp_v.text)
+                jv = _resp_json(resp_v)
                 versions = (jv.get("versions") or [])
                 if versions:
                     latest_version = max(versions, key=lambda v: int(v.get("version", -1))).get("version")
@@ -485,64 +646,76 @@ def _clone_one_segment(session: requests.Session,
     meta["version"] = int(latest_version)
     meta["published_flag"] = bool(latest_published) if latest_published is not None else None
 
-    # 2) loadQuery der ermittelten Version ziehen (ggf. notFound abfangen)
-    attempts_q = 0
+    # 3b vorgezogen: loadSegment (Quelle) braucht nur seg_id → läuft parallel zu loadQuery
+    seg_future = None
+    if side_pool is not None:
+        seg_future = side_pool.submit(
+            _fetch_segment, session, seg_id, tz_offset_hours, timeout=timeout, max_attempts=max_attempts
+        )
+
     try:
-        attempts_q += 1
-        resp_q = _fetch_query(session, seg_id, latest_version, tz_offset_hours, timeout=timeout, max_attempts=max_attempts)
-        meta["http_query"] = resp_q.status_code
-        if resp_q.status_code in (401, 403):
-            _warm_up(session, seg_id)
+        # 2) loadQuery der ermittelten Version ziehen (ggf. notFound abfangen)
+        attempts_q = 0
+        try:
             attempts_q += 1
             resp_q = _fetch_query(session, seg_id, latest_version, tz_offset_hours, timeout=timeout, max_attempts=max_attempts)
             meta["http_query"] = resp_q.status_code
-    except Exception as e:
-        meta["status"] = "Error(Query)"
-        meta["attempts_query"] = attempts_q or 1
-        meta["notes"] = f"{meta.get('notes','')}; query_err={type(e).__name__}: {e}"
-        return row, meta
-
-    meta["attempts_query"] = attempts_q
-    if not resp_q.ok:
-        meta["status"] = f"QueryHTTP{resp_q.status_code}"
-        return row, meta
+            if resp_q.status_code in (401, 403):
+                _warm_up(session, seg_id)
+                attempts_q += 1
+                resp_q = _fetch_query(session, seg_id, latest_version, tz_offset_hours, timeout=timeout, max_attempts=max_attempts)
+                meta["http_query"] = resp_q.status_code
+        except Exception as e:
+            meta["status"] = "Error(Query)"
+            meta["attempts_query"] = attempts_q or 1
+            meta["notes"] = f"{meta.get('notes','')}; query_err={type(e).__name__}: {e}"
+            return row, meta
 
-    try:
-        qj = resp_q.json()
-    except Exception:
-        qj = json.loads(resp_q.text)
+        meta["attempts_query"] = attempts_q
+        if not resp_q.ok:
+            meta["status"] = f"QueryHTTP{resp_q.status_code}"
+            return row, meta
 
-    if qj.get("notFound") is True:
-        meta["status"] = "QueryNotFound"
-        return row, meta
+        qj = _resp_json(resp_q)
 
-    # 3) Namen aus Quelle oder Override (bestehender Code)
-    source_name = qj.get("name") or f"BE_{seg_id}"
-    chosen_name = (override_name.strip() if isinstance(override_name, str) and override_name.strip() else f"{source_name} Clone")
-    row["source_name"] = source_name
-    row["new_name"] = chosen_name
-    row["marketplace_id"] = (qj.get("basic", {}) or {}).get("marketplaceId")
+        if qj.get("notFound") is True:
+            meta["status"] = "QueryNotFound"
+            return row, meta
 
-    # 3b) Zusatz: loadSegment (Quelle) → owner/createdBy sicher auslesen
-    seg_owner_email = None
-    seg_owner_obj = None
-    seg_created_by = None
-    try:
-        resp_seg = _fetch_segment(session, seg_id, tz_offset_hours, timeout=timeout, max_attempts=max_attempts)
-        # optional für Meta:
-        # meta["http_load_segment_src"] = resp_seg.status_code
-        if resp_seg.ok:
-            try:
-                sj = resp_seg.json()
-            except Exception:
-                sj = json.loads(resp_seg.text)
-            seg = sj.get("segment") or {}
-            seg_owner_email = seg.get("ownerEmail")
-            seg_owner_obj = seg.get("owner")
-            seg_created_by = seg.get("createdBy")
-    except Exception as e:
-        # wir brechen nicht ab – wir haben noch den Fallback aus qj
-        pass
+        # 3) Namen aus Quelle oder Override (bestehender Code)
+        source_name = qj.get("name") or f"BE_{seg_id}"
+        chosen_name = (override_name.strip() if isinstance(override_name, str) and override_name.strip() else f"{source_name} Clone")
+        row["source_name"] = source_name
+        row["new_name"] = chosen_name
+        row["marketplace_id"] = (qj.get("basic", {}) or {}).get("marketplaceId")
+
+        # 3b) Zusatz: loadSegment (Quelle) → owner/createdBy sicher auslesen
+        seg_owner_email = None
+        seg_owner_obj = None
+        seg_created_by = None
+        try:
+            if seg_future is not None:
+                resp_seg = seg_future.result()  # oben parallel zu loadQuery gestartet
+            else:
+                resp_seg = _fetch_segment(session, seg_id, tz_offset_hours, timeout=timeout, max_attempts=max_attempts)
+            if resp_seg.status_code in (401, 403):
+                _warm_up(session, seg_id)
+                resp_seg = _fetch_segment(session, seg_id, tz_offset_hours, timeout=timeout, max_attempts=max_attempts)
+            # optional für Meta:
+            # meta["http_load_segment_src"] = resp_seg.status_code
+            if resp_seg.ok:
+                sj = _resp_json(resp_seg)
+                seg = sj.get("segment") or {}
+                seg_owner_email = seg.get("ownerEmail")
+                seg_owner_obj = seg.get("owner")
+                seg_created_by = seg.get("createdBy")
+        except Exception as e:
+            # wir brechen nicht ab – wir haben noch den Fallback aus qj
+            pass
+    finally:
+        # bei frühem Return nicht mehr benötigt: abbrechen bzw. auf den laufenden Request warten
+        if seg_future is not None and not seg_future.cancel():
+            seg_future.exception()
 
     # diese Infos in den Output aufnehmen (nur Reporting)
     row["source_owner_email"] = seg_owner_email
@@ -594,10 +767,7 @@ def _clone_one_segment(session: requests.Session,
         return row, meta
 
     # 6) Ergebnis interpretieren
-    try:
-        cj = resp_c.json()
-    except Exception:
-        cj = json.loads(resp_c.text)
+    cj = _resp_json(resp_c)
 
     new_id = cj.get("id") or cj.get("segmentId") or cj.get("newId")
     row["new_be_id"] = str(new_id) if new_id is not None else None
@@ -610,10 +780,7 @@ def _clone_one_segment(session: requests.Session,
         if new_id:
             resp_new = _fetch_segment(session, new_id, tz_offset_hours, timeout=timeout, max_attempts=max_attempts)
             if resp_new.ok:
-                try:
-                    sj_new = resp_new.json()
-                except Exception:
-                    sj_new = json.loads(resp_new.text)
+                sj_new = _resp_json(resp_new)
                 seg_new = (sj_new.get("segment") or {})
                 row["owner_email"] = seg_new.get("ownerEmail")
                 row["owner_name"]  = (seg_new.get("owner") or {}).get("name")
@@ -635,12 +802,18 @@ def clone_and_publish_segments(be_ids=None,
                                progress_callback=None,
                                headless=True,
                                max_workers=None,
-                               owner_alias: str | None = None):
+                               owner_alias: str | None = None,
+                               dedupe: bool = True,
+                               total_callback=None):
 
     """
     Klont mehrere Segmente parallel.
     - Bevorzugt 'pairs' = [(be_id, desired_name), ...] → Name wird GENAU so verwendet.
     - Fallback: wenn nur 'be_ids' gegeben sind, wird new_name = source_name + ' Clone'.
+    - dedupe=False: doppelte (BE-ID, Name)-Paare werden bewusst mehrfach geklont (Mass-Clone);
+      nicht-numerische IDs werden immer aussortiert.
+    - total_callback(n): Anzahl der tatsächlich geklonten Paare (nach dem Aussortieren) –
+      Gesamtwert für progress_callback.
     Rückgabe: DataFrame (Ergebnis), Dateiname
     """
     # Eingaben normalisieren
@@ -663,6 +836,29 @@ def clone_and_publish_segments(be_ids=None,
             status_callback("No BE IDs provided.")
         return None
 
+    # Vor dem Pool aussortieren: nicht-numerische IDs und (mit dedupe) doppelte (BE-ID, Name)-Paare
+    # (sonst je Eintrag eine komplette Clone-Pipeline); landen trotzdem im Excel-Report
+    skipped: list[tuple[str, str | None, str]] = []  # (be_id, desired_name, status)
+    seen = set()
+    unique_pairs = []
+    for pair in id_name_pairs:
+        if not pair[0].isdigit():
+            skipped.append((*pair, "InvalidId"))
+        elif dedupe and pair in seen:
+            skipped.append((*pair, "Duplicate"))
+        else:
+            seen.add(pair)
+            unique_pairs.append(pair)
+    id_name_pairs = unique_pairs
+    if skipped and status_callback:
+        status_callback(f"Skipping {len(skipped)} invalid/duplicate BE ID(s).")
+    if not id_name_pairs:
+        if status_callback:
+            status_callback("No valid BE IDs provided.")
+        return None
+    if total_callback:
+        total_callback(len(id_name_pairs))
+
     start_time = time.time()
     performance_monitor = PerformanceMonitor()
 
@@ -676,7 +872,10 @@ def clone_and_publish_segments(be_ids=None,
         return None
 
     base_session = _build_http_session(profile_path)
+    _bullseye_throttle.reset()  # Drossel-Zustand nicht aus einem früheren Lauf übernehmen
+    # einmal pro Batch: Zeitzonen-Offset und Owner-Alias (nicht pro Segment neu ermitteln)
     tz_offset = _current_tz_offset_hours()
+    owner_alias = _resolve_profile_alias(owner_alias)
 
     # Preflight/Auth
     try:
@@ -696,93 +895,109 @@ def clone_and_publish_segments(be_ids=None,
             status_callback(f"Preflight error: {str(e)}")
 
     if max_workers is None:
-        max_workers = min(4, max(1, len(id_name_pairs)))  # vorsichtig parallelisieren
+        max_workers = min(CLONE_MAX_WORKERS, max(1, len(id_name_pairs)))
 
     if status_callback:
         status_callback(f"Cloning {len(id_name_pairs)} segment(s) (workers={max_workers})")
 
     results = []
     meta_rows = []
+    for seg_id, desired_name, status in skipped:
+        results.append({
+            "source_be_id": seg_id,
+            "new_name": desired_name or None,
+            "destination": "e",
+            "usage_category": "OTHER",
+        })
+        meta_rows.append({
+            "source_be_id": seg_id,
+            "status": status,
+            "success": False,
+            "notes": "skipped before cloning",
+        })
 
     t_batch_start = time.time()
 
-    def make_worker_session() -> requests.Session:
-        s = requests.Session()
-        s.headers.update(base_session.headers.copy())
-        jar = requests.cookies.RequestsCookieJar()
-        for c in base_session.cookies:
-            jar.set(c.name, c.value, domain=c.domain, path=c.path, secure=c.secure)
-        s.cookies = jar
-        return s
+    # Cookie-Snapshot einmal nach dem Preflight (ggf. Selenium-Refresh), Worker bauen nur Jars daraus
+    cookie_rows = _cookie_rows_from_jar(base_session.cookies)
+    get_session, worker_sessions = _thread_sessions(base_session, cookie_rows, max_workers)
+
+    def clone_task(seg_id, desired_name):
+        # Session erst im Pool-Thread auflösen (pro Thread eine)
+        return _clone_one_segment(
+            get_session(), seg_id, tz_offset,
+            "e", "OTHER", True, desired_name,  # destination, usage_category, publish_now, override_name
+            (5, 30), 4,
+            owner_alias, side_pool
+        )
 
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {}
-        for idx, (seg_id, desired_name) in enumerate(id_name_pairs):
-            sess = make_worker_session()
-            fut = executor.submit(
-                _clone_one_segment,
-                sess, seg_id, tz_offset,
-                "e", "OTHER", True, desired_name,  # destination, usage_category, publish_now, override_name
-                (5, 30), 4,
-                owner_alias    
-            )
-            futures[fut] = (idx, seg_id, desired_name)
+    try:
+        # Neben-Pool (loadSegment der Quelle) lebt nur für diesen Lauf und wird danach sauber beendet
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="clone-side") as side_pool, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for idx, (seg_id, desired_name) in enumerate(id_name_pairs):
+                fut = executor.submit(clone_task, seg_id, desired_name)
+                futures[fut] = (idx, seg_id, desired_name)
         
-        done_count = 0
-        for fut in as_completed(futures):
-            idx, seg_id, desired_name = futures[fut]
-            t0 = time.time()
-            try:
-                row, meta = fut.result()
-            except Exception as e:
-                row = {
-                    "source_be_id": str(seg_id),
-                    "source_version": None,
-                    "source_name": None,
-                    "new_be_id": None,
-                    "new_name": desired_name or None,
-                    "marketplace_id": None,
-                    "owner_email": None,
-                    "published": None,
-                    "destination": "e",
-                    "usage_category": "OTHER",
-                    "created_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                }
-                meta = {
-                    "source_be_id": str(seg_id),
-                    "http_latest": None,
-                    "http_versions": None,
-                    "http_query": None,
-                    "http_create": None,
-                    "attempts_query": 0,
-                    "attempts_create": 0,
-                    "version": None,
-                    "published_flag": None,
-                    "status": "Exception",
-                    "success": False,
-                    "notes": f"{type(e).__name__}: {e}",
-                    "referer_used": None,
-                }
-
-            results.append(row)
-            meta_rows.append(meta)
+            done_count = 0
+            for fut in as_completed(futures):
+                idx, seg_id, desired_name = futures[fut]
+                t0 = time.time()
+                try:
+                    row, meta = fut.result()
+                except Exception as e:
+                    row = {
+                        "source_be_id": str(seg_id),
+                        "source_version": None,
+                        "source_name": None,
+                        "new_be_id": None,
+                        "new_name": desired_name or None,
+                        "marketplace_id": None,
+                        "owner_email": None,
+                        "published": None,
+                        "destination": "e",
+                        "usage_category": "OTHER",
+                        "created_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    }
+                    meta = {
+                        "source_be_id": str(seg_id),
+                        "http_latest": None,
+                        "http_versions": None,
+                        "http_query": None,
+                        "http_create": None,
+                        "attempts_query": 0,
+                        "attempts_create": 0,
+                        "version": None,
+                        "published_flag": None,
+                        "status": "Exception",
+                        "success": False,
+                        "notes": f"{type(e).__name__}: {e}",
+                        "referer_used": None,
+                    }
+
+                results.append(row)
+                meta_rows.append(meta)
 
-            if status_callback:
-                if meta.get("success"):
-                    status_callback(f"[{seg_id}] OK → new_id={row.get('new_be_id')} name='{row.get('new_name')}'")
-                else:
-                    status_callback(f"[{seg_id}] {meta.get('status')} — {meta.get('notes','')}")
-
-            done_count += 1
-            if progress_callback:
-                progress_callback(done_count - 1)
-
-            performance_monitor.add_segment_result(
-                f"{seg_id}#{idx}",
-                time.time() - t0,
-                (meta.get("attempts_query", 0) + meta.get("attempts_create", 0)) or 1,
-                bool(meta.get("success"))
-            )
+                if status_callback:
+                    if meta.get("success"):
+                        status_callback(f"[{seg_id}] OK → new_id={row.get('new_be_id')} name='{row.get('new_name')}'")
+                    else:
+                        status_callback(f"[{seg_id}] {meta.get('status')} — {meta.get('notes','')}")
+
+                done_count += 1
+                if progress_callback:
+                    progress_callback(done_count - 1)
+
+                performance_monitor.add_segment_result(
+                    f"{seg_id}#{idx}",
+                    time.time() - t0,
+                    (meta.get("attempts_query", 0) + meta.get("attempts_create", 0)) or 1,
+                    bool(meta.get("success"))
+                )
+    finally:
+        for s in worker_sessions:
+            s.close()
 
     performance_monitor.add_batch_time(len(id_name_pairs), time.time() - t_batch_start)
 
@@ -874,7 +1089,8 @@ def mass_clone_fixed(names: list[str],
         progress_callback=progress_callback,
         headless=headless,
         max_workers=(max_workers if max_workers is not None else min(6, max(1, len(pairs)))),
-        owner_alias=owner_alias             
+        owner_alias=owner_alias,
+        dedupe=False,  # gleiche Namen sind hier gewollte Mehrfach-Clones
     )
 
 
@@ -1072,7 +1288,6 @@ def _replace_hygiene_in_querystring(
     if not target_hygiene or not old_hygiene_ids:
         return qs, 0
 
-    import re
     old_set = {str(x) for x in old_hygiene_ids}
 
     pat = re.compile(r'(segment\(\s*)(\d+)(\s*\))', re.IGNORECASE)
@@ -1089,7 +1304,6 @@ def _replace_hygiene_in_querystring(
     return pat.sub(repl, qs), replaced
 
 def _replace_marketplace_in_querystring(qs: str, src_mp: int, dst_mp: int) -> tuple[str, int]:
-    import re
     # erlaubt: marketplaceId = 4, marketplaceId==4, marketplaceId = '4', marketplaceId=="4"
     pat = re.compile(r'(\bmarketplaceId\s*[=]{1,2}\s*)(["\']?)(\d+)(\2)')
     replaced = 0
@@ -1220,10 +1434,7 @@ def _clone_to_market_variation(session, base_seg_id, latest_version, base_qj, ta
         if not resp_c.ok:
             meta["status"] = f"CreateHTTP{resp_c.status_code}"
             return row, meta
-        try:
-            cj = resp_c.json()
-        except Exception:
-            cj = json.loads(resp_c.text)
+        cj = _resp_json(resp_c)
         new_id = cj.get("id") or cj.get("segmentId") or cj.get("newId")
         row["new_be_id"] = str(new_id) if new_id is not None else None
         row["published"] = True
@@ -1234,10 +1445,7 @@ def _clone_to_market_variation(session, base_seg_id, latest_version, base_qj, ta
            if new_id:
                resp_new = _fetch_segment(session, new_id, tz_offset_hours, timeout=(5, 30), max_attempts=4)
                if resp_new.ok:
-                   try:
-                       sj_new = resp_new.json()
-                   except Exception:
-                       sj_new = json.loads(resp_new.text)
+                   sj_new = _resp_json(resp_new)
                    seg_new = (sj_new.get("segment") or {})
                    row["owner_email"] = seg_new.get("ownerEmail")
                    row["owner_name"]  = (seg_new.get("owner") or {}).get("name")
@@ -1281,6 +1489,7 @@ def clone_across_marketplaces(
         return None
 
     base_session = _build_http_session(profile_path)
+    _bullseye_throttle.reset()  # Drossel-Zustand nicht aus einem früheren Lauf übernehmen
     tz_offset = _current_tz_offset_hours()
 
     # Auth/Warm-up
@@ -1307,7 +1516,7 @@ def clone_across_marketplaces(
         if status_callback:
             status_callback(f"loadLatestQueryVersion failed: HTTP {resp_latest.status_code}")
         return None
-    latest = resp_latest.json()
+    latest = _resp_json(resp_latest)
     latest_version = latest.get("version")
     if latest_version is None:
         if status_callback:
@@ -1321,7 +1530,7 @@ def clone_across_marketplaces(
         if status_callback:
             status_callback(f"loadQuery failed: HTTP {resp_q.status_code}")
         return None
-    qj = resp_q.json()
+    qj = _resp_json(resp_q)
     if qj.get("notFound"):
         if status_callback:
             status_callback("Query not found in loadQuery.")
@@ -1334,10 +1543,7 @@ def clone_across_marketplaces(
     try:
        resp_seg = _fetch_segment(base_session, src_id, tz_offset, timeout=(5, 30), max_attempts=4)
        if resp_seg.ok:
-            try:
-               sj = resp_seg.json()
-            except Exception:
-                sj = json.loads(resp_seg.text)
+            sj = _resp_json(resp_seg)
             seg = (sj.get("segment") or {})
             source_name = seg.get("name")
             seg_owner_email = seg.get("ownerEmail")
@@ -1369,67 +1575,67 @@ def clone_across_marketplaces(
             + f" (workers={max_workers})"
         )
 
-    def make_worker_session() -> requests.Session:
-        s = requests.Session()
-        s.headers.update(base_session.headers.copy())
-        jar = requests.cookies.RequestsCookieJar()
-        for c in base_session.cookies:
-            jar.set(c.name, c.value, domain=c.domain, path=c.path, secure=c.secure)
-        s.cookies = jar
-        return s
+    # Cookie-Snapshot einmal nach dem Preflight (ggf. Selenium-Refresh), Worker bauen nur Jars daraus
+    cookie_rows = _cookie_rows_from_jar(base_session.cookies)
+    get_session, worker_sessions = _thread_sessions(base_session, cookie_rows, max_workers)
+
+    def clone_task(dst_mp):
+        # Session erst im Pool-Thread auflösen (pro Thread eine)
+        return _clone_to_market_variation(
+            get_session(), src_id, int(latest_version), qj, int(dst_mp), tz_offset,
+            status_callback=status_callback,
+            source_owner_obj=seg_owner_obj,          # ← hier das ursprüngliche Team reingeben
+            base_name=source_name
+        )
 
     results = []
     meta_rows = []
     t_batch_start = time.time()
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futs = {}
-        for idx, dst_mp in enumerate(target_markets):
-            sess = make_worker_session()
-            fut = ex.submit(
-                _clone_to_market_variation,
-                sess, src_id, int(latest_version), qj, int(dst_mp), tz_offset,
-                status_callback=status_callback,
-                source_owner_obj=seg_owner_obj,          # ← hier das ursprüngliche Team reingeben
-                 base_name=source_name
-            )
-            futs[fut] = (idx, dst_mp)
-        done_count = 0
-
-        for fut in as_completed(futs):
-            idx, dst_mp = futs[fut]
-            try:
-                row, meta = fut.result()
-            except Exception as e:
-                row = {
-                    "source_be_id": str(src_id),
-                    "source_version": int(latest_version),
-                    "source_name": qj.get("name"),
-                    "new_be_id": None,
-                    "new_name": None,
-                    "marketplace_id": int(dst_mp),
-                    "owner_email": None,
-                    "owner_name": None,
-                    "published": None,
-                    "destination": "e",
-                    "usage_category": "OTHER",
-                    "created_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
-                }
-                meta = {
-                    "source_be_id": str(src_id),
-                    "target_market": int(dst_mp),
-                    "http_create": None,
-                    "status": "Exception",
-                    "success": False,
-                    "notes": f"{type(e).__name__}: {e}",
-                    "referer_used": None,
-                }
-            results.append(row)
-            meta_rows.append(meta)
-            done_count += 1
-            if progress_callback:
-                progress_callback(done_count - 1)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            futs = {}
+            for idx, dst_mp in enumerate(target_markets):
+                fut = ex.submit(clone_task, dst_mp)
+                futs[fut] = (idx, dst_mp)
+            done_count = 0
+
+            for fut in as_completed(futs):
+                idx, dst_mp = futs[fut]
+                try:
+                    row, meta = fut.result()
+                except Exception as e:
+                    row = {
+                        "source_be_id": str(src_id),
+                        "source_version": int(latest_version),
+                        "source_name": qj.get("name"),
+                        "new_be_id": None,
+                        "new_name": None,
+                        "marketplace_id": int(dst_mp),
+                        "owner_email": None,
+                        "owner_name": None,
+                        "published": None,
+                        "destination": "e",
+                        "usage_category": "OTHER",
+                        "created_at": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    }
+                    meta = {
+                        "source_be_id": str(src_id),
+                        "target_market": int(dst_mp),
+                        "http_create": None,
+                        "status": "Exception",
+                        "success": False,
+                        "notes": f"{type(e).__name__}: {e}",
+                        "referer_used": None,
+                    }
+                results.append(row)
+                meta_rows.append(meta)
+                done_count += 1
+                if progress_callback:
+                    progress_callback(done_count - 1)
+    finally:
+        for s in worker_sessions:
+            s.close()
 
     ts = time.strftime("%Y%m%d_%H%M%S")
     out_main = f"clone_cross_market_results_{src_id}_{ts}.xlsx"
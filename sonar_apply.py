@@ -19,6 +19,7 @@ import sqlite3
 import random
 import tempfile
 from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import timedelta, datetime, timezone
 
 import requests
@@ -857,9 +858,6 @@ def apply_segments_to_sonar_pairs(
     progress_callback=None,
     headless: bool = False
 ) -> Optional[pd.DataFrame]:
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-    import threading
-
     MAX_WORKERS = 5
 
     t_all_start = time.time()
@@ -1006,7 +1004,6 @@ def apply_segments_to_sonar_pairs(
         ctx.row["Status"] = "Uploaded"
         return ctx
 
-    from concurrent.futures import ThreadPoolExecutor, as_completed
     uploaded_ctxs: List[_Ctx] = [None]*len(ctxs)
     with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
         futs = {ex.submit(_phase1_worker, c): c.idx for c in ctxs}
@@ -25,6 +25,8 @@ import csv
 import sqlite3
 import tempfile
 import shutil
+import threading
+import uuid
 from typing import Callable, Dict, Any, List, Tuple, Optional
 
 import requests
@@ -149,6 +151,30 @@ def _selenium_refresh_session_cookies(profile_path: str, headless: bool = True):
                 pass
 
 
+# Cookie-Refresh über Threads hinweg: nur EIN Firefox pro Profil (Profil-Lock), die anderen
+# Jobs warten und übernehmen die Cookies des ersten
+_refresh_lock = threading.Lock()
+_refreshed_jar = None
+_refresh_gen = 0
+
+
+def _shared_refresh_cookies(profile_path: str, headless: bool, seen_gen: int):
+    """
+    Frische Cookies für einen 401/403. seen_gen = _refresh_gen vor dem fehlgeschlagenen Request:
+    hat inzwischen ein anderer Thread aufgefrischt, wird dessen Jar (als Kopie) verwendet.
+    """
+    global _refreshed_jar, _refresh_gen
+    with _refresh_lock:
+        if _refresh_gen != seen_gen and _refreshed_jar is not None:
+            return _refreshed_jar.copy()
+        fresh = _selenium_refresh_session_cookies(profile_path, headless=headless)
+        if not fresh:
+            return None
+        _refreshed_jar = fresh
+        _refresh_gen += 1
+        return fresh.copy()
+
+
 # -------------------- HTTP Helpers --------------------
 
 def _safe_parse_json(resp: requests.Response) -> dict:
@@ -192,12 +218,13 @@ def _post_json_with_refresh(session: requests.Session,
                             profile_path: str,
                             headless: bool = True,
                             timeout: Tuple[int, int] = (10, 60)) -> dict:
+    seen_gen = _refresh_gen
     try:
         return _post_json(session, url, payload, timeout=timeout)
     except requests.HTTPError as e:
         status = getattr(e.response, "status_code", None)
         if status in (401, 403):
-            fresh = _selenium_refresh_session_cookies(profile_path, headless=headless)
+            fresh = _shared_refresh_cookies(profile_path, headless, seen_gen)
             if fresh:
                 session.cookies = fresh
                 return _post_json(session, url, payload, timeout=timeout)
@@ -246,9 +273,10 @@ def _build_variables(template_path: str,
 
 # -------------------- Excel helpers (Option A) --------------------
 
+_NON_ALNUM_RE = re.compile(r'[^a-z0-9]+')
+
 def _norm(s: str) -> str:
-    import re as _re
-    return _re.sub(r'[^a-z0-9]+', '', (s or '').strip().lower())
+    return _NON_ALNUM_RE.sub('', (s or '').strip().lower())
 
 _CAMPAIGN_HEADERS = {
     "sonarlink", "sonar", "campaign", "campaignurl", "campaignlink", "campaignid"
@@ -260,42 +288,46 @@ _CAMPAIGN_HEADERS = {
 def _read_xlsx_rows(path: str) -> List[Dict[str, Any]]:
     """Liest .xlsx in Liste von Dicts (Keys = originale Header)."""
     rows: List[Dict[str, Any]] = []
-    # 1) pandas
-    try:
-        import pandas as pd
-        df = pd.read_excel(path)
-        for _, r in df.iterrows():
-            d = {}
-            for k, v in r.to_dict().items():
-                key = str(k) if k is not None else ""
-                if hasattr(pd, "isna") and pd.isna(v):
-                    d[key] = ""
-                else:
-                    d[key] = v
-            rows.append(d)
-        return rows
-    except Exception:
-        pass
-    # 2) openpyxl
+    # 1) openpyxl read-only/values_only: streamt Wert-Tupel, keine Cell-Objekte, kein DataFrame
     try:
         from openpyxl import load_workbook
         wb = load_workbook(filename=path, read_only=True, data_only=True)
-        ws = wb.active
-        headers: List[str] = []
-        for i, row in enumerate(ws.iter_rows(values_only=True)):
-            if i == 0:
-                headers = [str(c) if c is not None else "" for c in row]
-                continue
-            d: Dict[str, Any] = {}
-            for j, val in enumerate(row):
-                key = headers[j] if j < len(headers) else f"col{j+1}"
-                d[key] = "" if val is None else val
-            rows.append(d)
-        wb.close()
+        try:
+            # erstes Sheet wie pd.read_excel im Fallback – nicht das beim Speichern aktive
+            ws = wb.worksheets[0]
+            # gemeldete Sheet-Dimension ignorieren (sonst Phantom-Zeilen bis max_row)
+            if hasattr(ws, "reset_dimensions"):
+                ws.reset_dimensions()
+            it = ws.iter_rows(values_only=True)
+            headers: List[str] = [str(c) if c is not None else "" for c in next(it, ())]
+            for row in it:
+                if all(v is None or v == "" for v in row):
+                    continue
+                # breitere Zeile: fehlende Header als colK ergänzen
+                if len(row) > len(headers):
+                    headers.extend(f"col{j+1}" for j in range(len(headers), len(row)))
+                rows.append(dict(zip(headers, ["" if v is None else v for v in row])))
+        finally:
+            wb.close()
+        return rows
+    except Exception as e:
+        # fehlendes openpyxl oder Datei, die openpyxl nicht lesen kann → pandas versuchen
+        first_err = e
+        rows = []
+    # 2) pandas
+    try:
+        import pandas as pd
+        df = pd.read_excel(path)
+        # NaN → "" vektorisiert (kein pd.isna pro Zelle); Spalten werden dabei zu object
+        df = df.astype(object).where(df.notna(), "")
+        # Header einmal; itertuples statt iterrows (keine Series pro Zeile)
+        cols = [str(k) if k is not None else "" for k in df.columns]
+        for values in df.itertuples(index=False, name=None):
+            rows.append(dict(zip(cols, values)))
         return rows
     except Exception as e:
         raise RuntimeError(
-            f"Could not read Excel. Please install 'pandas' or 'openpyxl'.\n\n{e}"
+            f"Could not read Excel. Please install 'openpyxl' or 'pandas'.\n\n{first_err}\n{e}"
         )
 
 
@@ -329,19 +361,19 @@ def parse_update_excel(path: str) -> List[Dict[str, Any]]:
             "No campaign column found. Please use 'Sonar Link' (or Campaign/Campaign URL/Campaign ID/Sonar)."
         )
 
+    # Spaltenplan einmal pro Sheet: Kampagnen-Header + (Header, Variablenname) der übrigen Spalten
+    camp_hdr = headers[campaign_idx]
+    var_cols = [(h, str(h).strip()) for i, h in enumerate(headers) if i != campaign_idx]
+
     out: List[Dict[str, Any]] = []
     for row in rows:
-        values = [row.get(h, "") for h in headers]
-        camp_val = values[campaign_idx]
+        camp_val = row.get(camp_hdr, "")
         if camp_val is None or str(camp_val).strip() == "":
             raise ValueError("Row without campaign value (Sonar Link / Campaign / Campaign ID).")
 
         vars_map: Dict[str, Any] = {}
-        for i, h in enumerate(headers):
-            if i == campaign_idx:
-                continue
-            col_name = str(h).strip()
-            val = values[i]
+        for h, col_name in var_cols:
+            val = row.get(h, "")
             if val is None:
                 continue
             sval = str(val).strip()
@@ -464,8 +496,9 @@ def run_update_campaign_content(
     # 5) Logdatei schreiben (Request/Response)
     out_path: Optional[str] = None
     try:
-        ts = time.strftime("%Y%m%d_%H%M%S")
-        out_path = os.path.abspath(f"updateContent_{cid}_{ts}.json")
+        # ms + Kurz-uuid: parallele Jobs derselben Kampagne überschreiben sich nicht
+        ts = time.strftime("%Y%m%d_%H%M%S") + f"_{int(time.time() * 1000) % 1000:03d}"
+        out_path = os.path.abspath(f"updateContent_{cid}_{ts}_{uuid.uuid4().hex[:6]}.json")
         with open(out_path, "w", encoding="utf-8") as f:
             json.dump({"request": payload, "response": resp}, f, ensure_ascii=False, indent=2)
 